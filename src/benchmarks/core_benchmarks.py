@@ -0,0 +1,277 @@
+"""
+Micro-benchmarks of the core hot paths, with a regression check against a JSON baseline.
+
+Run as a script to measure and compare, or save a new baseline:
+
+    python -m src.benchmarks.core_benchmarks --save
+    python -m src.benchmarks.core_benchmarks --threshold 0.25
+
+Or through pytest, which fails on regressions and skips when there is no baseline:
+
+    pytest src/benchmarks/core_benchmarks.py
+
+Timings depend on the machine, so the baseline is meant to be saved on the machine running
+the comparison.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+
+from src.core.board import Board
+from src.core.cards.build_deck import build_deck
+from src.core.cards.card_template import get_card_template
+from src.core.cards.deck import Deck
+from src.core.cards.roles import get_random_roles
+from src.core.player import Player
+from src.core.policies import greedy_policy, play_move
+from src.core.round import Round
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+# Pure Python loop measuring the speed of the machine, other results are compared relatively
+# to it so that a baseline stays meaningful when the machine is slowed down by other loads
+CALIBRATION = "calibration"
+PLAYER_NAMES = ["Alice", "Bob", "Charlie", "Dave", "Eve", "Frank"]
+
+
+class Benchmark(NamedTuple):
+    """A timed operation: setup is not timed, run returns the number of operations done."""
+
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], int]
+
+
+def _recorded_placements(seed: int = 1) -> tuple[int, list[tuple[Any, int, int, bool]]]:
+    """Plays a round with the greedy policy and records its placements.
+
+    Returns:
+        tuple: The seed of the board and the (card, row, column, flipped) placements.
+    """
+    players = [Player(name, None, [], []) for name in PLAYER_NAMES]
+    game_round = Round(players, seed=seed)
+    placements = []
+    while not game_round.is_over:
+        move = greedy_policy(game_round)
+        play_move(game_round, move)
+        if not move.is_action and not move.is_discard:
+            placements.append((move.card, move.row, move.column, move.flipped))
+    # Positions are relative to the board at the time of the move, cards are left flipped
+    return seed, placements
+
+
+def _fresh_board(seed: int) -> Board:
+    """Returns a board identical to the initial board of a round with the given seed.
+    The board is the first thing a round draws from its generator."""
+    return Board(Random(seed))
+
+
+def _replay(board: Board, placements: list[tuple[Any, int, int, bool]]) -> None:
+    """Places the recorded cards on a board, revealing the goals like the round did.
+    The recorded cards are already in their played orientation."""
+    for card, row, column, _ in placements:
+        board.place_card(row, column, card)
+        for goal_row, goal_column in board.reached_goals:
+            board.reveal_goal(goal_row, goal_column)
+
+
+def _benchmarks() -> list[Benchmark]:
+    """Lists the benchmarks of the core hot paths."""
+    seed, placements = _recorded_placements()
+    full_board = _fresh_board(seed)
+    _replay(full_board, placements)
+    # Cards of their own, the placed cards being part of the board
+    hand = [get_card_template(card).create() for card, _, _, _ in placements[:6]]
+    players = [Player(name, None, [], []) for name in PLAYER_NAMES]
+
+    def place_cards(boards: list[Board]) -> int:
+        for board in boards:
+            _replay(board, placements)
+        return len(boards) * len(placements)
+
+    def check_connections(board: Board) -> int:
+        checks = 0
+        open_ends = board.open_ends
+        for _ in range(200):
+            for row, column in open_ends:
+                for card in hand:
+                    board.check_adjacent_connections(row, column, card)
+                    checks += 1
+        return checks
+
+    def legal_moves(board: Board) -> int:
+        for _ in range(200):
+            board.legal_moves(hand)
+        return 200
+
+    def push_pop_moves(board: Board) -> int:
+        moves = board.legal_moves(hand)
+        for _ in range(20):
+            for card, row, column, flipped in moves:
+                board.push_move(row, column, card, flipped=flipped)
+                board.pop_move()
+        return 20 * len(moves)
+
+    def build_decks(_: None) -> int:
+        for _ in range(100):
+            build_deck()
+        return 100
+
+    def draw_cards(decks: list[Deck]) -> int:
+        player = Player("Alice", None, [], [])
+        draws = 0
+        for deck in decks:
+            while len(deck) > 0:
+                player.draw(deck)
+                draws += 1
+            player.empty_hand()
+        return draws
+
+    def start_rounds(_: None) -> int:
+        for round_seed in range(100):
+            Round(players, seed=round_seed)
+        return 100
+
+    def draw_roles(rng: Random) -> int:
+        for _ in range(1000):
+            get_random_roles(len(PLAYER_NAMES), rng)
+        return 1000
+
+    def copy_rounds(game_round: Round) -> int:
+        for _ in range(200):
+            game_round.copy()
+        return 200
+
+    def determinize_rounds(game_round: Round) -> int:
+        rng = Random(0)
+        observer = game_round.current_player
+        for _ in range(200):
+            game_round.determinize(observer, rng)
+        return 200
+
+    def calibrate(_: None) -> int:
+        total = 0
+        for value in range(100_000):
+            total += value % 7
+        return 100_000
+
+    return [
+        Benchmark(CALIBRATION, lambda: None, calibrate),
+        Benchmark("board_place_card", lambda: [_fresh_board(seed) for _ in range(50)], place_cards),
+        Benchmark("check_adjacent_connections", lambda: full_board, check_connections),
+        Benchmark("board_legal_moves", lambda: full_board, legal_moves),
+        Benchmark("board_push_pop_move", lambda: full_board, push_pop_moves),
+        Benchmark("build_deck", lambda: None, build_decks),
+        Benchmark(
+            "player_draw",
+            lambda: [Deck.build(rng=Random(index)) for index in range(200)],
+            draw_cards,
+        ),
+        Benchmark("round_init", lambda: None, start_rounds),
+        Benchmark("get_random_roles", lambda: Random(0), draw_roles),
+        Benchmark("round_copy", lambda: Round(players, seed=seed), copy_rounds),
+        Benchmark("round_determinize", lambda: Round(players, seed=seed), determinize_rounds),
+    ]
+
+
+def run_benchmarks(repeat: int = 5) -> dict[str, float]:
+    """Runs every benchmark and returns the best time per operation, in seconds."""
+    results = {}
+    for benchmark in _benchmarks():
+        best = float("inf")
+        for _ in range(repeat):
+            state = benchmark.setup()
+            start = perf_counter()
+            operations = benchmark.run(state)
+            best = min(best, (perf_counter() - start) / operations)
+        results[benchmark.name] = best
+    return results
+
+
+def find_regressions(
+    results: dict[str, float], baseline: dict[str, float], threshold: float = DEFAULT_THRESHOLD
+) -> dict[str, float]:
+    """Returns the benchmarks slower than the baseline by more than the threshold.
+
+    Args:
+        results (dict[str, float]): The measured time per operation of each benchmark.
+        baseline (dict[str, float]): The reference time per operation of each benchmark.
+        threshold (float): The accepted slowdown, 0.25 accepting 25% slower operations.
+
+    Returns:
+        dict[str, float]: The relative slowdown of each regressed benchmark.
+    """
+    speed_ratio = 1.0
+    if results.get(CALIBRATION) and baseline.get(CALIBRATION):
+        speed_ratio = results[CALIBRATION] / baseline[CALIBRATION]
+    slowdowns = {
+        name: result / (baseline[name] * speed_ratio) - 1
+        for name, result in results.items()
+        if name in baseline and name != CALIBRATION
+    }
+    return {name: slowdown for name, slowdown in slowdowns.items() if slowdown > threshold}
+
+
+def save_baseline(results: dict[str, float], path: Path = DEFAULT_BASELINE) -> None:
+    """Saves benchmark results as the new baseline."""
+    with path.open("w", encoding="utf-8") as file:
+        json.dump({"python": platform.python_version(), "benchmarks": results}, file, indent=2)
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> dict[str, float] | None:
+    """Loads the baseline results, or returns None if there is no baseline."""
+    if not path.exists():
+        return None
+    with path.open(encoding="utf-8") as file:
+        return json.load(file)["benchmarks"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the benchmarks, then compares them to the baseline or saves them as baseline."""
+    parser = ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="save the results as baseline")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.repeat)
+    baseline = load_baseline(args.baseline) or {}
+    for name, result in results.items():
+        reference = f"  (baseline {baseline[name] * 1e6:10.2f} us)" if name in baseline else ""
+        print(f"{name:28} {result * 1e6:10.2f} us{reference}")
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name, slowdown in regressions.items():
+        print(f"Regression: {name} is {slowdown:.0%} slower than the baseline")
+    return 1 if regressions else 0
+
+
+def test_no_regression() -> None:
+    """Fails if a hot path is slower than the baseline by more than the threshold.
+    The threshold can be set with the SABOOTERS_BENCHMARK_THRESHOLD environment variable."""
+    import pytest  # noqa: PLC0415  # only needed when run by pytest
+
+    baseline = load_baseline()
+    if baseline is None:
+        pytest.skip(f"No benchmark baseline, save one with: python -m {__spec__.name} --save")
+    threshold = float(os.environ.get("SABOOTERS_BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD))
+    regressions = find_regressions(run_benchmarks(), baseline, threshold)
+    assert not regressions, f"Benchmarks slower than the baseline: {regressions}"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+This module contains the action log of a game, the append-only record of the inputs which
+drove its state machine.
+
+Since every random choice of a game is drawn from its seed, the seed and the accepted inputs
+are enough to rebuild the game, see Game.replay. A log can be kept in memory or written to a
+file as JSON lines, the first line holding the seed and each other line an input.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class LogEntry(NamedTuple):
+    """An input accepted by a game: its kind and its JSON serializable arguments."""
+
+    kind: str
+    args: tuple[Any, ...]
+
+
+class ActionLog:
+    """Append-only list of the inputs accepted by a game, optionally written to a file."""
+
+    def __init__(self, seed: int, path: str | Path | None = None) -> None:
+        """Initializes an empty ActionLog.
+
+        Args:
+            seed (int): The seed of the logged game.
+            path (str | Path | None): The file where the log is written, None to keep it
+                                      in memory only. An existing file is overwritten.
+        """
+        self.__seed = seed
+        self.__entries: list[LogEntry] = []
+        self.__path = None if path is None else Path(path)
+        if self.__path is not None:
+            with self.__path.open("w", encoding="utf-8") as file:
+                file.write(json.dumps({"seed": seed}) + "\n")
+
+    @classmethod
+    def load(cls, path: str | Path) -> ActionLog:
+        """Loads a log written to a file, further inputs being appended to the same file.
+        A last line left incomplete by a crash is ignored and removed from the file."""
+        path = Path(path)
+        with path.open("r+b") as file:
+            header = json.loads(file.readline())
+            entries = []
+            end = file.tell()
+            for line in file:
+                if not line.endswith(b"\n"):
+                    file.truncate(end)
+                    break
+                kind, *args = json.loads(line)
+                entries.append(LogEntry(kind, tuple(args)))
+                end += len(line)
+        log = cls(header["seed"])
+        log.__entries = entries
+        log.__path = path
+        return log
+
+    def __len__(self) -> int:
+        """Returns the number of logged inputs."""
+        return len(self.__entries)
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        """Iterates over the logged inputs, in the order they were accepted."""
+        return iter(self.__entries)
+
+    def __getitem__(self, index: int) -> LogEntry:
+        """Returns the logged input at the given index."""
+        return self.__entries[index]
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed of the logged game."""
+        return self.__seed
+
+    @property
+    def path(self) -> Path | None:
+        """Returns the file where the log is written, None if it is kept in memory."""
+        return self.__path
+
+    def append(self, kind: str, *args: Any) -> None:  # noqa: ANN401  # JSON values
+        """Appends an accepted input, and writes it to the file of the log if any."""
+        entry = LogEntry(kind, args)
+        self.__entries.append(entry)
+        if self.__path is not None:
+            with self.__path.open("a", encoding="utf-8") as file:
+                file.write(json.dumps([kind, *args]) + "\n")
@@ -4,26 +4,233 @@ This module contains board-related classes and functions.
 
 from __future__ import annotations
 
-from src.core.cards.path_card import PathCard, StartCard, get_3_goal_cards
+from copy import copy
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from src.core.cards.card_template import get_card_template, get_card_templates
+from src.core.cards.path_card import (
+    FLIPPED_SIDES,
+    SIDES,
+    GoalCard,
+    PathCard,
+    StartCard,
+    get_3_goal_cards,
+)
+from src.core.deltas import (
+    BoardExpanded,
+    CardPlaced,
+    CardRemoved,
+    DeltaSource,
+    GoalRevealed,
+    template_id_of,
+)
+from src.core.zobrist import cell_key, window_key
 
-class Board:
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from random import Random
+
+    from src.core.cards.card import Card
+
+# (side index, side bit, row offset, column offset), the facing side index is index ^ 2
+_SIDES = ((0, 0b0001, -1, 0), (1, 0b0010, 0, 1), (2, 0b0100, 1, 0), (3, 0b1000, 0, -1))
+
+# Error message for a connection mismatch, indexed by the bit of the mismatching side
+_MISMATCH_MESSAGES = {
+    1 << index: f"Connection mismatch with {side} card." for index, side in enumerate(SIDES)
+}
+
+# Absolute cells of the start card and of the goal cards, before the board is expanded
+START_CELL = (2, 0)
+GOAL_CELLS = ((0, 6), (2, 6), (4, 6))
+
+
+class _Change(NamedTuple):
+    """A journaled move of the board, with what is needed to revert it."""
+
+    cell: tuple[int, int]
+    # The removed card for a removal, None for a placement
+    removed_card: PathCard | None
+    flipped: bool
+    # Top, left, rows and columns of the board before the move
+    window: tuple[int, int, int, int]
+    # Entries added to the connectivity sets by a placement, or the sets replaced by a removal
+    index: list[tuple[set, Any]] | tuple[set, set, set, set]
+    zobrist: int
+
+
+def _cell_key(cell: tuple[int, int], card: PathCard) -> int:
+    """Returns the Zobrist key of a card on an absolute cell, goal cards by their real name."""
+    if isinstance(card, GoalCard):
+        return cell_key(
+            *cell, card.read_real_name(), flipped=card.is_flipped, visible=card.is_visible
+        )
+    return cell_key(*cell, card.name, flipped=card.is_flipped, visible=True)
+
+
+class Board(DeltaSource):
     """
     Represents the game board, which holds path cards played by players.
+
+    Cards are stored sparsely, keyed by absolute coordinates that never change once a card
+    is placed. The visible grid is a window over these coordinates described by its top-left
+    origin and its size, so expanding the board only moves the window instead of shifting
+    every stored card.
+
+    The board also maintains which paths are connected to the start card, together with the
+    empty cells those paths lead to (the open ends). Placements only extend this index from
+    the new card, so connectivity, reached goals and legal cells never require a traversal
+    of the whole board. Likewise, its Zobrist hash is updated by each change.
     """
 
-    def __init__(self) -> None:
-        """Initializes the board with a grid and places the start and goal cards."""
+    def __init__(self, rng: Random | None = None) -> None:
+        """Initializes the board with a grid and places the start and goal cards.
+
+        Args:
+            rng (Random | None): The random generator used to place the goals, a new one if None.
+        """
+        super().__init__()
         self.__rows = 5
         self.__columns = 7
-        self.__start_position = (2, 0)
-        goal_cards = get_3_goal_cards()
-        self.__grid = list[list[PathCard | None]]()
-        self.__grid = [[None for _ in range(self.__columns)] for _ in range(self.__rows)]
-        self.__grid[self.__start_position[0]][self.__start_position[1]] = StartCard()
-        self.__grid[0][6] = goal_cards[0]
-        self.__grid[2][6] = goal_cards[1]
-        self.__grid[4][6] = goal_cards[2]
+        self.__top = 0
+        self.__left = 0
+        self.__start_cell = START_CELL
+        self.__goal_cells = GOAL_CELLS
+        goal_cards = get_3_goal_cards(rng)
+        self.__cells: dict[tuple[int, int], PathCard] = {self.__start_cell: StartCard()}
+        for goal_cell, goal_card in zip(self.__goal_cells, goal_cards):
+            self.__cells[goal_cell] = goal_card
+
+        # Paths are tracked per (row, column, sides of the path) as crossing cards hold two.
+        self.__reachable = set[tuple[int, int, int]]()
+        self.__connected_cells = set[tuple[int, int]]()
+        self.__open_ends = set[tuple[int, int]]()
+        self.__reached_goals = set[tuple[int, int]]()
+        self.__rebuild_reachability()
+        self.__journal: list[_Change] = []
+        self.__zobrist = self.__compute_zobrist()
+
+    def to_state(self) -> dict[str, Any]:
+        """Exports the board as plain data, cards being identified by their template id.
+
+        Returns:
+            dict[str, Any]: The bounds of the board and its cells, as
+                            [row, column, template id, flipped, visible] lists.
+        """
+        cells = []
+        for (row, column), card in sorted(self.__cells.items()):
+            visible = card.is_visible if isinstance(card, GoalCard) else True
+            template_id = get_card_template(card).template_id
+            cells.append([row, column, template_id, int(card.is_flipped), int(visible)])
+        return {
+            "top": self.__top,
+            "left": self.__left,
+            "rows": self.__rows,
+            "columns": self.__columns,
+            "cells": cells,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> Board:
+        """Restores a board exported by to_state, and rebuilds its connectivity index."""
+        board = cls.__new__(cls)
+        board.__restore(state)  # noqa: SLF001  # same class, the board is not initialized yet
+        return board
+
+    def __restore(self, state: dict[str, Any]) -> None:
+        """Sets every attribute of an uninitialized board from a state exported by to_state."""
+        super().__init__()
+        self.__top = state["top"]
+        self.__left = state["left"]
+        self.__rows = state["rows"]
+        self.__columns = state["columns"]
+        self.__start_cell = START_CELL
+        self.__goal_cells = GOAL_CELLS
+        self.__cells = {}
+        templates = get_card_templates()
+        for row, column, template_id, flipped, visible in state["cells"]:
+            template = templates[template_id]
+            if (row, column) in GOAL_CELLS:
+                card: PathCard = GoalCard(template.name, template.connections)
+            elif (row, column) == START_CELL:
+                card = StartCard()
+            else:
+                card = template.create()
+            if flipped:
+                card.flip()
+            if isinstance(card, GoalCard) and visible:
+                card.reveal()
+            self.__cells[row, column] = card
+        self.__reachable = set()
+        self.__connected_cells = set()
+        self.__open_ends = set()
+        self.__reached_goals = set()
+        self.__rebuild_reachability()
+        self.__journal = []
+        self.__zobrist = self.__compute_zobrist()
+
+    def copy(self) -> Board:
+        """Returns an independent copy of the board, for lookahead.
+
+        Placed path cards are never modified, so they are shared with the copy; only the goal
+        cards, which can still be revealed, are copied. Listeners are not copied.
+        """
+        board = Board.__new__(Board)
+        board.__copy_from(self)  # noqa: SLF001  # same class, the board is not initialized yet
+        return board
+
+    def __copy_from(self, other: Board) -> None:
+        """Sets every attribute of an uninitialized board from another board."""
+        super().__init__()
+        self.__top = other.__top
+        self.__left = other.__left
+        self.__rows = other.__rows
+        self.__columns = other.__columns
+        self.__start_cell = other.__start_cell
+        self.__goal_cells = other.__goal_cells
+        self.__cells = dict(other.__cells)
+        for goal_cell in self.__goal_cells:
+            self.__cells[goal_cell] = copy(self.__cells[goal_cell])
+        self.__reachable = set(other.__reachable)
+        self.__connected_cells = set(other.__connected_cells)
+        self.__open_ends = set(other.__open_ends)
+        self.__reached_goals = set(other.__reached_goals)
+        self.__journal = []
+        self.__zobrist = other.__zobrist
+
+    def shuffle_hidden_goals(self, rng: Random, keep: Iterable[tuple[int, int]] = ()) -> None:
+        """Shuffles the goal cards not revealed yet between their positions.
+        Hidden goal cards all look alike, so the connectivity index is not affected.
+
+        Args:
+            rng (Random): The random generator used to shuffle.
+            keep (Iterable[tuple[int, int]]): The positions of goal cards left in place.
+        """
+        kept_cells = {(row + self.__top, column + self.__left) for row, column in keep}
+        hidden_cells = [
+            cell
+            for cell in self.__goal_cells
+            if cell not in kept_cells and not self.__cells[cell].is_visible
+        ]
+        goal_cards = [self.__cells[cell] for cell in hidden_cells]
+        rng.shuffle(goal_cards)
+        for cell, goal_card in zip(hidden_cells, goal_cards):
+            self.__zobrist ^= _cell_key(cell, self.__cells[cell]) ^ _cell_key(cell, goal_card)
+            self.__cells[cell] = goal_card
+
+    def __compute_zobrist(self) -> int:
+        """Returns the Zobrist hash of the board, from its bounds and every card."""
+        zobrist = window_key(self.__top, self.__left, self.__rows, self.__columns)
+        for cell, card in self.__cells.items():
+            zobrist ^= _cell_key(cell, card)
+        return zobrist
+
+    @property
+    def zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the board: its bounds and each card with its
+        absolute cell, orientation and visibility. Equal boards have equal hashes in every
+        process, for transposition tables and deduplication."""
+        return self.__zobrist
 
     @property
     def rows(self) -> int:
@@ -38,65 +245,398 @@ class Board:
     @property
     def start_position(self) -> tuple[int, int]:
         """Returns the starting position on the board."""
-        return self.__start_position
+        return self.__start_cell[0] - self.__top, self.__start_cell[1] - self.__left
+
+    @property
+    def open_ends(self) -> set[tuple[int, int]]:
+        """Returns the empty positions reached by a path connected to the start card.
+
+        These are the only positions where a path card can be placed. They may lie one step
+        outside the current bounds.
+        """
+        return {(row - self.__top, column - self.__left) for row, column in self.__open_ends}
+
+    @property
+    def goal_positions(self) -> list[tuple[int, int]]:
+        """Returns the positions of the goal cards."""
+        return [(row - self.__top, column - self.__left) for row, column in self.__goal_cells]
+
+    @property
+    def reached_goals(self) -> list[tuple[int, int]]:
+        """Returns the positions of the goal cards connected to the start card."""
+        return [
+            (row - self.__top, column - self.__left)
+            for row, column in self.__goal_cells
+            if (row, column) in self.__reached_goals
+        ]
+
+    def is_connected(self, row: int, column: int) -> bool:
+        """Returns True if the card at the given position is connected to the start card."""
+        return (row + self.__top, column + self.__left) in self.__connected_cells
 
     def expand(self, direction: str) -> None:
         """Expands the board in the specified direction by adding a new row or column."""
-        if direction == "UP":
-            self.__grid.insert(0, [None for _ in range(self.__columns)])
-            self.__rows += 1
-            self.__start_position = (self.__start_position[0] + 1, self.__start_position[1])
-        elif direction == "DOWN":
-            self.__grid.append([None for _ in range(self.__columns)])
-            self.__rows += 1
-            self.__start_position = (self.__start_position[0], self.__start_position[1])
-        elif direction == "LEFT":
-            for row in self.__grid:
-                row.insert(0, None)
-            self.__columns += 1
-            self.__start_position = (self.__start_position[0], self.__start_position[1] + 1)
-        elif direction == "RIGHT":
-            for row in self.__grid:
-                row.append(None)
-            self.__columns += 1
-        else:
+        if direction not in {"UP", "DOWN", "LEFT", "RIGHT"}:
             msg = "Invalid direction. Use 'UP', 'DOWN', 'LEFT', or 'RIGHT'."
             raise ValueError(msg)
+        self.__journal.clear()
+        self.__grow(direction, 1)
+        if self._listeners:
+            self._emit(BoardExpanded(direction, 1))
 
-    def place_card(self, row: int, column: int, card: PathCard) -> tuple[bool, str]:
+    def place_card(
+        self, row: int, column: int, card: PathCard, *, trusted: bool = False
+    ) -> tuple[bool, str]:
         """Places a path card on the board at the specified position if valid.
 
+        Positions outside the current bounds are accepted, the board is then expanded
+        to include them once the card has been placed.
+
         Args:
             row (int): The row index where the card is to be placed.
             column (int): The column index where the card is to be placed.
             card (PathCard): The path card to be placed.
+            trusted (bool): Skips the validity checks, for moves known to be valid such as
+                            the moves of a replayed game.
 
         Returns:
             tuple[bool, str]: A tuple containing a boolean indicating success and a message.
         """
-        # expand the board if the position is out of current bounds
-        if not (0 <= row < self.__rows and 0 <= column < self.__columns):
-            if row == -1:
-                self.expand("UP")
-                row = 0
-            elif row == self.__rows:
-                self.expand("DOWN")
-            if column == -1:
-                self.expand("LEFT")
-                column = 0
-            elif column == self.__columns:
-                self.expand("RIGHT")
-
-        if self.__grid[row][column] is not None:
+        cell = (row + self.__top, column + self.__left)
+        if not trusted:
+            result, message = self.__check_placement(cell, card)
+            if not result:
+                return result, message
+
+        self.__journal.clear()
+        growths = self.__put(cell, card)
+        if self._listeners:
+            for direction, amount in growths:
+                self._emit(BoardExpanded(direction, amount))
+            self._emit(
+                CardPlaced(
+                    cell[0] - self.__top,
+                    cell[1] - self.__left,
+                    template_id_of(card),
+                    card.is_flipped,
+                )
+            )
+        return True, "Card placed successfully."
+
+    def __check_placement(self, cell: tuple[int, int], card: PathCard) -> tuple[bool, str]:
+        """Checks that a card can be placed on an absolute cell."""
+        if cell in self.__cells:
             return False, "Position already occupied."
 
-        result, message = self.check_adjacent_connections(row, column, card)
+        result, message = self.check_adjacent_connections(
+            cell[0] - self.__top, cell[1] - self.__left, card
+        )
         if not result:
             return False, message
 
-        self.__grid[row][column] = card
+        if cell not in self.__open_ends:
+            return False, "Card must extend a path connected to the start card."
+        return True, "The card can be placed."
+
+    def __put(
+        self, cell: tuple[int, int], card: PathCard, added: list[tuple[set, Any]] | None = None
+    ) -> list[tuple[str, int]]:
+        """Stores a card on an absolute cell and extends the connectivity index from it.
+
+        Args:
+            cell (tuple[int, int]): The absolute cell of the card.
+            card (PathCard): The card to store.
+            added (list[tuple[set, Any]] | None): Receives the entries added to the
+                                                  connectivity sets, for a journaled move.
+
+        Returns:
+            list[tuple[str, int]]: The directions and amounts the board has grown by.
+        """
+        self.__cells[cell] = card
+        self.__zobrist ^= _cell_key(cell, card)
+        growths = self.__include(cell)
+        self.__open_ends.discard(cell)
+        cell_row, cell_column = cell
+        side_paths = card.connections.side_paths
+        for index, _, row_offset, column_offset in _SIDES:
+            path = side_paths[index]
+            if not path or (cell_row, cell_column, path) in self.__reachable:
+                continue
+            adjacent_row, adjacent_column = cell_row + row_offset, cell_column + column_offset
+            adjacent_card = self.__cells.get((adjacent_row, adjacent_column))
+            if adjacent_card is None:
+                continue
+            adjacent_path = adjacent_card.connections.side_paths[index ^ 2]
+            if (adjacent_row, adjacent_column, adjacent_path) in self.__reachable:
+                self.__spread(cell_row, cell_column, path, added)
+        return growths
+
+    def remove_card(self, row: int, column: int) -> tuple[bool, str]:
+        """Removes a path card from the board, as done by a Rockfall card.
+
+        The start and goal cards cannot be removed. Since a removal may disconnect any part
+        of the mine, the connectivity index is rebuilt from the start card.
+
+        Args:
+            row (int): The row index of the card to remove.
+            column (int): The column index of the card to remove.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        cell = (row + self.__top, column + self.__left)
+        result, message = self.__check_removal(cell)
+        if not result:
+            return result, message
+
+        self.__journal.clear()
+        self.__zobrist ^= _cell_key(cell, self.__cells.pop(cell))
+        self.__rebuild_reachability()
+        if self._listeners:
+            self._emit(CardRemoved(row, column))
+        return True, "Card removed successfully."
+
+    def check_removal(self, row: int, column: int) -> tuple[bool, str]:
+        """Checks that the card at a position can be removed, without removing it.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        return self.__check_removal((row + self.__top, column + self.__left))
+
+    def __check_removal(self, cell: tuple[int, int]) -> tuple[bool, str]:
+        """Checks that the card on an absolute cell can be removed."""
+        if cell not in self.__cells:
+            return False, "There is no card at this position."
+        if cell == self.__start_cell or cell in self.__goal_cells:
+            return False, "The start and goal cards cannot be removed."
+        return True, "The card can be removed."
+
+    def push_move(
+        self, row: int, column: int, card: PathCard | None = None, *, flipped: bool = False
+    ) -> tuple[bool, str]:
+        """Applies a move which pop_move can revert, for lookahead and previews.
+
+        The move places a path card, expanding the board if needed, or removes the card at
+        the position as done by a Rockfall card if no card is given. It is validated like
+        place_card and remove_card. Reverting a placement only undoes what it changed, a
+        removal rebuilding the connectivity index in new sets so that reverting it only puts
+        the previous sets back. Journaled moves are not sent to the listeners, and the
+        journal is cleared by any other change of the board.
+
+        Args:
+            row (int): The row index of the move.
+            column (int): The column index of the move.
+            card (PathCard | None): The card to place, None to remove the card at the position.
+            flipped (bool): Whether the card is flipped before being placed, and flipped back
+                            when the move is reverted.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        cell = (row + self.__top, column + self.__left)
+        window = (self.__top, self.__left, self.__rows, self.__columns)
+        if card is None:
+            result, message = self.__check_removal(cell)
+            if not result:
+                return result, message
+            index = (
+                self.__reachable,
+                self.__connected_cells,
+                self.__open_ends,
+                self.__reached_goals,
+            )
+            self.__reachable, self.__connected_cells = set(), set()
+            self.__open_ends, self.__reached_goals = set(), set()
+            zobrist = self.__zobrist
+            removed_card = self.__cells.pop(cell)
+            self.__zobrist ^= _cell_key(cell, removed_card)
+            self.__rebuild_reachability()
+            self.__journal.append(
+                _Change(
+                    cell, removed_card, flipped=False, window=window, index=index, zobrist=zobrist
+                )
+            )
+            return True, "Card removed successfully."
+
+        if flipped:
+            card.flip()
+        result, message = self.__check_placement(cell, card)
+        if not result:
+            if flipped:
+                card.flip()
+            return result, message
+        added: list[tuple[set, Any]] = []
+        zobrist = self.__zobrist
+        self.__put(cell, card, added)
+        self.__journal.append(_Change(cell, None, flipped, window, added, zobrist))
         return True, "Card placed successfully."
 
+    def pop_move(self) -> tuple[bool, str]:
+        """Reverts the last move applied by push_move.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        if not self.__journal:
+            return False, "There is no move to revert."
+        cell, removed_card, flipped, window, index, self.__zobrist = self.__journal.pop()
+        self.__top, self.__left, self.__rows, self.__columns = window
+        if removed_card is not None:
+            self.__cells[cell] = removed_card
+            self.__reachable, self.__connected_cells, self.__open_ends, self.__reached_goals = index
+            return True, "Card put back."
+
+        card = self.__cells.pop(cell)
+        for entries, entry in index:
+            entries.discard(entry)
+        self.__open_ends.add(cell)
+        if flipped:
+            card.flip()
+        return True, "Card taken back."
+
+    @property
+    def journal_size(self) -> int:
+        """Returns the number of moves which pop_move can revert."""
+        return len(self.__journal)
+
+    def reveal_goal(self, row: int, column: int) -> tuple[bool, str]:
+        """Reveals the goal card at the specified position.
+
+        As in the physical game, the revealed card is flipped if needed so that it connects
+        to the path that reached it. Its real connections may close some paths, so the
+        connectivity index is rebuilt from the start card.
+
+        Args:
+            row (int): The row index of the goal card.
+            column (int): The column index of the goal card.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        cell = (row + self.__top, column + self.__left)
+        if cell not in self.__goal_cells:
+            return False, "There is no goal card at this position."
+        goal_card = self.__cells[cell]
+        if not isinstance(goal_card, GoalCard) or goal_card.is_visible:
+            return False, "The goal card is already revealed."
+
+        reached_sides = 0
+        for index, bit, row_offset, column_offset in _SIDES:
+            adjacent_cell = (cell[0] + row_offset, cell[1] + column_offset)
+            adjacent_card = self.__cells.get(adjacent_cell)
+            if adjacent_card is not None:
+                adjacent_path = adjacent_card.connections.side_paths[index ^ 2]
+                if (*adjacent_cell, adjacent_path) in self.__reachable:
+                    reached_sides |= bit
+
+        self.__journal.clear()
+        self.__zobrist ^= _cell_key(cell, goal_card)
+        goal_card.reveal()
+        connections = goal_card.connections
+        if (
+            not connections.open_sides & reached_sides
+            and connections.flipped.open_sides & reached_sides
+        ):
+            goal_card.flip()
+        self.__zobrist ^= _cell_key(cell, goal_card)
+        self.__rebuild_reachability()
+        if self._listeners:
+            self._emit(GoalRevealed(row, column, template_id_of(goal_card), goal_card.is_flipped))
+        return True, "Goal card revealed."
+
+    def __rebuild_reachability(self) -> None:
+        """Recomputes the connectivity index from the start card."""
+        self.__reachable.clear()
+        self.__connected_cells.clear()
+        self.__open_ends.clear()
+        self.__reached_goals.clear()
+        start_row, start_column = self.__start_cell
+        start_card = self.__cells[self.__start_cell]
+        for path in start_card.connections.side_paths:
+            if path and (start_row, start_column, path) not in self.__reachable:
+                self.__spread(start_row, start_column, path)
+
+    def __spread(
+        self, row: int, column: int, path: int, added: list[tuple[set, Any]] | None = None
+    ) -> None:
+        """Marks a path as connected to the start and follows it through adjacent cards.
+
+        Only the paths that were not connected yet are visited, so the cost of an update is
+        proportional to the newly connected part of the mine. The entries added to the sets
+        are appended to added if given, so that a journaled move can remove them.
+        """
+        reachable = self.__reachable
+        connected_cells = self.__connected_cells
+        open_ends = self.__open_ends
+        reached_goals = self.__reached_goals
+        reachable.add((row, column, path))
+        if added is not None:
+            added.append((reachable, (row, column, path)))
+        pending = [(row, column, path)]
+        while pending:
+            row, column, path = pending.pop()
+            cell = (row, column)
+            if added is not None and cell not in connected_cells:
+                added.append((connected_cells, cell))
+            connected_cells.add(cell)
+            if cell in self.__goal_cells:
+                if added is not None and cell not in reached_goals:
+                    added.append((reached_goals, cell))
+                reached_goals.add(cell)
+            for index, bit, row_offset, column_offset in _SIDES:
+                if not path & bit:
+                    continue
+                adjacent_cell = (row + row_offset, column + column_offset)
+                adjacent_card = self.__cells.get(adjacent_cell)
+                if adjacent_card is None:
+                    if added is not None and adjacent_cell not in open_ends:
+                        added.append((open_ends, adjacent_cell))
+                    open_ends.add(adjacent_cell)
+                    continue
+                adjacent_path = adjacent_card.connections.side_paths[index ^ 2]
+                adjacent_node = (*adjacent_cell, adjacent_path)
+                if adjacent_path and adjacent_node not in reachable:
+                    reachable.add(adjacent_node)
+                    if added is not None:
+                        added.append((reachable, adjacent_node))
+                    pending.append(adjacent_node)
+
+    def __include(self, cell: tuple[int, int]) -> list[tuple[str, int]]:
+        """Grows the board bounds so that they contain the given absolute cell.
+
+        Returns:
+            list[tuple[str, int]]: The directions and amounts the board has grown by.
+        """
+        cell_row, cell_column = cell
+        growths = []
+        if cell_row < self.__top:
+            growths.append(("UP", self.__top - cell_row))
+        elif cell_row >= self.__top + self.__rows:
+            growths.append(("DOWN", cell_row - self.__top - self.__rows + 1))
+        if cell_column < self.__left:
+            growths.append(("LEFT", self.__left - cell_column))
+        elif cell_column >= self.__left + self.__columns:
+            growths.append(("RIGHT", cell_column - self.__left - self.__columns + 1))
+        for direction, amount in growths:
+            self.__grow(direction, amount)
+        return growths
+
+    def __grow(self, direction: str, amount: int) -> None:
+        """Adds rows or columns to the board in a direction."""
+        self.__zobrist ^= window_key(self.__top, self.__left, self.__rows, self.__columns)
+        if direction == "UP":
+            self.__top -= amount
+            self.__rows += amount
+        elif direction == "DOWN":
+            self.__rows += amount
+        elif direction == "LEFT":
+            self.__left -= amount
+            self.__columns += amount
+        else:
+            self.__columns += amount
+        self.__zobrist ^= window_key(self.__top, self.__left, self.__rows, self.__columns)
+
     def check_adjacent_connections(self, row: int, column: int, card: PathCard) -> tuple[bool, str]:
         """Checks if the placed card connects properly with adjacent cards.
 
@@ -109,41 +649,82 @@ class Board:
             tuple[bool, str]: A tuple containing a boolean
                               indicating if connections are valid and a message.
         """
-        adjacent_positions = {
-            "UP": (row - 1, column),
-            "DOWN": (row + 1, column),
-            "LEFT": (row, column - 1),
-            "RIGHT": (row, column + 1),
-        }
+        occupied, facing = self.__adjacent_edges(row + self.__top, column + self.__left)
+        if not occupied:
+            return False, "Card must connect to at least one adjacent card."
 
-        # Map direction to (card side, adjacent card opposite side, error message)
-        connection_map = {
-            "UP": ("UP", "DOWN", "Connection mismatch with UP card."),
-            "DOWN": ("DOWN", "UP", "Connection mismatch with DOWN card."),
-            "LEFT": ("LEFT", "RIGHT", "Connection mismatch with LEFT card."),
-            "RIGHT": ("RIGHT", "LEFT", "Connection mismatch with RIGHT card."),
-        }
+        mismatch = (card.connections.edges ^ facing) & occupied
+        if mismatch:
+            return False, _MISMATCH_MESSAGES[mismatch & -mismatch]
 
-        count_adjacent = 0
+        return True, "All connections are valid."
 
-        for direction, (adj_row, adj_col) in adjacent_positions.items():
-            if 0 <= adj_row < self.__rows and 0 <= adj_col < self.__columns:
-                adjacent_card = self.__grid[adj_row][adj_col]
-                if adjacent_card is not None:
-                    count_adjacent += 1
-                    card_side, adj_side, error_msg = connection_map[direction]
-                    if (getattr(card.connections, card_side) != 0) != (
-                        getattr(adjacent_card.connections, adj_side) != 0
-                    ):
-                        return False, error_msg
+    def __adjacent_edges(self, row: int, column: int) -> tuple[int, int]:
+        """Returns the sides of an absolute cell having an adjacent card, and among them the
+        sides where the adjacent card has an edge facing the cell."""
+        occupied = 0
+        facing = 0
+        for _, bit, row_offset, column_offset in _SIDES:
+            adjacent_card = self.__cells.get((row + row_offset, column + column_offset))
+            if adjacent_card is not None:
+                occupied |= bit
+                facing |= FLIPPED_SIDES[adjacent_card.connections.edges] & bit
+        return occupied, facing
 
-        if count_adjacent == 0:
-            return False, "Card must connect to at least one adjacent card."
+    def legal_moves(self, hand: Iterable[Card]) -> list[tuple[PathCard, int, int, bool]]:
+        """Lists every valid placement of the path cards of a hand, without placing them.
 
-        return True, "All connections are valid."
+        Only the open ends are considered. Identical cards are listed once, and the legal
+        positions are computed once per set of edges, for both orientations of each card.
+
+        Args:
+            hand (Iterable[Card]): The cards to place, cards other than path cards are ignored.
+
+        Returns:
+            list[tuple[PathCard, int, int, bool]]: The (card, row, column, flipped) placements,
+                                                   flipped meaning the card must be flipped
+                                                   before being placed.
+        """
+        open_ends = [
+            (row - self.__top, column - self.__left, *self.__adjacent_edges(row, column))
+            for row, column in self.__open_ends
+        ]
+        positions_by_edges: dict[int, list[tuple[int, int]]] = {}
+        seen_cards: set[Card] = set()
+        moves: list[tuple[PathCard, int, int, bool]] = []
+        for card in hand:
+            if not isinstance(card, PathCard) or card in seen_cards:
+                continue
+            seen_cards.add(card)
+            connections = card.connections
+            flipped_connections = connections.flipped
+            orientations = [(False, connections)]
+            if (
+                flipped_connections.edges != connections.edges
+                or flipped_connections.side_paths != connections.side_paths
+            ):
+                orientations.append((True, flipped_connections))
+            for flipped, orientation in orientations:
+                edges = orientation.edges
+                positions = positions_by_edges.get(edges)
+                if positions is None:
+                    positions = positions_by_edges[edges] = [
+                        (row, column)
+                        for row, column, occupied, facing in open_ends
+                        if not (edges ^ facing) & occupied
+                    ]
+                moves.extend((card, row, column, flipped) for row, column in positions)
+        return moves
+
+    def iter_cards(self) -> Iterator[tuple[int, int, PathCard]]:
+        """Iterates over the cards of the board as (row, column, card), in no particular order.
+        Only the placed cards are visited, whatever the size of the board."""
+        top, left = self.__top, self.__left
+        for (row, column), card in self.__cells.items():
+            yield row - top, column - left, card
 
     def get_card(self, row: int, column: int) -> PathCard | None:
         """Returns the card at the specified position, or None if empty."""
         if 0 <= row < self.__rows and 0 <= column < self.__columns:
-            return self.__grid[row][column]
+            return self.__cells.get((row + self.__top, column + self.__left))
         return None
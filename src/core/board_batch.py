@@ -0,0 +1,260 @@
+"""
+This module contains BoardBatch, many boards packed into NumPy arrays to be analysed at once.
+
+Each board of a batch is stored from the top-left corner of the arrays, with one more cell on
+each side for the open ends outside its bounds. The paths of each card are packed in one byte
+per cell, the sides of its first path in the low nibble and the sides of its second path in
+the high nibble. Reachability from the start card is then computed for all the boards
+together, by flood-fill iterations over the whole arrays, the boards whose paths stopped
+growing being dropped from the next iterations.
+
+NumPy is an optional dependency, installed with the analytics extra:
+
+    pip install sabooters[analytics]
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.core.board import GOAL_CELLS, START_CELL, Board
+from src.core.cards.card_template import get_card_templates, get_template
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, see the analytics extra
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import NDArray
+
+# Name of the catalog card giving the connections of the goal cards not revealed yet
+_HIDDEN_GOAL_NAME = "GOAL"
+_UP, _RIGHT, _DOWN, _LEFT = 0b0001, 0b0010, 0b0100, 0b1000
+
+
+def _require_numpy() -> None:
+    """Raises an ImportError if NumPy is not installed."""
+    if np is None:
+        msg = "BoardBatch requires NumPy, install the analytics extra."
+        raise ImportError(msg)
+
+
+def _path_bytes() -> NDArray:
+    """Returns the packed paths of each template of the catalog, by template id and flipped."""
+    templates = get_card_templates()
+    path_bytes = np.zeros((len(templates), 2), dtype=np.uint8)
+    for template in templates:
+        if template.connections is None:
+            continue
+        for flipped, connections in enumerate((template.connections, template.connections.flipped)):
+            paths = sorted({path for path in connections.side_paths if path})
+            packed = 0
+            for shift, path in zip((0, 4), paths):
+                packed |= path << shift
+            path_bytes[template.template_id, flipped] = packed
+    return path_bytes
+
+
+class BoardBatch:
+    """Many boards packed into NumPy arrays, with vectorized connectivity queries."""
+
+    def __init__(
+        self,
+        template_ids: NDArray,
+        flipped: NDArray,
+        visible: NDArray,
+        windows: NDArray,
+        origins: NDArray,
+    ) -> None:
+        """Initializes a BoardBatch from its arrays, see from_boards to pack boards.
+
+        Args:
+            template_ids (NDArray): The template id of the card of each cell, -1 for empty
+                                    cells, of shape (boards, rows, columns).
+            flipped (NDArray): Whether the card of each cell is flipped.
+            visible (NDArray): Whether the card of each cell is face up, False for the goal
+                               cards not revealed yet.
+            windows (NDArray): The top, left, rows and columns of each board, in absolute
+                               coordinates, of shape (boards, 4).
+            origins (NDArray): The absolute coordinates of the first cell of each board,
+                               of shape (boards, 2).
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy()
+        self.__template_ids = template_ids
+        self.__flipped = flipped
+        self.__visible = visible
+        self.__windows = windows
+        self.__origins = origins
+
+        hidden_goal_id = get_template(_HIDDEN_GOAL_NAME).template_id
+        occupied = template_ids >= 0
+        path_ids = np.where(visible, template_ids, hidden_goal_id)
+        self.__paths = np.where(
+            occupied, _path_bytes()[np.maximum(path_ids, 0), flipped.astype(np.intp)], 0
+        ).astype(np.uint8)
+        self.__occupied = occupied
+        self.__reached: NDArray | None = None
+        self.__incoming: NDArray | None = None
+
+    @classmethod
+    def from_boards(cls, boards: Iterable[Board]) -> BoardBatch:
+        """Packs boards into a batch."""
+        return cls.from_states(board.to_state() for board in boards)
+
+    @classmethod
+    def from_states(cls, states: Iterable[dict]) -> BoardBatch:
+        """Packs boards exported by Board.to_state into a batch.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy()
+        states = list(states)
+        windows = np.array(
+            [[state["top"], state["left"], state["rows"], state["columns"]] for state in states],
+            dtype=np.int32,
+        ).reshape(-1, 4)
+        # One more cell on each side holds the open ends outside the bounds
+        origins = windows[:, :2] - 1
+        rows = int(windows[:, 2].max()) + 2 if states else 0
+        columns = int(windows[:, 3].max()) + 2 if states else 0
+        shape = (len(states), rows, columns)
+        template_ids = np.full(shape, -1, dtype=np.int16)
+        flipped = np.zeros(shape, dtype=bool)
+        visible = np.ones(shape, dtype=bool)
+        for index, state in enumerate(states):
+            cells = np.array(state["cells"], dtype=np.int32).reshape(-1, 5)
+            cell_rows = cells[:, 0] - origins[index, 0]
+            cell_columns = cells[:, 1] - origins[index, 1]
+            template_ids[index, cell_rows, cell_columns] = cells[:, 2]
+            flipped[index, cell_rows, cell_columns] = cells[:, 3].astype(bool)
+            visible[index, cell_rows, cell_columns] = cells[:, 4].astype(bool)
+        return cls(template_ids, flipped, visible, windows, origins)
+
+    def to_boards(self) -> list[Board]:
+        """Unpacks the boards of the batch."""
+        boards = []
+        for index in range(len(self)):
+            top, left = self.__origins[index].tolist()
+            rows, columns = np.nonzero(self.__occupied[index])
+            cells = [
+                [
+                    int(row) + top,
+                    int(column) + left,
+                    int(self.__template_ids[index, row, column]),
+                    int(self.__flipped[index, row, column]),
+                    int(self.__visible[index, row, column]),
+                ]
+                for row, column in zip(rows, columns)
+            ]
+            window_top, window_left, window_rows, window_columns = self.__windows[index].tolist()
+            state = {
+                "top": window_top,
+                "left": window_left,
+                "rows": window_rows,
+                "columns": window_columns,
+                "cells": cells,
+            }
+            boards.append(Board.from_state(state))
+        return boards
+
+    def __len__(self) -> int:
+        """Returns the number of boards in the batch."""
+        return self.__template_ids.shape[0]
+
+    @property
+    def origins(self) -> NDArray:
+        """Returns the absolute coordinates of the first cell of each board."""
+        return self.__origins
+
+    @property
+    def template_ids(self) -> NDArray:
+        """Returns the template id of the card of each cell, -1 for empty cells."""
+        return self.__template_ids
+
+    @property
+    def paths(self) -> NDArray:
+        """Returns the packed paths of each cell, as seen by the players: the sides of the
+        first path in the low nibble and the sides of the second path in the high nibble."""
+        return self.__paths
+
+    @property
+    def occupied(self) -> NDArray:
+        """Returns whether each cell holds a card."""
+        return self.__occupied
+
+    def reached_sides(self) -> NDArray:
+        """Returns the sides of each cell on a path connected to the start card."""
+        self.__flood()
+        return self.__reached
+
+    def connected_cells(self) -> NDArray:
+        """Returns whether each cell has a path connected to the start card."""
+        return self.reached_sides() != 0
+
+    def goals_reached(self) -> NDArray:
+        """Returns whether each goal is connected to the start card, of shape (boards, 3)."""
+        reached = self.reached_sides()
+        boards = np.arange(len(self))
+        return np.stack(
+            [
+                reached[boards, row - self.__origins[:, 0], column - self.__origins[:, 1]] != 0
+                for row, column in GOAL_CELLS
+            ],
+            axis=1,
+        )
+
+    def open_ends(self) -> NDArray:
+        """Returns whether each cell is an open end: an empty cell reached by a path."""
+        self.__flood()
+        return ~self.__occupied & (self.__incoming != 0)
+
+    def open_end_counts(self) -> NDArray:
+        """Returns the number of open ends of each board."""
+        return self.open_ends().sum(axis=(1, 2))
+
+    def __flood(self) -> None:
+        """Spreads the paths connected to the start card until they stop growing."""
+        if self.__reached is not None:
+            return
+        paths = self.__paths
+        self.__reached = reached = np.zeros_like(paths)
+        self.__incoming = np.zeros_like(paths)
+        boards = np.arange(len(self))
+        start = (
+            boards,
+            START_CELL[0] - self.__origins[:, 0],
+            START_CELL[1] - self.__origins[:, 1],
+        )
+        reached[start] = (paths[start] & 0b1111) | (paths[start] >> 4)
+
+        # Work on the boards whose paths are still growing only
+        active_reached = reached
+        first_paths, second_paths = paths & 0b1111, paths >> 4
+        while len(boards):
+            incoming = np.zeros_like(active_reached)
+            incoming[:, 1:, :] |= (active_reached[:, :-1, :] & _DOWN) >> 2
+            incoming[:, :-1, :] |= (active_reached[:, 1:, :] & _UP) << 2
+            incoming[:, :, 1:] |= (active_reached[:, :, :-1] & _RIGHT) << 2
+            incoming[:, :, :-1] |= (active_reached[:, :, 1:] & _LEFT) >> 2
+            # A path is reached when one of its sides is
+            spread = (
+                active_reached
+                | first_paths * ((first_paths & incoming) != 0)
+                | second_paths * ((second_paths & incoming) != 0)
+            )
+            growing = (spread != active_reached).any(axis=(1, 2))
+            if not growing.all():
+                done = ~growing
+                reached[boards[done]] = spread[done]
+                self.__incoming[boards[done]] = incoming[done]
+                boards = boards[growing]
+                spread = spread[growing]
+                first_paths, second_paths = first_paths[growing], second_paths[growing]
+            active_reached = spread
@@ -1,16 +1,24 @@
 """This module defines the base class for action cards in the game."""
 
+from __future__ import annotations
+
 from src.core.cards.card import Card
 
 
 class ActionCard(Card):
     """Card representing an action that can be performed by players.
-    These cards can be played during a player's turn."""
+    These cards can be played during a player's turn.
+
+    The effects of the cards of the catalog are shared handlers, see the effects module;
+    an action callable is only needed by cards made outside of the catalog."""
 
-    def __init__(self, name: str, action: callable) -> None:
-        """Initializes an ActionCard with a name and its associated action."""
+    __slots__ = ("__defensive", "__offensive", "_action")
+
+    def __init__(self, name: str, action: callable | None) -> None:
+        """Initializes an ActionCard with a name and its associated action, None for the
+        cards of the catalog."""
         self._action = action
-        self._offensive = False
+        self.__offensive = False
         self.__defensive = False
         super().__init__(name)
 
@@ -40,5 +48,6 @@ class ActionCard(Card):
         self.__offensive = False
 
     def perform_action(self, *args: any, **kwargs: any) -> None:
-        """Performs the action associated with the card."""
-        self._action(*args, **kwargs)
+        """Performs the action associated with the card, if any."""
+        if self._action is not None:
+            self._action(*args, **kwargs)
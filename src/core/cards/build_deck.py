@@ -2,50 +2,37 @@
 This file contains the function to build the deck of cards for the game.
 """
 
-from json import load
-from pathlib import Path
-from random import shuffle
+from __future__ import annotations
 
-from src.core.cards.action_card import ActionCard
-from src.core.cards.card import Card
-from src.core.cards.path_card import PathCard
+from random import Random
+from typing import TYPE_CHECKING
 
-with Path("src/core/cards/cards_data.json").open(encoding="utf-8") as file:
-    card_data = load(file)
+from src.core.cards.card_template import get_card_templates, get_deck_template_ids
 
+if TYPE_CHECKING:
+    from src.core.cards.card import Card
 
-def build_deck(cards_to_remove: int = 10) -> list[Card]:
+
+def build_deck_ids(cards_to_remove: int = 10, rng: Random | None = None) -> list[int]:
+    """Builds and returns a shuffled deck of card template ids for the game.
+    Args:
+        cards_to_remove (int): The number of random cards to remove from the deck.
+        rng (Random | None): The random generator used to shuffle, a new one if None.
+    Returns:
+        list[int]: A shuffled list of template ids, one per card of the deck.
+    """
+    deck = list(get_deck_template_ids())
+    (rng or Random()).shuffle(deck)
+    return deck[cards_to_remove:]  # Remove a number of random cards to adjust deck size
+
+
+def build_deck(cards_to_remove: int = 10, rng: Random | None = None) -> list[Card]:
     """Builds and returns a shuffled deck of cards for the game.
     Args:
         cards_to_remove (int): The number of random cards to remove from the deck.
+        rng (Random | None): The random generator used to shuffle, a new one if None.
     Returns:
         list[Card]: A shuffled list of Card objects representing the deck.
     """
-    deck: list[Card] = []
-
-    # Create PathCards
-    for card_name, card_info in card_data["path_card"].items():
-        number_of_copies = card_info.get("number", 1)
-        for _ in range(number_of_copies):
-            path_card = PathCard.from_dict(
-                name=card_name, connections_dict=card_info["connections"]
-            )
-            deck.append(path_card)
-
-    def no_action() -> None:
-        """A placeholder function for ActionCard actions that do nothing."""
-
-    # Create ActionCards
-    for card_name, card_info in card_data["action_card"].items():
-        number_of_copies = card_info.get("number", 1)
-        type_of_card = card_info.get("type", "neutral")
-        for _ in range(number_of_copies):
-            action_card = ActionCard(name=card_name, action=no_action)
-            if type_of_card == "offensive":
-                action_card.make_offensive()
-            elif type_of_card == "defensive":
-                action_card.make_defensive()
-            deck.append(action_card)
-
-    shuffle(deck)
-    return deck[cards_to_remove:]  # Remove a number of random cards to adjust deck size
+    templates = get_card_templates()
+    return [templates[template_id].create() for template_id in build_deck_ids(cards_to_remove, rng)]
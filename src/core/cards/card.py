@@ -2,7 +2,11 @@
 
 
 class Card:
-    """Base class for all cards in the game."""
+    """Base class for all cards in the game.
+    Cards and their subclasses declare __slots__, millions of them being created by
+    simulations: an instance holds its attributes without a __dict__."""
+
+    __slots__ = ("_name",)
 
     def __init__(self, name: str) -> None:
         """Initializes a Card with a name."""
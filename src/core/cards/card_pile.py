@@ -0,0 +1,210 @@
+"""This module defines the piles of cards held by the players: their hand and their bench,
+and the read-only views of the piles handed out by the players."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, overload
+
+from src.core.zobrist import MASK, name_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from src.core.cards.card import Card
+
+
+class CardPile(Sequence):
+    """An ordered pile of cards, indexed as a multiset of card names.
+
+    Cards are kept in the order they were added, for display and for the indices of the
+    deltas, while the number of copies of each card name is maintained so that membership
+    and counts are answered without scanning the pile. Cards are equal when their names
+    are, so a card is in the pile when a card of the same name is.
+    """
+
+    __slots__ = ("__cards", "__counts", "__zobrist")
+
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        """Initializes a CardPile with cards, the first one being the oldest."""
+        self.__cards: list[Card] = []
+        self.__counts = dict[str, int]()
+        # Zobrist hash of the pile as a multiset of card names, whatever their order
+        self.__zobrist = 0
+        for card in cards:
+            self.append(card)
+
+    @property
+    def zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the cards of the pile, whatever their order."""
+        return self.__zobrist
+
+    def __len__(self) -> int:
+        """Returns the number of cards in the pile."""
+        return len(self.__cards)
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Card]: ...
+
+    def __getitem__(self, index: int | slice) -> Card | list[Card]:
+        """Returns the card at an index of the pile, or a list of cards for a slice."""
+        return self.__cards[index]
+
+    def __iter__(self) -> Iterator[Card]:
+        """Iterates over the cards, from the oldest to the newest."""
+        return iter(self.__cards)
+
+    def __contains__(self, card: object) -> bool:
+        """Returns True if a card of the same name is in the pile."""
+        return self.__counts.get(getattr(card, "name", None), 0) > 0
+
+    def __eq__(self, other: object) -> bool:
+        """Checks that two piles, or a pile and a list, hold equal cards in the same order."""
+        if isinstance(other, CardPile):
+            return self.__cards == other.__cards
+        if isinstance(other, list):
+            return self.__cards == other
+        return NotImplemented
+
+    __hash__ = None  # mutable, like a list
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the CardPile."""
+        return f"CardPile({[card.name for card in self.__cards]!r})"
+
+    def count(self, card: object) -> int:
+        """Returns the number of cards of the same name in the pile."""
+        return self.__counts.get(getattr(card, "name", None), 0)
+
+    def count_name(self, name: str) -> int:
+        """Returns the number of cards with a name in the pile."""
+        return self.__counts.get(name, 0)
+
+    def index(self, card: object, start: int = 0, stop: int | None = None) -> int:
+        """Returns the index of the first card of the pile equal to a card, the card itself
+        being preferred to another copy.
+
+        Raises:
+            ValueError: If there is no card of the same name in the pile.
+        """
+        if card not in self:
+            msg = "The card is not in the pile."
+            raise ValueError(msg)
+        cards = self.__cards[start:stop]
+        for index, other in enumerate(cards, start):
+            if other is card:
+                return index
+        return cards.index(card) + start
+
+    def append(self, card: Card) -> None:
+        """Adds a card on top of the pile."""
+        self.__cards.append(card)
+        name = card.name
+        self.__counts[name] = self.__counts.get(name, 0) + 1
+        self.__zobrist = self.__zobrist + name_key(name) & MASK
+
+    def pop(self, index: int = -1) -> Card:
+        """Removes and returns the card at an index of the pile, the newest one by default.
+
+        Raises:
+            IndexError: If there is no card at this index.
+        """
+        card = self.__cards.pop(index)
+        name = card.name
+        count = self.__counts[name] - 1
+        if count:
+            self.__counts[name] = count
+        else:
+            del self.__counts[name]
+        self.__zobrist = self.__zobrist - name_key(name) & MASK
+        return card
+
+    def clear(self) -> None:
+        """Removes every card of the pile."""
+        self.__cards.clear()
+        self.__counts.clear()
+        self.__zobrist = 0
+
+    def view(self) -> CardPileView:
+        """Returns a read-only view of the pile, following its changes."""
+        return CardPileView(self)
+
+    def copy(self, copy_card: Callable[[Card], Card] | None = None) -> CardPile:
+        """Returns a copy of the pile, sharing its cards unless a function copying a card,
+        which must keep its name, is given."""
+        pile = CardPile()
+        if copy_card is None:
+            pile.__cards = list(self.__cards)
+        else:
+            pile.__cards = [copy_card(card) for card in self.__cards]
+        pile.__counts = dict(self.__counts)
+        pile.__zobrist = self.__zobrist
+        return pile
+
+
+class CardPileView(Sequence):
+    """A read-only view of a CardPile, for the piles whose changes belong to their owner."""
+
+    __slots__ = ("__pile",)
+
+    def __init__(self, pile: CardPile) -> None:
+        """Initializes a CardPileView following a pile."""
+        self.__pile = pile
+
+    @property
+    def zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the cards of the pile, whatever their order."""
+        return self.__pile.zobrist
+
+    def __len__(self) -> int:
+        """Returns the number of cards in the pile."""
+        return len(self.__pile)
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Card]: ...
+
+    def __getitem__(self, index: int | slice) -> Card | list[Card]:
+        """Returns the card at an index of the pile, or a list of cards for a slice."""
+        return self.__pile[index]
+
+    def __iter__(self) -> Iterator[Card]:
+        """Iterates over the cards, from the oldest to the newest."""
+        return iter(self.__pile)
+
+    def __contains__(self, card: object) -> bool:
+        """Returns True if a card of the same name is in the pile."""
+        return card in self.__pile
+
+    def __eq__(self, other: object) -> bool:
+        """Checks that the pile holds the same cards as another pile, view or list."""
+        if isinstance(other, CardPileView):
+            return self.__pile == other.__pile
+        return self.__pile == other
+
+    __hash__ = None  # follows a mutable pile
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the CardPileView."""
+        return f"CardPileView({[card.name for card in self.__pile]!r})"
+
+    def count(self, card: object) -> int:
+        """Returns the number of cards of the same name in the pile."""
+        return self.__pile.count(card)
+
+    def count_name(self, name: str) -> int:
+        """Returns the number of cards with a name in the pile."""
+        return self.__pile.count_name(name)
+
+    def index(self, card: object, start: int = 0, stop: int | None = None) -> int:
+        """Returns the index of the first card of the pile equal to a card, see CardPile.index.
+
+        Raises:
+            ValueError: If there is no card of the same name in the pile.
+        """
+        return self.__pile.index(card, start, stop)
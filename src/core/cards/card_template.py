@@ -0,0 +1,176 @@
+"""
+This module compiles the card catalog into immutable card templates.
+A template describes one kind of card and is shared by all its copies, decks only hold
+template ids and the cards are created when they are drawn.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from src.core.cards.action_card import ActionCard
+from src.core.cards.catalog import get_catalog
+from src.core.cards.path_card import CardConnections, GoalCard, PathCard
+
+if TYPE_CHECKING:
+    from src.core.cards.card import Card
+
+
+class CardTemplate:
+    """Immutable description of a kind of card, as defined in the catalog."""
+
+    def __init__(
+        self,
+        template_id: int,
+        name: str,
+        number: int,
+        connections: CardConnections | None = None,
+        action_type: str | None = None,
+        tools: tuple[str, ...] = (),
+        effect: str | None = None,
+    ) -> None:
+        """Initializes a CardTemplate.
+
+        Args:
+            template_id (int): The index of the template in the compiled catalog.
+            name (str): The name of the card.
+            number (int): The number of copies of the card in a full deck.
+            connections (CardConnections | None): The connections, for path cards only.
+            action_type (str | None): "offensive", "defensive" or "neutral", for action cards only.
+            tools (tuple[str, ...]): The tools an offensive card breaks or a defensive card
+                                     repairs, for action cards only.
+            effect (str | None): The name of the effect of an action card, see the effects
+                                 module, None for path cards.
+        """
+        self.__template_id = template_id
+        self.__name = name
+        self.__number = number
+        self.__connections = connections
+        self.__action_type = action_type
+        self.__tools = tools
+        self.__effect = effect
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the CardTemplate."""
+        return f"CardTemplate({self.__template_id}, {self.__name!r})"
+
+    @property
+    def template_id(self) -> int:
+        """Returns the id of the template."""
+        return self.__template_id
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the card."""
+        return self.__name
+
+    @property
+    def number(self) -> int:
+        """Returns the number of copies of the card in a full deck."""
+        return self.__number
+
+    @property
+    def connections(self) -> CardConnections | None:
+        """Returns the connections of a path card, None for an action card."""
+        return self.__connections
+
+    @property
+    def action_type(self) -> str | None:
+        """Returns the type of an action card, None for a path card."""
+        return self.__action_type
+
+    @property
+    def tools(self) -> tuple[str, ...]:
+        """Returns the tools broken or repaired by an action card, empty for other cards."""
+        return self.__tools
+
+    @property
+    def effect(self) -> str | None:
+        """Returns the name of the effect of an action card, None for a path card."""
+        return self.__effect
+
+    def create(self) -> Card:
+        """Creates a new card from the template."""
+        if self.__connections is not None:
+            return PathCard(self.__name, self.__connections)
+        action_card = ActionCard(name=self.__name, action=None)
+        if self.__action_type == "offensive":
+            action_card.make_offensive()
+        elif self.__action_type == "defensive":
+            action_card.make_defensive()
+        return action_card
+
+
+class _CompiledCatalog:
+    """Holds the templates compiled from the catalog currently in use."""
+
+    catalog: dict[str, Any] | None = None
+    templates: tuple[CardTemplate, ...] = ()
+    templates_by_name: dict[str, CardTemplate] = {}  # noqa: RUF012
+    deck_template_ids: tuple[int, ...] = ()
+
+
+def _compile() -> None:
+    """Compiles the catalog in use into templates, if not done already."""
+    catalog = get_catalog()
+    if _CompiledCatalog.catalog is catalog:
+        return
+
+    templates = list[CardTemplate]()
+    for card_name, card_info in catalog["path_card"].items():
+        connections = CardConnections.from_dict(card_info["connections"])
+        templates.append(
+            CardTemplate(len(templates), card_name, card_info.get("number", 1), connections)
+        )
+    for card_name, card_info in catalog["action_card"].items():
+        action_type = card_info.get("type", "neutral").lower()
+        templates.append(
+            CardTemplate(
+                len(templates),
+                card_name,
+                card_info.get("number", 1),
+                action_type=action_type,
+                tools=tuple(card_info.get("tools", ())),
+                effect=card_info.get("effect"),
+            )
+        )
+
+    _CompiledCatalog.catalog = catalog
+    _CompiledCatalog.templates = tuple(templates)
+    _CompiledCatalog.templates_by_name = {template.name: template for template in templates}
+    _CompiledCatalog.deck_template_ids = tuple(
+        template.template_id for template in templates for _ in range(template.number)
+    )
+
+
+def get_card_templates() -> tuple[CardTemplate, ...]:
+    """Returns every card template of the catalog, indexed by template id."""
+    _compile()
+    return _CompiledCatalog.templates
+
+
+def get_template(name: str) -> CardTemplate:
+    """Returns the template of the card with the given name.
+
+    Raises:
+        KeyError: If no card of the catalog has this name.
+    """
+    _compile()
+    return _CompiledCatalog.templates_by_name[name]
+
+
+def get_deck_template_ids() -> tuple[int, ...]:
+    """Returns the template ids of a full, unshuffled deck, one id per copy of a card."""
+    _compile()
+    return _CompiledCatalog.deck_template_ids
+
+
+def get_card_template(card: Card) -> CardTemplate:
+    """Returns the template of a card, the template of its real face for a goal card.
+
+    Raises:
+        KeyError: If the card is not part of the catalog.
+    """
+    if isinstance(card, GoalCard):
+        return get_template(card.read_real_name())
+    return get_template(card.name)
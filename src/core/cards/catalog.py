@@ -0,0 +1,47 @@
+"""
+This module gives access to the card catalog, the data describing every card and role.
+The catalog is parsed once, on first use, and shared by every module reading it.
+"""
+
+from __future__ import annotations
+
+from importlib.resources import files
+from json import load
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+    from pathlib import Path
+
+DEFAULT_CATALOG_FILE = files("src.core.cards") / "cards_data.json"
+
+
+class _CatalogState:
+    """Holds the catalog file in use and its parsed content, if already loaded."""
+
+    source: Traversable | Path = DEFAULT_CATALOG_FILE
+    data: dict[str, Any] | None = None
+
+
+def get_catalog() -> dict[str, Any]:
+    """Returns the card catalog, loading it on the first call.
+
+    Returns:
+        dict[str, Any]: The catalog, with the "path_card", "action_card" and "roles" sections.
+    """
+    if _CatalogState.data is None:
+        with _CatalogState.source.open(encoding="utf-8") as file:
+            _CatalogState.data = load(file)
+    return _CatalogState.data
+
+
+def use_catalog(source: Traversable | Path | None = None) -> None:
+    """Selects the catalog file to use, for instance to play with an expansion.
+
+    The file is only read on the next call to get_catalog.
+
+    Args:
+        source (Traversable | Path | None): The catalog file, or None for the default one.
+    """
+    _CatalogState.source = DEFAULT_CATALOG_FILE if source is None else source
+    _CatalogState.data = None
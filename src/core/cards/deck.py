@@ -0,0 +1,97 @@
+"""This module defines the deck from which players draw their cards."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.core.cards.build_deck import build_deck_ids
+from src.core.cards.card_template import CardTemplate, get_card_templates
+from src.core.zobrist import deck_key
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from random import Random
+
+    from src.core.cards.card import Card
+
+
+class Deck:
+    """A pile of cards, held as card template ids.
+    Cards are drawn from the end of the pile and created from their template when drawn."""
+
+    def __init__(self, template_ids: Iterable[int]) -> None:
+        """Initializes a Deck with template ids, the last one being the top of the pile."""
+        self.__template_ids = list(template_ids)
+        self.__templates = get_card_templates()
+        # Computed on the first read only, most decks never being hashed
+        self.__zobrist: int | None = None
+
+    @classmethod
+    def build(cls, cards_to_remove: int = 10, rng: Random | None = None) -> Deck:
+        """Builds a shuffled deck for a round.
+        Args:
+            cards_to_remove (int): The number of random cards to remove from the deck.
+            rng (Random | None): The random generator used to shuffle, a new one if None.
+        """
+        return cls(build_deck_ids(cards_to_remove, rng))
+
+    def __len__(self) -> int:
+        """Returns the number of cards left in the deck."""
+        return len(self.__template_ids)
+
+    @property
+    def remaining(self) -> int:
+        """Returns the number of cards left in the deck."""
+        return len(self.__template_ids)
+
+    @property
+    def template_ids(self) -> tuple[int, ...]:
+        """Returns the template ids of the cards left, the last one being the top of the pile."""
+        return tuple(self.__template_ids)
+
+    def copy(self) -> Deck:
+        """Returns a copy of the deck, drawing from it leaves the deck unchanged."""
+        deck = Deck(())
+        deck.__template_ids = list(self.__template_ids)
+        deck.__zobrist = self.__zobrist
+        return deck
+
+    @property
+    def zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the cards left, in their order."""
+        if self.__zobrist is None:
+            self.__zobrist = 0
+            for position, template_id in enumerate(self.__template_ids):
+                self.__zobrist ^= deck_key(template_id, position)
+        return self.__zobrist
+
+    def peek(self) -> CardTemplate | None:
+        """Returns the template of the top card without drawing it, or None if empty."""
+        if not self.__template_ids:
+            return None
+        return self.__templates[self.__template_ids[-1]]
+
+    def draw(self) -> Card:
+        """Draws the top card of the deck.
+
+        Raises:
+            IndexError: If the deck is empty.
+        """
+        if not self.__template_ids:
+            msg = "Cannot draw from an empty deck."
+            raise IndexError(msg)
+        template_id = self.__template_ids.pop()
+        if self.__zobrist is not None:
+            self.__zobrist ^= deck_key(template_id, len(self.__template_ids))
+        return self.__templates[template_id].create()
+
+    def deal(self, count: int) -> list[Card]:
+        """Draws up to count cards at once, in the order they would be drawn one by one."""
+        if count <= 0:
+            return []
+        dealt_ids = self.__template_ids[-count:]
+        del self.__template_ids[-count:]
+        if self.__zobrist is not None:
+            for position, template_id in enumerate(dealt_ids, len(self.__template_ids)):
+                self.__zobrist ^= deck_key(template_id, position)
+        return [self.__templates[template_id].create() for template_id in reversed(dealt_ids)]
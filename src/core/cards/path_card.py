@@ -1,22 +1,120 @@
 """This module defines the base class for path cards in the game."""
 
-from json import load
-from pathlib import Path
-from random import shuffle
+from __future__ import annotations
+
+from random import Random
 
 from src.core.cards.card import Card
+from src.core.cards.catalog import get_catalog
+
+# Sides in clockwise order, the side at index i is represented by the bit 1 << i.
+SIDES = ("UP", "RIGHT", "DOWN", "LEFT")
+
+# Side bits seen after a 180 degrees rotation, indexed by a 4-bit set of sides.
+# Since the sides are in clockwise order, this is a rotation of the bits by two positions.
+# It also maps a set of sides to the sides of the adjacent cards facing them.
+FLIPPED_SIDES = tuple(((sides << 2) | (sides >> 2)) & 0b1111 for sides in range(16))
 
-with Path("src/core/cards/cards_data.json").open(encoding="utf-8") as file:
-    path_card_data = load(file)["path_card"]
+_DEAD_END_SHIFT = 4
+_SECOND_PATH_SHIFT = 8
+_MASK_SIZE = 1 << 12
+_FLIPPED_MASKS = tuple(
+    FLIPPED_SIDES[mask & 0b1111]
+    | FLIPPED_SIDES[(mask >> _DEAD_END_SHIFT) & 0b1111] << _DEAD_END_SHIFT
+    | FLIPPED_SIDES[mask >> _SECOND_PATH_SHIFT] << _SECOND_PATH_SHIFT
+    for mask in range(_MASK_SIZE)
+)
+
+
+_shared_connections: dict[int, CardConnections] = {}
 
 
 class CardConnections:
-    """Enum-like class for card connections."""
+    """Immutable connections of a path card, encoded as a bitmask.
+
+    Each side is either closed (0), open on the main path (1), open on a second path
+    independent from the first one (2), or a dead end (-1). The mask holds three 4-bit sets
+    of sides: the sides with an edge (any non-zero value), the dead ends and the sides on
+    the second path.
+
+    Instances are shared: use from_dict or from_mask to get the connections for a mask.
+    """
+
+    __slots__ = ("__edges", "__mask", "__open_sides", "__side_paths")
+
+    def __init__(self, mask: int = 0) -> None:
+        """Initializes CardConnections from its bitmask."""
+        if not 0 <= mask < _MASK_SIZE:
+            raise ValueError(f"Invalid connections mask: {mask}.")
+        self.__mask = mask
+        self.__edges = mask & 0b1111
+        dead_ends = (mask >> _DEAD_END_SHIFT) & 0b1111
+        second_path = mask >> _SECOND_PATH_SHIFT
+        first_path = self.__edges & ~dead_ends & ~second_path
+        self.__open_sides = first_path | second_path
+        side_paths = []
+        for index in range(len(SIDES)):
+            bit = 1 << index
+            side_paths.append(
+                first_path if first_path & bit else second_path if second_path & bit else 0
+            )
+        self.__side_paths = tuple(side_paths)
+
+    @property
+    def mask(self) -> int:
+        """Returns the bitmask encoding the connections."""
+        return self.__mask
 
-    UP = int
-    RIGHT = int
-    DOWN = int
-    LEFT = int
+    @property
+    def edges(self) -> int:
+        """Returns the set of sides with an edge, open or dead end."""
+        return self.__edges
+
+    @property
+    def open_sides(self) -> int:
+        """Returns the set of sides open on a path, excluding dead ends."""
+        return self.__open_sides
+
+    @property
+    def side_paths(self) -> tuple[int, int, int, int]:
+        """Returns, for each side, the set of sides on the same path (0 if not open)."""
+        return self.__side_paths
+
+    @property
+    def flipped(self) -> CardConnections:
+        """Returns the connections rotated by 180 degrees."""
+        return CardConnections.from_mask(_FLIPPED_MASKS[self.__mask])
+
+    @property
+    def UP(self) -> int:  # noqa: N802
+        """Returns the connection value of the top side."""
+        return self.__value(0)
+
+    @property
+    def RIGHT(self) -> int:  # noqa: N802
+        """Returns the connection value of the right side."""
+        return self.__value(1)
+
+    @property
+    def DOWN(self) -> int:  # noqa: N802
+        """Returns the connection value of the bottom side."""
+        return self.__value(2)
+
+    @property
+    def LEFT(self) -> int:  # noqa: N802
+        """Returns the connection value of the left side."""
+        return self.__value(3)
+
+    def __value(self, index: int) -> int:
+        """Decodes the connection value of the side at the given index."""
+        bit = 1 << index
+        if not self.__edges & bit:
+            return 0
+        if (self.__mask >> _DEAD_END_SHIFT) & bit:
+            return -1
+        if (self.__mask >> _SECOND_PATH_SHIFT) & bit:
+            return 2
+        return 1
 
     def __repr__(self) -> str:
         """Returns a string representation of the CardConnections."""
@@ -28,74 +126,100 @@ class CardConnections:
         """Checks equality between two CardConnections instances."""
         if not isinstance(other, CardConnections):
             return False
-        if self is other:
-            return True
-        return (
-            self.UP == other.UP
-            and self.RIGHT == other.RIGHT
-            and self.DOWN == other.DOWN
-            and self.LEFT == other.LEFT
-        )
+        return self.__mask == other.__mask
 
     def __hash__(self) -> int:
         """Returns the hash of the CardConnections instance."""
-        return hash((self.UP, self.RIGHT, self.DOWN, self.LEFT))
+        return hash(self.__mask)
 
     @classmethod
-    def from_dict(cls, data: dict[str:int]) -> "CardConnections":
-        """Creates a CardConnections instance from a dictionary."""
-        connections = cls()
-        connections.UP = data.get("UP", 0)
-        connections.RIGHT = data.get("RIGHT", 0)
-        connections.DOWN = data.get("DOWN", 0)
-        connections.LEFT = data.get("LEFT", 0)
+    def from_mask(cls, mask: int) -> CardConnections:
+        """Returns the shared CardConnections instance for a bitmask."""
+        connections = _shared_connections.get(mask)
+        if connections is None:
+            connections = _shared_connections[mask] = cls(mask)
         return connections
 
+    @classmethod
+    def from_dict(cls, data: dict[str, int]) -> CardConnections:
+        """Creates a CardConnections instance from a dictionary."""
+        mask = 0
+        for index, side in enumerate(SIDES):
+            value = data.get(side, 0)
+            if value == 0:
+                continue
+            if value not in {-1, 1, 2}:
+                raise ValueError(f"Invalid connection value for {side}: {value}.")
+            mask |= 1 << index
+            if value == -1:
+                mask |= 1 << (index + _DEAD_END_SHIFT)
+            elif value == 2:
+                mask |= 1 << (index + _SECOND_PATH_SHIFT)
+        return cls.from_mask(mask)
+
 
 class PathCard(Card):
     """Card representing the path taken by miners exploring the mine.
     These cards can be placed on the game board."""
 
+    __slots__ = ("_connections", "_flipped")
+
     def __init__(self, name: str, connections: CardConnections) -> None:
         """Initializes a PathCard with a name and its connections."""
         self._connections = connections
+        self._flipped = False
         super().__init__(name)
 
     @classmethod
-    def from_dict(cls, name: str, connections_dict: dict[str:int]) -> "PathCard":
+    def from_dict(cls, name: str, connections_dict: dict[str, int]) -> PathCard:
         """Creates a PathCard instance from a dictionary of connections."""
         connections = CardConnections.from_dict(connections_dict)
         return cls(name, connections)
 
+    def __copy__(self) -> PathCard:
+        """Returns a copy of the card, faster than the generic copy."""
+        card = self.__class__.__new__(self.__class__)
+        card._copy_from(self)  # noqa: SLF001  # same class, the card is not initialized yet
+        return card
+
+    def _copy_from(self, other: PathCard) -> None:
+        """Sets the attributes of an uninitialized card from another card of its class."""
+        self._name = other._name
+        self._connections = other._connections
+        self._flipped = other._flipped
+
     def flip(self) -> None:
         """Flips the card 180 degrees."""
-        self._connections = CardConnections.from_dict(
-            {
-                "UP": self._connections.DOWN,
-                "RIGHT": self._connections.LEFT,
-                "DOWN": self._connections.UP,
-                "LEFT": self._connections.RIGHT,
-            }
-        )
+        self._connections = self._connections.flipped
+        self._flipped = not self._flipped
 
     @property
     def connections(self) -> CardConnections:
         """Returns the connections of the path card."""
         return self._connections
 
+    @property
+    def is_flipped(self) -> bool:
+        """Returns True if the card is flipped compared to its catalog orientation."""
+        return self._flipped
+
 
 class StartCard(PathCard):
     """Card representing the starting point of the miners' path."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initializes a StartCard with predefined connections."""
-        connections = CardConnections.from_dict(path_card_data["START"]["connections"])
+        connections = CardConnections.from_dict(get_catalog()["path_card"]["START"]["connections"])
         super().__init__("START", connections)
 
 
 class GoalCard(PathCard):
     """Card representing a goal that miners can achieve."""
 
+    __slots__ = ("__is_visible", "__real_connections", "__real_name")
+
     def __init__(self, name: str, connections: CardConnections) -> None:
         """Initializes a GoalCard with a name and its connections.
         A goal card is initially face down (not visible).
@@ -105,14 +229,25 @@ class GoalCard(PathCard):
         self.__is_visible = False
         self.__real_name = name
         self.__real_connections = connections
-        hidden_connections = CardConnections.from_dict(path_card_data["GOAL"]["connections"])
+        hidden_connections = CardConnections.from_dict(
+            get_catalog()["path_card"]["GOAL"]["connections"]
+        )
         super().__init__("GOAL", hidden_connections)
 
+    def _copy_from(self, other: GoalCard) -> None:
+        """Sets the attributes of an uninitialized goal card from another goal card."""
+        super()._copy_from(other)
+        self.__is_visible = other.__is_visible
+        self.__real_name = other.__real_name
+        self.__real_connections = other.__real_connections
+
     def reveal(self) -> None:
         """Reveals the goal card, making its real connections visible."""
         self.__is_visible = True
         self._name = self.__real_name
         self._connections = self.__real_connections
+        if self._flipped:
+            self._connections = self._connections.flipped
 
     @property
     def is_visible(self) -> bool:
@@ -124,8 +259,15 @@ class GoalCard(PathCard):
         return self.__real_name
 
 
-def get_3_goal_cards() -> list[GoalCard]:
-    """Returns a shuffled list of the 3 goal cards."""
+def get_3_goal_cards(rng: Random | None = None) -> list[GoalCard]:
+    """Returns a shuffled list of the 3 goal cards.
+    Args:
+        rng (Random | None): The random generator used to shuffle, a new one if None.
+    """
     goal_names = ["ST-UL", "ST-UR", "END"]
-    shuffle(goal_names)
-    return [GoalCard(name, CardConnections.from_dict(path_card_data[name])) for name in goal_names]
+    (rng or Random()).shuffle(goal_names)
+    path_card_data = get_catalog()["path_card"]
+    return [
+        GoalCard(name, CardConnections.from_dict(path_card_data[name]["connections"]))
+        for name in goal_names
+    ]
@@ -1,19 +1,28 @@
 """This module contains role-related classes, functions, and data."""
 
-from json import load
-from pathlib import Path
-from random import shuffle
+from __future__ import annotations
 
-with Path("src/core/cards/cards_data.json").open(encoding="utf-8") as file:
-    roles = load(file)["roles"]
+from random import Random
+
+from src.core.cards.catalog import get_catalog
 
 
 class Role:
     """Class representing a player role in the game."""
 
-    NAME: str
-    DESCRIPTION: str
-    TEAM: str
+    __slots__ = ("DESCRIPTION", "NAME", "TEAM")
+
+    NAME: str | None
+    DESCRIPTION: str | None
+    TEAM: str | None
+
+    def __init__(
+        self, name: str | None = None, description: str | None = None, team: str | None = None
+    ) -> None:
+        """Initializes a Role, its attributes being None if not given."""
+        self.NAME = name
+        self.DESCRIPTION = description
+        self.TEAM = team
 
     def __repr__(self) -> str:
         """Returns a string representation of the Role."""
@@ -35,22 +44,31 @@ class Role:
 def get_all_roles() -> list[Role]:
     """Returns a list of all available role names."""
     all_roles = list[Role]()
-    for role_name, role_info in roles.items():
-        for _ in range(role_info.get("number", 1)):
-            all_roles.append(Role())
-            all_roles[-1].NAME = role_name
-            all_roles[-1].DESCRIPTION = role_info.get("description")
-            all_roles[-1].TEAM = role_info.get("team")
+    for role_name, role_info in get_catalog()["roles"].items():
+        all_roles.extend(
+            Role(role_name, role_info.get("description"), role_info.get("team"))
+            for _ in range(role_info.get("number", 1))
+        )
     return all_roles
 
 
-def get_random_roles(num_players: int) -> list[Role]:
+def get_role(name: str) -> Role:
+    """Returns the role with the given name.
+    Raises:
+        KeyError: If no role of the catalog has this name.
+    """
+    role_info = get_catalog()["roles"][name]
+    return Role(name, role_info.get("description"), role_info.get("team"))
+
+
+def get_random_roles(num_players: int, rng: Random | None = None) -> list[Role]:
     """Returns a list of random role names for the specified number of players.
     Args:
         num_players (int): The number of players in the game.
+        rng (Random | None): The random generator used to shuffle, a new one if None.
     Returns:
         list[Role]: A list of Role objects representing the roles assigned to players.
     """
     available_roles = get_all_roles()
-    shuffle(available_roles)
+    (rng or Random()).shuffle(available_roles)
     return available_roles[:num_players]
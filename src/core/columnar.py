@@ -0,0 +1,342 @@
+"""
+This module contains the columnar export of the turns played, for analysis at scale.
+
+A ColumnarWriter is a telemetry sink, see the telemetry module, storing each card played as a
+row of a fixed schema: the seed of the round, the turn, the seat of the player, the template
+id of the card, the action, the position, whether the card was flipped and the outcome of the
+round for the player. The rows of a round are stored once the round is over, its outcome being
+known then.
+
+A dataset is a directory holding one file of raw little-endian values per column, appended to
+in batches, and a JSON header giving the schema and the number of rows. The header is written
+after the columns, so that the rows written since the last header by an interrupted writer are
+ignored. A ColumnarReader maps the files in memory and returns each column as a memoryview,
+or as a NumPy memmap with the optional NumPy dependency: scanning a column reads no text and
+copies nothing.
+
+Convert telemetry files to a dataset with:
+
+    python -m src.core.columnar telemetry/ turns/
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import sys
+from argparse import ArgumentParser
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from src.core.telemetry import (
+    DEFAULT_PREFIX,
+    DISCARD_ACTION,
+    PATH_ACTION,
+    PLAY_ACTION,
+    CardPlayed,
+    RoundEnded,
+    event_from_dict,
+    iter_records,
+)
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, see the analytics extra
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from numpy.typing import NDArray
+    from typing_extensions import Self
+
+    from src.core.telemetry import TelemetryEvent
+
+HEADER_NAME = "header.json"
+FORMAT_VERSION = 2
+DEFAULT_BATCH_SIZE = 65536
+
+# Codes of the action column, and value of the row and column of the cards not played on a cell
+ACTIONS = (PATH_ACTION, PLAY_ACTION, DISCARD_ACTION)
+NO_POSITION = -(2**31)
+# Value of the template id column for the cards which are not part of the catalog
+NO_TEMPLATE = -1
+
+
+class Column(NamedTuple):
+    """A column of the schema, with the array type code and NumPy dtype of its values."""
+
+    name: str
+    typecode: str
+    dtype: str
+
+
+TURN_SCHEMA = (
+    Column("round_seed", "Q", "<u8"),
+    Column("turn", "I", "<u4"),
+    Column("seat", "B", "u1"),
+    Column("template_id", "h", "<i2"),
+    Column("action", "B", "u1"),
+    Column("row", "i", "<i4"),
+    Column("column", "i", "<i4"),
+    Column("flipped", "B", "u1"),
+    Column("outcome", "B", "u1"),
+)
+
+
+def _read_header(directory: Path) -> dict | None:
+    """Returns the header of a dataset, None if the directory has none."""
+    path = directory / HEADER_NAME
+    if not path.exists():
+        return None
+    with path.open(encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _check_header(header: dict | None) -> None:
+    """Checks that a header, if any, describes the turn schema, the values of the files
+    being in the byte order of this machine.
+
+    Raises:
+        ValueError: If the version or the columns of the dataset differ, or if this machine
+                    is not little-endian.
+    """
+    if sys.byteorder != "little":
+        msg = "Datasets can only be used on little-endian machines."
+        raise ValueError(msg)
+    if header is None:
+        return
+    columns = [Column(*column) for column in header["columns"]]
+    if header["version"] != FORMAT_VERSION or columns != list(TURN_SCHEMA):
+        msg = "The dataset does not have the schema of the turns."
+        raise ValueError(msg)
+
+
+class ColumnarWriter:
+    """Writes the turns of the rounds recorded by telemetry to a columnar dataset.
+
+    The rows are buffered and appended to the column files in batches. A writer opening an
+    existing dataset appends to it, the rows beyond its header being dropped first. The rows
+    of the rounds not over when the writer is closed are not written.
+    """
+
+    def __init__(self, directory: str | Path, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """Initializes a ColumnarWriter, creating the dataset if needed.
+
+        Args:
+            directory (str | Path): The directory of the dataset.
+            batch_size (int): The number of rows buffered before they are written.
+
+        Raises:
+            ValueError: If the directory holds a dataset with another schema.
+        """
+        self.__directory = Path(directory)
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        self.__batch_size = batch_size
+        header = _read_header(self.__directory)
+        _check_header(header)
+        self.__rows = 0 if header is None else header["rows"]
+        for column in TURN_SCHEMA:
+            with (self.__directory / f"{column.name}.bin").open("ab") as file:
+                file.truncate(self.__rows * array(column.typecode).itemsize)
+        self.__buffers = [array(column.typecode) for column in TURN_SCHEMA]
+        # Rows of each round not over yet, without their outcome
+        self.__pending: dict[int, list[CardPlayed]] = {}
+        self.__write_header()
+
+    def __call__(self, event: TelemetryEvent) -> None:
+        """Records an event, see TelemetrySink."""
+        if isinstance(event, CardPlayed):
+            self.__pending.setdefault(event.round_seed, []).append(event)
+        elif isinstance(event, RoundEnded):
+            self.__add_round(event)
+
+    def __enter__(self) -> Self:
+        """Returns the writer, closed when the context exits."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Writes the buffered rows."""
+        self.close()
+
+    @property
+    def rows(self) -> int:
+        """Returns the number of rows written or buffered so far."""
+        return self.__rows + len(self.__buffers[0])
+
+    def add_files(self, paths: Iterable[str | Path]) -> None:
+        """Records the events of telemetry files, streamed a line at a time."""
+        for record in iter_records(paths):
+            self(event_from_dict(record))
+
+    def flush(self) -> None:
+        """Appends the buffered rows to the column files, then updates the header."""
+        if not self.__buffers[0]:
+            return
+        for column, buffer in zip(TURN_SCHEMA, self.__buffers):
+            with (self.__directory / f"{column.name}.bin").open("ab") as file:
+                buffer.tofile(file)
+        self.__rows += len(self.__buffers[0])
+        self.__buffers = [array(column.typecode) for column in TURN_SCHEMA]
+        self.__write_header()
+
+    def close(self) -> None:
+        """Writes the buffered rows, dropping the rows of the rounds not over."""
+        self.flush()
+        self.__pending.clear()
+
+    def __add_round(self, ended: RoundEnded) -> None:
+        """Buffers the rows of a round which is over, with the outcome of each player."""
+        winning_teams = set(ended.winning_teams)
+        (
+            round_seeds,
+            turns,
+            seats,
+            template_ids,
+            actions,
+            rows,
+            columns,
+            flipped,
+            outcomes,
+        ) = self.__buffers
+        for played in self.__pending.pop(ended.round_seed, ()):
+            round_seeds.append(played.round_seed)
+            turns.append(played.turn)
+            seats.append(played.seat)
+            template_ids.append(NO_TEMPLATE if played.template_id is None else played.template_id)
+            actions.append(ACTIONS.index(played.action))
+            rows.append(NO_POSITION if played.row is None else played.row)
+            columns.append(NO_POSITION if played.column is None else played.column)
+            flipped.append(played.flipped)
+            outcomes.append(ended.teams[played.seat] in winning_teams)
+        if len(round_seeds) >= self.__batch_size:
+            self.flush()
+
+    def __write_header(self) -> None:
+        """Replaces the header of the dataset, in one step."""
+        header = {
+            "version": FORMAT_VERSION,
+            "rows": self.__rows,
+            "columns": [list(column) for column in TURN_SCHEMA],
+            "actions": list(ACTIONS),
+            "no_position": NO_POSITION,
+            "no_template": NO_TEMPLATE,
+        }
+        path = self.__directory / HEADER_NAME
+        temporary = path.with_suffix(".tmp")
+        with temporary.open("w", encoding="utf-8") as file:
+            json.dump(header, file, indent=2)
+        temporary.replace(path)
+
+
+class ColumnarReader:
+    """Maps the columns of a dataset in memory, read without being copied.
+
+    The memoryviews returned by a reader are released when it is closed.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initializes a ColumnarReader from the header of a dataset.
+
+        Raises:
+            FileNotFoundError: If the directory holds no dataset.
+            ValueError: If the dataset does not have the schema of the turns.
+        """
+        self.__directory = Path(directory)
+        header = _read_header(self.__directory)
+        if header is None:
+            msg = f"No dataset in {self.__directory}."
+            raise FileNotFoundError(msg)
+        _check_header(header)
+        self.__rows = header["rows"]
+        self.__columns = {column.name: column for column in TURN_SCHEMA}
+        self.__maps: list[mmap.mmap] = []
+        self.__views: list[memoryview] = []
+
+    def __len__(self) -> int:
+        """Returns the number of rows of the dataset."""
+        return self.__rows
+
+    def __enter__(self) -> Self:
+        """Returns the reader, closed when the context exits."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Releases the views and the mapped files."""
+        self.close()
+
+    @property
+    def columns(self) -> list[str]:
+        """Returns the names of the columns, in the order of the schema."""
+        return list(self.__columns)
+
+    def column(self, name: str) -> memoryview:
+        """Returns the values of a column, as a memoryview of the mapped file.
+
+        Raises:
+            KeyError: If the schema has no column with this name.
+        """
+        column = self.__columns[name]
+        if not self.__rows:  # empty files cannot be mapped
+            return memoryview(array(column.typecode))
+        with (self.__directory / f"{name}.bin").open("rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__maps.append(mapped)
+        raw = memoryview(mapped)[: self.__rows * array(column.typecode).itemsize]
+        view = raw.cast(column.typecode)
+        self.__views += [view, raw]
+        return view
+
+    def numpy_column(self, name: str) -> NDArray:
+        """Returns the values of a column, as a read-only NumPy memmap.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            KeyError: If the schema has no column with this name.
+        """
+        if np is None:
+            msg = "NumPy columns require NumPy, install the analytics extra."
+            raise ImportError(msg)
+        column = self.__columns[name]
+        if not self.__rows:
+            return np.empty(0, dtype=column.dtype)
+        return np.memmap(
+            self.__directory / f"{name}.bin", dtype=column.dtype, mode="r", shape=(self.__rows,)
+        )
+
+    def close(self) -> None:
+        """Releases the views returned by the reader and the mapped files."""
+        for view in self.__views:
+            view.release()
+        for mapped in self.__maps:
+            mapped.close()
+        self.__views.clear()
+        self.__maps.clear()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Converts the telemetry files of a directory to a columnar dataset."""
+    parser = ArgumentParser(description="Converts telemetry files to a columnar dataset.")
+    parser.add_argument("telemetry", type=Path)
+    parser.add_argument("dataset", type=Path)
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX)
+    args = parser.parse_args(argv)
+    with ColumnarWriter(args.dataset) as writer:
+        writer.add_files(sorted(args.telemetry.glob(f"{args.prefix}-[0-9]*.ndjson")))
+    print(f"{writer.rows} rows in {args.dataset}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+This module contains the deltas, the compact changes emitted by the board and the players.
+
+A client holding a copy of a game applies the deltas in the order they were emitted to keep
+its copy up to date, instead of receiving the whole board after each move. Positions are
+relative to the board after the change, so that a BoardExpanded delta always comes before
+the delta of the card which needed the expansion.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Union
+
+from src.core.cards.card_template import get_card_template
+
+if TYPE_CHECKING:
+    from src.core.cards.card import Card
+
+
+class CardPlaced(NamedTuple):
+    """A path card has been placed on the board."""
+
+    row: int
+    column: int
+    template_id: int | None
+    flipped: bool
+
+
+class CardRemoved(NamedTuple):
+    """A path card has been removed from the board."""
+
+    row: int
+    column: int
+
+
+class BoardExpanded(NamedTuple):
+    """The board has grown by some rows or columns in a direction."""
+
+    direction: str
+    amount: int = 1
+
+
+class GoalRevealed(NamedTuple):
+    """A goal card has been revealed, and possibly flipped to connect to the path."""
+
+    row: int
+    column: int
+    template_id: int | None
+    flipped: bool
+
+
+class CardDrawn(NamedTuple):
+    """A card has been added to the end of the hand of a player."""
+
+    player: str
+    template_id: int | None
+
+
+class CardDiscarded(NamedTuple):
+    """A card has been removed from the hand of a player, by its index in the hand."""
+
+    player: str
+    hand_index: int
+
+
+class HandEmptied(NamedTuple):
+    """Every card of the hand of a player has been removed."""
+
+    player: str
+
+
+class BenchCardAdded(NamedTuple):
+    """A card has been added to the end of the bench of a player."""
+
+    player: str
+    template_id: int | None
+
+
+class BenchCardRemoved(NamedTuple):
+    """A card has been removed from the bench of a player, by its index in the bench."""
+
+    player: str
+    bench_index: int
+
+
+class RoundStarted(NamedTuple):
+    """A new round has started on a new board, with its start and hidden goal cards."""
+
+    round_number: int
+    rows: int
+    columns: int
+
+
+Delta = Union[
+    CardPlaced,
+    CardRemoved,
+    BoardExpanded,
+    GoalRevealed,
+    CardDrawn,
+    CardDiscarded,
+    HandEmptied,
+    BenchCardAdded,
+    BenchCardRemoved,
+    RoundStarted,
+]
+DeltaListener = Callable[[Delta], None]
+
+
+class DeltaSource:
+    """Base class of the objects emitting deltas to their listeners.
+    Subclasses check that there are listeners before creating a delta, so that emitting
+    costs nothing when nobody listens."""
+
+    __slots__ = ("_listeners",)
+
+    def __init__(self) -> None:
+        """Initializes a DeltaSource without listeners."""
+        self._listeners: list[DeltaListener] = []
+
+    def add_listener(self, listener: DeltaListener) -> None:
+        """Registers a function called with each delta emitted."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: DeltaListener) -> None:
+        """Unregisters a function registered with add_listener."""
+        self._listeners.remove(listener)
+
+    def _emit(self, delta: Delta) -> None:
+        """Sends a delta to every listener."""
+        for listener in self._listeners:
+            listener(delta)
+
+
+def template_id_of(card: Card) -> int | None:
+    """Returns the template id of a card, None for a card which is not part of the catalog."""
+    try:
+        return get_card_template(card).template_id
+    except KeyError:
+        return None
+
+
+def delta_to_dict(delta: Delta, *, public: bool = False) -> dict[str, Any]:
+    """Returns a delta as JSON serializable data, with its type name.
+
+    Args:
+        delta (Delta): The delta to convert.
+        public (bool): Hides the cards drawn by the players, for spectators.
+    """
+    data = delta._asdict()
+    if public and isinstance(delta, CardDrawn):
+        data["template_id"] = None
+    return {"type": type(delta).__name__, **data}
@@ -0,0 +1,289 @@
+"""
+This module contains the effects of the action cards.
+
+Each effect named in the catalog is a stateless handler, registered once and shared by every
+card with this effect: it checks the target of a played card, then applies the card to the
+round. The handler of a card is found by its template id in a table compiled from the
+catalog, so playing a card costs a lookup instead of a closure stored in every card.
+
+The effects of the catalog are:
+
+    break        Puts the card on the bench of a player, breaking the tools of the card.
+    repair       Removes from the bench of a player a card breaking a tool of the card.
+    rockfall     Removes a path card from the board.
+    map          Shows a goal card to the player.
+    spy          Lets the player look at the hand of another player, shown by the interface.
+    change_role  Gives a player a new role, drawn among the roles not in play.
+
+Action cards made outside of the catalog put offensive cards on the bench of their target,
+and perform the action of the card otherwise.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Callable, ClassVar, NamedTuple
+
+from src.core.cards.card_template import get_card_template, get_card_templates
+from src.core.cards.roles import get_all_roles
+
+if TYPE_CHECKING:
+    from src.core.cards.action_card import ActionCard
+    from src.core.cards.card_template import CardTemplate
+    from src.core.player import Player
+    from src.core.round import Round
+
+
+class EffectTarget(Enum):
+    """Enumeration of what an action card is played on."""
+
+    NONE = auto()
+    PLAYER = auto()
+    CELL = auto()
+
+
+class PlayedCard(NamedTuple):
+    """An action card played by the current player of a round, with its target."""
+
+    game_round: Round
+    player: Player
+    card: ActionCard
+    target: Player | None = None
+    row: int | None = None
+    column: int | None = None
+
+
+class Effect(ABC):
+    """Base class of the effects, stateless handlers shared by every card with the effect."""
+
+    __slots__ = ()
+
+    TARGET: ClassVar[EffectTarget] = EffectTarget.NONE
+
+    def check(self, played: PlayedCard) -> tuple[bool, str]:
+        """Checks that a card can be played on its target, without changing the round.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        if self.TARGET is EffectTarget.PLAYER and all(
+            played.target is not player for player in played.game_round.players
+        ):
+            return False, "This card must target a player of the round."
+        if self.TARGET is EffectTarget.CELL and (played.row is None or played.column is None):
+            return False, "This card must target a position of the board."
+        return True, "The card can be played."
+
+    @abstractmethod
+    def apply(self, played: PlayedCard) -> None:
+        """Applies a checked card, already removed from the hand of the player."""
+
+
+EFFECTS: dict[str, Effect] = {}
+
+
+def register_effect(name: str) -> Callable[[type[Effect]], type[Effect]]:
+    """Returns a class decorator registering an effect under the name used by the catalog.
+
+    Raises:
+        ValueError: If an effect is already registered under this name.
+    """
+    if name in EFFECTS:
+        msg = f"An effect is already registered as {name!r}."
+        raise ValueError(msg)
+
+    def register(effect_type: type[Effect]) -> type[Effect]:
+        EFFECTS[name] = effect_type()
+        return effect_type
+
+    return register
+
+
+@register_effect("break")
+class BreakEffect(Effect):
+    """Puts the card on the bench of a player, who stays blocked until it is repaired."""
+
+    __slots__ = ()
+
+    TARGET = EffectTarget.PLAYER
+
+    def check(self, played: PlayedCard) -> tuple[bool, str]:
+        """Checks that the target does not already have this card on their bench."""
+        result, message = super().check(played)
+        if result and played.card in played.target.bench:
+            return False, "The player already has this card on their bench."
+        return result, message
+
+    def apply(self, played: PlayedCard) -> None:
+        """Puts the card on the bench of the target."""
+        played.target.add_to_bench(played.card)
+
+
+@register_effect("repair")
+class RepairEffect(Effect):
+    """Removes from the bench of a player a card breaking one of the tools of the card."""
+
+    __slots__ = ()
+
+    TARGET = EffectTarget.PLAYER
+
+    def check(self, played: PlayedCard) -> tuple[bool, str]:
+        """Checks that one of the tools of the card is broken on the bench of the target."""
+        result, message = super().check(played)
+        if result and not played.target.can_repair(played.card):
+            return False, "The player has no broken tool this card repairs."
+        return result, message
+
+    def apply(self, played: PlayedCard) -> None:
+        """Removes the oldest card of the bench breaking a tool of the card."""
+        tools = get_card_template(played.card).tools
+        bench = played.target.bench
+        broken = next(
+            card
+            for card in bench
+            if getattr(card, "is_offensive", False)
+            and any(tool in tools for tool in get_card_template(card).tools)
+        )
+        played.target.remove_from_bench(broken)
+
+
+@register_effect("rockfall")
+class RockfallEffect(Effect):
+    """Removes a path card from the board."""
+
+    __slots__ = ()
+
+    TARGET = EffectTarget.CELL
+
+    def check(self, played: PlayedCard) -> tuple[bool, str]:
+        """Checks that the card at the target position can be removed."""
+        result, message = super().check(played)
+        if result:
+            return played.game_round.board.check_removal(played.row, played.column)
+        return result, message
+
+    def apply(self, played: PlayedCard) -> None:
+        """Removes the card at the target position."""
+        played.game_round.board.remove_card(played.row, played.column)
+
+
+@register_effect("map")
+class MapEffect(Effect):
+    """Shows a goal card to the player, without revealing it to the others."""
+
+    __slots__ = ()
+
+    TARGET = EffectTarget.CELL
+
+    def check(self, played: PlayedCard) -> tuple[bool, str]:
+        """Checks that there is a goal card at the target position."""
+        result, message = super().check(played)
+        if result and (played.row, played.column) not in played.game_round.board.goal_positions:
+            return False, "There is no goal card at this position."
+        return result, message
+
+    def apply(self, played: PlayedCard) -> None:
+        """Records that the player has seen the goal card."""
+        played.game_round.show_goal(played.player, played.row, played.column)
+
+
+@register_effect("spy")
+class SpyEffect(Effect):
+    """Lets the player look at the hand of another player.
+    The round is not changed: the hand is shown by the interface of the player."""
+
+    __slots__ = ()
+
+    TARGET = EffectTarget.PLAYER
+
+    def check(self, played: PlayedCard) -> tuple[bool, str]:
+        """Checks that the target is another player."""
+        result, message = super().check(played)
+        if result and played.target is played.player:
+            return False, "A player cannot spy on themselves."
+        return result, message
+
+    def apply(self, played: PlayedCard) -> None:
+        """Does nothing, the hand of the target being seen outside of the round."""
+
+
+@register_effect("change_role")
+class ChangeRoleEffect(Effect):
+    """Gives a player a new role, drawn with the generator of the round among the roles of
+    the catalog not held by a player."""
+
+    __slots__ = ()
+
+    TARGET = EffectTarget.PLAYER
+
+    def check(self, played: PlayedCard) -> tuple[bool, str]:
+        """Checks that a role is left to draw."""
+        result, message = super().check(played)
+        if result and not _free_roles(played.game_round):
+            return False, "There is no role left to draw."
+        return result, message
+
+    def apply(self, played: PlayedCard) -> None:
+        """Replaces the role of the target by a free role."""
+        played.target.role = played.game_round.rng.choice(_free_roles(played.game_round))
+
+
+@register_effect("custom")
+class CustomEffect(Effect):
+    """Performs the action of a card made outside of the catalog."""
+
+    __slots__ = ()
+
+    def apply(self, played: PlayedCard) -> None:
+        """Calls the action of the card."""
+        played.card.perform_action()
+
+
+def _free_roles(game_round: Round) -> list:
+    """Returns the roles of the catalog not held by a player of a round."""
+    roles = get_all_roles()
+    for player in game_round.players:
+        if player.role in roles:
+            roles.remove(player.role)
+    return roles
+
+
+class _CompiledEffects:
+    """Holds the effect of each template of the catalog currently in use."""
+
+    templates: tuple[CardTemplate, ...] = ()
+    effects: tuple[Effect | None, ...] = ()
+
+
+def _compile() -> None:
+    """Compiles the table of the effects by template id, if the catalog changed.
+
+    Raises:
+        ValueError: If a card of the catalog has an effect which is not registered.
+    """
+    templates = get_card_templates()
+    if _CompiledEffects.templates is templates:
+        return
+    effects = []
+    for template in templates:
+        if template.effect is not None and template.effect not in EFFECTS:
+            msg = f"Unknown effect {template.effect!r} of the card {template.name!r}."
+            raise ValueError(msg)
+        effects.append(EFFECTS.get(template.effect))
+    _CompiledEffects.templates = templates
+    _CompiledEffects.effects = tuple(effects)
+
+
+def effect_of(card: ActionCard) -> Effect:
+    """Returns the effect of an action card, found by its template id."""
+    _compile()
+    try:
+        template = get_card_template(card)
+    except KeyError:  # not part of the catalog
+        effect = None
+    else:
+        effect = _CompiledEffects.effects[template.template_id]
+    if effect is None:
+        return EFFECTS["break"] if card.is_offensive else EFFECTS["custom"]
+    return effect
@@ -6,11 +6,46 @@ The game is managed through a state machine that transitions between different p
 from __future__ import annotations
 
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from random import Random
+from secrets import randbits
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+
+from src.core.action_log import ActionLog
+from src.core.cards.action_card import ActionCard
+from src.core.cards.path_card import PathCard
+from src.core.deltas import RoundStarted
+from src.core.effects import EffectTarget, PlayedCard, effect_of
+from src.core.inputs import (
+    CancelAction,
+    ChooseAction,
+    ChooseCards,
+    ChoosePlayer,
+    GameInput,
+    NamePlayers,
+    TurnAction,
+    input_from_entry,
+)
+from src.core.player import Player
+from src.core.round import Round, check_seed
+from src.core.views import ViewCache
 
 if TYPE_CHECKING:
-    from src.core.player import Player
-    from src.core.round import Round
+    from pathlib import Path
+
+    from src.core.deltas import Delta
+    from src.core.telemetry import TelemetrySink
+    from src.core.views import PlayerView
+
+# Number of players and of rounds of a game
+MIN_PLAYERS = 3
+MAX_PLAYERS = 10
+ROUNDS_PER_GAME = 3
+
+# Score of the winners of a round, the Profiteur always winning but scoring less
+WINNER_SCORE = 2
+PROFITEUR_SCORE = 1
+PROFITEUR_TEAM = "Profiteur"
 
 
 class GameState(Enum):
@@ -27,6 +62,56 @@ class GameState(Enum):
     GAME_END = auto()
 
 
+class StepStats:
+    """Counters of the inputs handled in one state of a game, and of the time they took."""
+
+    def __init__(self) -> None:
+        """Initializes StepStats with no input handled."""
+        self.__count = 0
+        self.__rejected = 0
+        self.__total_time = 0.0
+        self.__max_time = 0.0
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the StepStats."""
+        return (
+            f"StepStats(count={self.__count}, rejected={self.__rejected}, "
+            f"mean={self.mean_time * 1e6:.1f}us, max={self.__max_time * 1e6:.1f}us)"
+        )
+
+    @property
+    def count(self) -> int:
+        """Returns the number of inputs handled, accepted or not."""
+        return self.__count
+
+    @property
+    def rejected(self) -> int:
+        """Returns the number of inputs rejected, including the unexpected ones."""
+        return self.__rejected
+
+    @property
+    def total_time(self) -> float:
+        """Returns the total time spent handling inputs, in seconds."""
+        return self.__total_time
+
+    @property
+    def max_time(self) -> float:
+        """Returns the longest time spent handling an input, in seconds."""
+        return self.__max_time
+
+    @property
+    def mean_time(self) -> float:
+        """Returns the mean time spent handling an input, in seconds."""
+        return self.__total_time / self.__count if self.__count else 0.0
+
+    def record(self, elapsed: float, *, accepted: bool) -> None:
+        """Records an input handled in the given time, in seconds."""
+        self.__count += 1
+        self.__rejected += not accepted
+        self.__total_time += elapsed
+        self.__max_time = max(self.__max_time, elapsed)
+
+
 """
 Transitions between states:
 NAMING_PLAYERS -> ROUND_BEGIN if enough players have joined and names are correctly set
@@ -36,16 +121,22 @@ CHOSE_ACTION -> CHOSE_CARDS if valid action chosen
 CHOSE_CARDS -> CHOSE_PLAYER if action requires target player
 CHOSE_CARDS -> PLAYER_TURN_END if valid card selection
 CHOSE_PLAYER -> PLAYER_TURN_END after selecting target player
+CHOSE_CARDS or CHOSE_PLAYER -> CHOSE_ACTION if the action is cancelled
 PLAYER_TURN_END -> ROUND_END if round-ending condition met
 PLAYER_TURN_END -> PLAYER_TURN_BEGIN for next player otherwise
 ROUND_END -> GAME_END if game-ending condition met
 ROUND_END -> ROUND_BEGIN for next round otherwise
 
-Possible transition inputs:
-- Player names
-- Chosen action
-- Selected cards
-- Target player
+Possible transition inputs, submitted with Game.submit (see the inputs module):
+- Player names (NamePlayers)
+- Chosen action (ChooseAction)
+- Selected cards (ChooseCards)
+- Target player (ChoosePlayer)
+- Cancelled action (CancelAction)
+
+The handler of an input is looked up in a table indexed by state and input type, so that
+unexpected inputs are rejected at once. Every accepted input is appended to the action log
+of the game, from which Game.replay rebuilds the game.
 
 Between each state, the game checks for valid transitions and updates the game state accordingly.
 Each next step will be triggered by the api call from the client.
@@ -58,13 +149,43 @@ class Game:
     Represents the overall game, managing players, rounds, and game state.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        log_path: str | Path | None = None,
+        telemetry: TelemetrySink | None = None,
+    ) -> None:
         """
         Initializes a Game with an empty list of players and sets the initial game state.
+
+        The seed of each round is drawn from a generator seeded with the given seed,
+        so that a whole game can be replayed from its seed and its action log.
+        A random seed is chosen if none is given.
+
+        Args:
+            seed (int | None): The seed of the game, a random one if None.
+            log_path (str | Path | None): The file where the action log is written,
+                                          None to keep it in memory only.
+            telemetry (TelemetrySink | None): Called with the events of every round, see
+                                              the telemetry module, None to record nothing.
+
+        Raises:
+            ValueError: If the seed is not an integer between 0 and 2**64 - 1.
         """
+        check_seed(seed)
+        self.__seed = randbits(63) if seed is None else seed
+        self.__rng = Random(self.__seed)
+        self.__rounds_started = 0
         self.__players: list[Player] = []
         self.__current_round: Round | None = None
         self.__state: GameState = GameState.NAMING_PLAYERS
+        self.__turn_action: TurnAction | None = None
+        self.__selected_card: int | None = None
+        self.__action_log = ActionLog(self.__seed, log_path)
+        self.__telemetry = telemetry
+        self.__step_stats = {state: StepStats() for state in GameState}
+        self.__deltas: list[Delta] = []
+        self.__views = ViewCache(self)
 
     @property
     def players(self) -> list[Player]:
@@ -80,3 +201,355 @@ class Game:
     def state(self) -> GameState:
         """Returns the current state of the game."""
         return self.__state
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed of the random generator of the game."""
+        return self.__seed
+
+    @property
+    def rounds_started(self) -> int:
+        """Returns the number of rounds started so far."""
+        return self.__rounds_started
+
+    @property
+    def turn_action(self) -> TurnAction | None:
+        """Returns the action chosen by the current player, None before it is chosen."""
+        return self.__turn_action
+
+    @property
+    def action_log(self) -> ActionLog:
+        """Returns the log of the inputs accepted by the game."""
+        return self.__action_log
+
+    @property
+    def step_stats(self) -> dict[GameState, StepStats]:
+        """Returns the counters of the inputs submitted in each state, replays excluded."""
+        return self.__step_stats
+
+    def view_for(self, player: Player) -> PlayerView:
+        """Returns what a player of the game is allowed to see, as a read-only view.
+
+        The view is created once per player and stays up to date with the game, its parts
+        being rebuilt only when the deltas of the game show that they changed.
+
+        Raises:
+            ValueError: If the player is not a player of the game.
+        """
+        return self.__views.view_for(player)
+
+    def drain_deltas(self) -> list[Delta]:
+        """Returns the deltas emitted by the board and the players since the last call."""
+        deltas = self.__deltas
+        self.__deltas = []
+        return deltas
+
+    @property
+    def expected_inputs(self) -> tuple[type[GameInput], ...]:
+        """Returns the types of input accepted in the current state."""
+        return tuple(
+            input_type for state, input_type in self.__TRANSITIONS if state == self.__state
+        )
+
+    def to_state(self) -> dict[str, Any]:
+        """Exports the game as plain data, see the snapshot module for compact formats.
+        The action log is not part of the exported state.
+
+        Returns:
+            dict[str, Any]: The seed, number of rounds started and state of the game,
+                            the choices of the current turn, its players and its current
+                            round, if any.
+        """
+        return {
+            "seed": self.__seed,
+            "rounds_started": self.__rounds_started,
+            "state": self.__state.name,
+            "turn_action": None if self.__turn_action is None else self.__turn_action.name,
+            "selected_card": self.__selected_card,
+            "players": [player.to_state() for player in self.__players],
+            "round": None if self.__current_round is None else self.__current_round.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> Game:
+        """Restores a game exported by to_state.
+        The generator of the game is brought back to its state by drawing the seeds of the
+        rounds already started again, which is cheaper to store than the generator state."""
+        game = cls(state["seed"])
+        game.__rounds_started = state["rounds_started"]
+        for _ in range(game.__rounds_started):
+            game.__rng.getrandbits(63)
+        game.__state = GameState[state["state"]]
+        if state["turn_action"] is not None:
+            game.__turn_action = TurnAction[state["turn_action"]]
+        game.__selected_card = state["selected_card"]
+        game.players.extend(Player.from_state(player) for player in state["players"])
+        for player in game.players:
+            player.add_listener(game.__collect_delta)
+        if state["round"] is not None:
+            game.__current_round = Round.from_state(state["round"], game.players)
+            game.__current_round.board.add_listener(game.__collect_delta)
+        return game
+
+    @classmethod
+    def replay(cls, action_log: ActionLog, *, fast_forward: bool = False) -> Game:
+        """Rebuilds a game from its action log.
+
+        The returned game keeps the log, so that its next inputs are appended to it.
+
+        Args:
+            action_log (ActionLog): The log of the game to rebuild.
+            fast_forward (bool): Skips the validity checks of the inputs, for logs known to
+                                 be valid such as the logs written by a game.
+
+        Raises:
+            ValueError: If an input of the log is not accepted by the game.
+        """
+        game = cls(action_log.seed)
+        for index, entry in enumerate(action_log):
+            game_input = input_from_entry(entry)
+            handler = game.__TRANSITIONS.get((game.__state, type(game_input)))
+            if handler is None:
+                result, message = False, game.__unexpected(game_input)
+            else:
+                result, message = handler(game, game_input, trusted=fast_forward)
+            if not result:
+                msg = f"Input {index} of the log was not accepted: {message}"
+                raise ValueError(msg)
+            game.__advance()
+        game.__action_log = action_log
+        game.__deltas.clear()
+        return game
+
+    def start_round(self) -> Round:
+        """Starts a new round with the players of the game, seeded by the game generator."""
+        self.__rounds_started += 1
+        first_delta = len(self.__deltas)
+        self.__current_round = Round(
+            self.__players, seed=self.__rng.getrandbits(63), telemetry=self.__telemetry
+        )
+        board = self.__current_round.board
+        board.add_listener(self.__collect_delta)
+        # The deltas of the deal follow the start of the round
+        round_started = RoundStarted(self.__rounds_started, board.rows, board.columns)
+        self.__deltas.insert(first_delta, round_started)
+        self.__views.on_delta(round_started)
+        return self.__current_round
+
+    def __collect_delta(self, delta: Delta) -> None:
+        """Keeps a delta emitted by the board or a player until the next drain."""
+        self.__deltas.append(delta)
+        self.__views.on_delta(delta)
+
+    def submit(self, game_input: GameInput) -> tuple[bool, str]:
+        """Applies an input to the state machine, then runs the transitions needing no input.
+
+        The accepted inputs are recorded in the action log, and the time spent is added to
+        the counters of the state in which the input was submitted.
+
+        Args:
+            game_input (GameInput): The input, of a type expected in the current state.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        start = perf_counter()
+        state = self.__state
+        handler = self.__TRANSITIONS.get((state, type(game_input)))
+        if handler is None:
+            result, message = False, self.__unexpected(game_input)
+        else:
+            result, message = handler(self, game_input, trusted=False)
+            if result:
+                self.__action_log.append(game_input.KIND, *game_input.to_args())
+                self.__advance()
+        self.__step_stats[state].record(perf_counter() - start, accepted=result)
+        return result, message
+
+    def name_players(self, names: list[str]) -> tuple[bool, str]:
+        """Names the players of the game, in turn order, then starts the first round."""
+        return self.submit(NamePlayers(tuple(names)))
+
+    def choose_action(self, action: TurnAction) -> tuple[bool, str]:
+        """Chooses the action of the current player."""
+        return self.submit(ChooseAction(action))
+
+    def choose_cards(
+        self,
+        hand_index: int,
+        row: int | None = None,
+        column: int | None = None,
+        *,
+        flipped: bool = False,
+    ) -> tuple[bool, str]:
+        """Chooses the card of the current player for the chosen action.
+
+        Args:
+            hand_index (int): The index of the card in the hand of the current player.
+            row (int | None): The row where a path card is placed, or targeted by an action
+                              card played on the board.
+            column (int | None): The column where a path card is placed, or targeted by an
+                                 action card played on the board.
+            flipped (bool): Whether a path card is flipped before being placed.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        return self.submit(ChooseCards(hand_index, row, column, flipped))
+
+    def choose_player(self, seat: int) -> tuple[bool, str]:
+        """Chooses the player targeted by the chosen action card, by their seat index."""
+        return self.submit(ChoosePlayer(seat))
+
+    def cancel_action(self) -> tuple[bool, str]:
+        """Cancels the chosen action of the current player, who chooses an action again."""
+        return self.submit(CancelAction())
+
+    def __unexpected(self, game_input: GameInput) -> str:
+        """Returns the message rejecting an input not expected in the current state."""
+        return f"The input {game_input.KIND!r} is not expected in state {self.__state.name}."
+
+    def __name_players(self, game_input: NamePlayers, *, trusted: bool) -> tuple[bool, str]:
+        """Creates the players of the game, then begins the first round."""
+        names = game_input.names
+        if not trusted:
+            if not MIN_PLAYERS <= len(names) <= MAX_PLAYERS:
+                return False, f"A game needs {MIN_PLAYERS} to {MAX_PLAYERS} players."
+            if not all(isinstance(name, str) and name.strip() for name in names):
+                return False, "Player names cannot be empty."
+            if len(set(names)) != len(names):
+                return False, "Player names must be unique."
+        self.__players.extend(Player(name, None, [], []) for name in names)
+        for player in self.__players:
+            player.add_listener(self.__collect_delta)
+        self.__state = GameState.ROUND_BEGIN
+        return True, "The players have been named."
+
+    def __choose_action(self, game_input: ChooseAction, *, trusted: bool) -> tuple[bool, str]:
+        """Records the action of the current player, if they have a card allowing it."""
+        action = game_input.action
+        if not trusted:
+            player = self.__current_round.current_player
+            if action == TurnAction.PLAY_PATH:
+                if player.is_blocked():
+                    return False, "A blocked player cannot place path cards."
+                if not any(isinstance(card, PathCard) for card in player.hand):
+                    return False, "The player has no path card."
+            elif action == TurnAction.PLAY_ACTION and not any(
+                isinstance(card, ActionCard) for card in player.hand
+            ):
+                return False, "The player has no action card."
+        self.__turn_action = action
+        self.__state = GameState.CHOSE_CARDS
+        return True, "The action has been chosen."
+
+    def __choose_cards(self, game_input: ChooseCards, *, trusted: bool) -> tuple[bool, str]:
+        """Plays or discards the chosen card, or waits for a target player."""
+        hand_index, row, column, flipped = game_input
+        game_round = self.__current_round
+        hand = game_round.current_player.hand
+        if not trusted and not 0 <= hand_index < len(hand):
+            return False, "There is no card at this index of the hand."
+        card = hand[hand_index]
+
+        if self.__turn_action == TurnAction.DISCARD:
+            result, message = game_round.discard_card(card)
+        elif self.__turn_action == TurnAction.PLAY_PATH:
+            if not trusted and (row is None or column is None):
+                return False, "A path card needs a position."
+            if not trusted and not game_round.board.legal_moves([card]):
+                return False, "This card cannot be placed anywhere on the board."
+            result, message = game_round.play_path_card(
+                card, row, column, flipped=flipped, trusted=trusted
+            )
+        elif isinstance(card, ActionCard) and effect_of(card).TARGET is EffectTarget.PLAYER:
+            if not trusted and not self.__has_target(card):
+                return False, "No player can be targeted by this card."
+            self.__selected_card = hand_index
+            self.__state = GameState.CHOSE_PLAYER
+            return True, "The card needs a target player."
+        else:
+            result, message = game_round.play_action_card(card, row=row, column=column)
+        if result:
+            self.__state = GameState.PLAYER_TURN_END
+        return result, message
+
+    def __has_target(self, card: ActionCard) -> bool:
+        """Returns True if an action card of the current player can be played on a player."""
+        game_round = self.__current_round
+        player = game_round.current_player
+        effect = effect_of(card)
+        return any(
+            effect.check(PlayedCard(game_round, player, card, target))[0]
+            for target in self.__players
+        )
+
+    def __choose_player(self, game_input: ChoosePlayer, *, trusted: bool) -> tuple[bool, str]:
+        """Plays the selected action card on the chosen player."""
+        seat = game_input.seat
+        if not trusted and not 0 <= seat < len(self.__players):
+            return False, "There is no player at this seat."
+        game_round = self.__current_round
+        card = game_round.current_player.hand[self.__selected_card]
+        result, message = game_round.play_action_card(card, self.__players[seat])
+        if result:
+            self.__state = GameState.PLAYER_TURN_END
+        return result, message
+
+    def __cancel_action(
+        self,
+        game_input: CancelAction,  # noqa: ARG002  # signature shared by the handlers
+        *,
+        trusted: bool,  # noqa: ARG002
+    ) -> tuple[bool, str]:
+        """Goes back to the choice of the action, the selected card being forgotten."""
+        self.__turn_action = None
+        self.__selected_card = None
+        self.__state = GameState.CHOSE_ACTION
+        return True, "The action has been cancelled."
+
+    def __advance(self) -> None:
+        """Runs the transitions which need no input, until the game waits for one."""
+        while True:
+            if self.__state == GameState.ROUND_BEGIN:
+                self.start_round()
+                self.__state = GameState.PLAYER_TURN_BEGIN
+            elif self.__state == GameState.PLAYER_TURN_BEGIN:
+                self.__turn_action = None
+                self.__selected_card = None
+                self.__state = GameState.CHOSE_ACTION
+            elif self.__state == GameState.PLAYER_TURN_END:
+                if self.__current_round.is_over:
+                    self.__state = GameState.ROUND_END
+                else:
+                    self.__state = GameState.PLAYER_TURN_BEGIN
+            elif self.__state == GameState.ROUND_END:
+                self.__score_round()
+                if self.__rounds_started >= ROUNDS_PER_GAME:
+                    self.__state = GameState.GAME_END
+                else:
+                    self.__state = GameState.ROUND_BEGIN
+            else:
+                return
+
+    def __score_round(self) -> None:
+        """Adds the score of the round which just ended to the scores of every player."""
+        winning_teams = self.__current_round.winning_teams
+        for player in self.__players:
+            team = getattr(player.role, "TEAM", None)
+            if team == PROFITEUR_TEAM:
+                player.scores.append(PROFITEUR_SCORE)
+            elif team in winning_teams:
+                player.scores.append(WINNER_SCORE)
+            else:
+                player.scores.append(0)
+
+    # Handler of each input expected in a state, the other inputs being rejected
+    __TRANSITIONS: ClassVar[dict[tuple[GameState, type], Callable[..., tuple[bool, str]]]] = {
+        (GameState.NAMING_PLAYERS, NamePlayers): __name_players,
+        (GameState.CHOSE_ACTION, ChooseAction): __choose_action,
+        (GameState.CHOSE_CARDS, ChooseCards): __choose_cards,
+        (GameState.CHOSE_PLAYER, ChoosePlayer): __choose_player,
+        (GameState.CHOSE_CARDS, CancelAction): __cancel_action,
+        (GameState.CHOSE_PLAYER, CancelAction): __cancel_action,
+    }
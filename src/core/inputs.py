@@ -0,0 +1,127 @@
+"""
+This module contains the inputs driving the state machine of a game, see Game.submit.
+Each input type has a kind, under which it is recorded in the action log of the game.
+"""
+
+from __future__ import annotations
+
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any, NamedTuple, Union
+
+if TYPE_CHECKING:
+    from src.core.action_log import LogEntry
+
+
+class TurnAction(Enum):
+    """Enumeration of the actions a player can choose during their turn."""
+
+    PLAY_PATH = auto()
+    PLAY_ACTION = auto()
+    DISCARD = auto()
+
+
+class NamePlayers(NamedTuple):
+    """Names the players of the game, in turn order."""
+
+    names: tuple[str, ...]
+
+    KIND = "names"
+
+    def to_args(self) -> tuple[Any, ...]:
+        """Returns the JSON serializable arguments of the input."""
+        return (list(self.names),)
+
+    @classmethod
+    def from_args(cls, args: tuple[Any, ...]) -> NamePlayers:
+        """Creates the input from its logged arguments."""
+        return cls(tuple(args[0]))
+
+
+class ChooseAction(NamedTuple):
+    """Chooses the action of the current player."""
+
+    action: TurnAction
+
+    KIND = "action"
+
+    def to_args(self) -> tuple[Any, ...]:
+        """Returns the JSON serializable arguments of the input."""
+        return (self.action.name,)
+
+    @classmethod
+    def from_args(cls, args: tuple[Any, ...]) -> ChooseAction:
+        """Creates the input from its logged arguments."""
+        return cls(TurnAction[args[0]])
+
+
+class ChooseCards(NamedTuple):
+    """Chooses the card of the current player, and its position for a path card."""
+
+    hand_index: int
+    row: int | None = None
+    column: int | None = None
+    flipped: bool = False
+
+    KIND = "cards"
+
+    def to_args(self) -> tuple[Any, ...]:
+        """Returns the JSON serializable arguments of the input."""
+        return tuple(self)
+
+    @classmethod
+    def from_args(cls, args: tuple[Any, ...]) -> ChooseCards:
+        """Creates the input from its logged arguments."""
+        return cls(*args)
+
+
+class ChoosePlayer(NamedTuple):
+    """Chooses the player targeted by an action card, by their seat index."""
+
+    seat: int
+
+    KIND = "player"
+
+    def to_args(self) -> tuple[Any, ...]:
+        """Returns the JSON serializable arguments of the input."""
+        return tuple(self)
+
+    @classmethod
+    def from_args(cls, args: tuple[Any, ...]) -> ChoosePlayer:
+        """Creates the input from its logged arguments."""
+        return cls(*args)
+
+
+class CancelAction(NamedTuple):
+    """Cancels the chosen action of the current player, who chooses an action again."""
+
+    KIND = "cancel"
+
+    def to_args(self) -> tuple[Any, ...]:
+        """Returns the JSON serializable arguments of the input."""
+        return ()
+
+    @classmethod
+    def from_args(cls, args: tuple[Any, ...]) -> CancelAction:  # noqa: ARG003  # no arguments
+        """Creates the input from its logged arguments."""
+        return cls()
+
+
+GameInput = Union[NamePlayers, ChooseAction, ChooseCards, ChoosePlayer, CancelAction]
+
+INPUT_TYPES: dict[str, type[GameInput]] = {
+    input_type.KIND: input_type
+    for input_type in (NamePlayers, ChooseAction, ChooseCards, ChoosePlayer, CancelAction)
+}
+
+
+def input_from_entry(entry: LogEntry) -> GameInput:
+    """Creates the input recorded by an entry of an action log.
+
+    Raises:
+        ValueError: If the kind of the entry is unknown.
+    """
+    input_type = INPUT_TYPES.get(entry.kind)
+    if input_type is None:
+        msg = f"Unknown input kind {entry.kind!r}."
+        raise ValueError(msg)
+    return input_type.from_args(entry.args)
@@ -0,0 +1,197 @@
+"""
+This module contains a bot policy searching its moves with information set Monte Carlo tree
+search (ISMCTS).
+
+The bot does not know the roles of the other players, their hands, the deck or the goal cards
+it has not seen. Each iteration of the search draws this hidden information at random, see
+Round.determinize, walks down a single tree shared by every draw, then plays the copied round
+to its end with fast random moves. Moves are identified by card name and position, so that the
+same move is found in every draw where it is possible.
+
+The search stops after a time budget, or a number of iterations for reproducible games. It
+holds the GIL for its whole budget: a server runs it on a copy of the round in an executor,
+see Table.play_bot.
+"""
+
+from __future__ import annotations
+
+from math import log, sqrt
+from random import Random
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from src.core.cards.action_card import ActionCard
+from src.core.cards.path_card import PathCard
+from src.core.policies import DWARF_TEAMS, SABOTEUR_TEAMS, Move, action_moves, play_move
+
+if TYPE_CHECKING:
+    from src.core.round import Round
+
+# Default time spent searching a move, in seconds
+DEFAULT_TIME_BUDGET = 0.1
+# Default weight of exploration against exploitation in the selection of the moves
+DEFAULT_EXPLORATION = 0.7
+
+# Key of a move: (card name,) for a discard, (card name, row, column, flipped) for a path card
+# and (card name, "action", target seat, row, column) for an action card
+MoveKey = tuple
+
+
+class _Node:
+    """A node of the search tree, reached by a move of the player at a seat."""
+
+    __slots__ = ("available", "children", "seat", "visits", "wins")
+
+    def __init__(self, seat: int | None = None) -> None:
+        """Initializes a _Node never visited."""
+        self.seat = seat
+        self.children: dict[MoveKey, _Node] = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.available = 0
+
+
+class IsmctsPolicy:
+    """Policy playing the move which won the most simulated rounds for the current player."""
+
+    def __init__(
+        self,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        iterations: int | None = None,
+        exploration: float = DEFAULT_EXPLORATION,
+    ) -> None:
+        """Initializes an IsmctsPolicy.
+
+        Args:
+            time_budget (float): The time spent searching a move, in seconds.
+            iterations (int | None): The number of simulated rounds per move, overriding the
+                                     time budget, for reproducible searches.
+            exploration (float): The weight of the moves seldom tried when selecting a move.
+        """
+        self.__time_budget = time_budget
+        self.__iterations = iterations
+        self.__exploration = exploration
+        self.__last_iterations = 0
+
+    @property
+    def last_iterations(self) -> int:
+        """Returns the number of simulated rounds of the last search."""
+        return self.__last_iterations
+
+    def __call__(self, game_round: Round) -> Move:
+        """Searches the move of the current player of a round, without changing the round.
+        The random choices of the search are drawn from a generator seeded by a copy of the
+        generator of the round, whose own state is left untouched, and by the position of the
+        round, so that each turn is searched with other draws."""
+        round_rng = Random()
+        round_rng.setstate(game_round.rng.getstate())
+        rng = Random(round_rng.getrandbits(64) ^ game_round.zobrist)
+        observer = game_round.current_player
+        moves = _moves(game_round)
+        if len(moves) == 1:
+            return next(iter(moves.values()))
+
+        root = _Node()
+        deadline = perf_counter() + self.__time_budget
+        iterations = 0
+        while self.__searching(iterations, deadline):
+            self.__iterate(root, game_round.determinize(observer, rng), rng)
+            iterations += 1
+        self.__last_iterations = iterations
+
+        best_key = max(
+            moves, key=lambda key: root.children[key].visits if key in root.children else -1
+        )
+        return moves[best_key]
+
+    def __searching(self, iterations: int, deadline: float) -> bool:
+        """Returns True while the search must go on, at least one iteration being run."""
+        if self.__iterations is not None:
+            return iterations < self.__iterations
+        return iterations == 0 or perf_counter() < deadline
+
+    def __iterate(self, root: _Node, game_round: Round, rng: Random) -> None:
+        """Runs one iteration of the search on a determinized copy of the round."""
+        node = root
+        path = [root]
+        while not game_round.is_over:
+            moves = _moves(game_round)
+            seat = game_round.players.index(game_round.current_player)
+            untried = [key for key in moves if key not in node.children]
+            if untried:
+                key = rng.choice(untried)
+                node.children[key] = _Node(seat)
+                _play(game_round, moves[key])
+                path.append(node.children[key])
+                break
+            for key in moves:
+                node.children[key].available += 1
+            key = max(moves, key=lambda key: self.__score(node.children[key]))
+            node = node.children[key]
+            _play(game_round, moves[key])
+            path.append(node)
+
+        while not game_round.is_over:
+            _play(game_round, _rollout_move(game_round, rng))
+
+        winning_teams = game_round.winning_teams
+        players = game_round.players
+        for node in path:
+            node.visits += 1
+            if node.seat is not None and getattr(players[node.seat].role, "TEAM", None) in (
+                winning_teams
+            ):
+                node.wins += 1
+
+    def __score(self, node: _Node) -> float:
+        """Returns the upper confidence bound of the win rate of a move."""
+        return node.wins / node.visits + self.__exploration * sqrt(
+            log(max(node.available, 1)) / node.visits
+        )
+
+
+def _moves(game_round: Round) -> dict[MoveKey, Move]:
+    """Returns the moves of the current player, by key: the placements of their path cards,
+    the plays of their action cards on each legal target and the discard of each card,
+    identical cards giving the same moves."""
+    player = game_round.current_player
+    moves: dict[MoveKey, Move] = {}
+    if not player.is_blocked():
+        for card, row, column, flipped in game_round.board.legal_moves(player.hand):
+            moves[card.name, row, column, flipped] = Move(card, row, column, flipped)
+    for move in action_moves(game_round):
+        moves[move.card.name, "action", move.target, move.row, move.column] = move
+    for card in player.hand:
+        moves.setdefault((card.name,), Move(card))
+    return moves
+
+
+def _rollout_move(game_round: Round, rng: Random) -> Move:
+    """Returns a fast random move of the current player, placing a path card if one suits
+    their team, otherwise playing a random action card on a random legal target, or
+    discarding a random card."""
+    player = game_round.current_player
+    hand = player.hand
+    team = getattr(player.role, "TEAM", None)
+    if (team in DWARF_TEAMS or team in SABOTEUR_TEAMS) and not player.is_blocked():
+        wants_open_paths = team in DWARF_TEAMS
+        path_cards = [
+            card
+            for card in hand
+            if isinstance(card, PathCard) and bool(card.connections.open_sides) == wants_open_paths
+        ]
+        if path_cards:
+            moves = game_round.board.legal_moves([rng.choice(path_cards)])
+            if moves:
+                return Move(*rng.choice(moves))
+    action_cards = [card for card in hand if isinstance(card, ActionCard)]
+    if action_cards:
+        moves = action_moves(game_round, [rng.choice(action_cards)])
+        if moves:
+            return rng.choice(moves)
+    return Move(rng.choice(hand))
+
+
+def _play(game_round: Round, move: Move) -> None:
+    """Plays a legal move on a copied round."""
+    play_move(game_round, move, trusted=True)
@@ -4,29 +4,81 @@ This module contains player-related classes and functions.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from copy import copy
+from typing import TYPE_CHECKING, Any
 
 from src.core.cards.action_card import ActionCard
 from src.core.cards.card import Card
+from src.core.cards.card_pile import CardPile
+from src.core.cards.card_template import get_card_template, get_card_templates
+from src.core.cards.deck import Deck
+from src.core.cards.path_card import PathCard
+from src.core.cards.roles import get_role
+from src.core.deltas import (
+    BenchCardAdded,
+    BenchCardRemoved,
+    CardDiscarded,
+    CardDrawn,
+    DeltaSource,
+    HandEmptied,
+    template_id_of,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.core.cards.card_pile import CardPileView
     from src.core.cards.roles import Role
 
 
-class Player:
+def _copy_path_card(card: Card) -> Card:
+    """Returns a copy of a path card, which can be flipped when placed, other cards as is."""
+    return copy(card) if isinstance(card, PathCard) else card
+
+
+def _tools_of(card: Card) -> tuple[str, ...]:
+    """Returns the tools broken or repaired by an action card of the catalog."""
+    try:
+        return get_card_template(card).tools
+    except KeyError:
+        return ()
+
+
+class Player(DeltaSource):
     """
     Represents a player in the game.
     """
 
-    def __init__(self, name: str, role: Role, hand: list[Card], bench: list[Card]) -> None:
+    __slots__ = (
+        "__bench",
+        "__bench_view",
+        "__blocking_cards",
+        "__broken_tools",
+        "__hand",
+        "__hand_view",
+        "__name",
+        "__role",
+        "__scores",
+    )
+
+    def __init__(self, name: str, role: Role, hand: Iterable[Card], bench: Iterable[Card]) -> None:
         """
         Initializes a Player with a name, role, hand of cards, and bench of cards.
         """
         self.__name = name
         self.__role = role
-        self.__hand = hand
-        self.__bench = bench
+        self.__hand = CardPile(hand)
+        self.__bench = CardPile()
+        # Read-only, the counters of the bench and the deltas are kept by the methods below
+        self.__hand_view = self.__hand.view()
+        self.__bench_view = self.__bench.view()
         self.__scores = list[int]()
+        # Offensive cards on the bench, in total and by tool they break
+        self.__blocking_cards = 0
+        self.__broken_tools = dict[str, int]()
+        super().__init__()
+        for card in bench:
+            self.__bench_card(card)
 
     @property
     def name(self) -> str:
@@ -44,14 +96,79 @@ class Player:
         self.__role = role
 
     @property
-    def hand(self) -> list[Card]:
-        """Returns the player's hand of cards."""
-        return self.__hand
+    def hand(self) -> CardPileView:
+        """Returns a read-only view of the player's hand of cards, changed by draw and
+        discard."""
+        return self.__hand_view
+
+    @property
+    def bench(self) -> CardPileView:
+        """Returns a read-only view of the player's bench of cards, changed by add_to_bench
+        and remove_from_bench."""
+        return self.__bench_view
+
+    @property
+    def hand_zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the cards in the hand, whatever their order."""
+        return self.__hand.zobrist
 
     @property
-    def bench(self) -> list[Card]:
-        """Returns the player's bench of cards."""
-        return self.__bench
+    def bench_zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the cards on the bench, whatever their order."""
+        return self.__bench.zobrist
+
+    @property
+    def scores(self) -> list[int]:
+        """Returns the scores of the player, one per round played."""
+        return self.__scores
+
+    def to_state(self) -> dict[str, Any]:
+        """Exports the player as plain data, cards being identified by their template id."""
+        return {
+            "name": self.__name,
+            "role": None if self.__role is None else self.__role.NAME,
+            "hand": [get_card_template(card).template_id for card in self.__hand],
+            "bench": [get_card_template(card).template_id for card in self.__bench],
+            "scores": list(self.__scores),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> Player:
+        """Restores a player exported by to_state."""
+        templates = get_card_templates()
+        role = None if state["role"] is None else get_role(state["role"])
+        player = cls(
+            state["name"],
+            role,
+            [templates[template_id].create() for template_id in state["hand"]],
+            [templates[template_id].create() for template_id in state["bench"]],
+        )
+        player.scores.extend(state["scores"])
+        return player
+
+    def copy(self, *, with_hand: bool = True) -> Player:
+        """Returns an independent copy of the player, for lookahead. Listeners are not copied.
+
+        Args:
+            with_hand (bool): Copies the hand, placing a card can flip it so its path cards
+                              are copied too. Otherwise the copy starts with an empty hand.
+        """
+        player = Player.__new__(Player)
+        player.__copy_from(self, with_hand=with_hand)  # noqa: SLF001  # same class, not initialized yet
+        return player
+
+    def __copy_from(self, other: Player, *, with_hand: bool) -> None:
+        """Initializes the player as a copy of another player, see copy."""
+        DeltaSource.__init__(self)
+        self.__name = other.__name
+        self.__role = other.__role
+        self.__hand = other.__hand.copy(_copy_path_card) if with_hand else CardPile()
+        self.__bench = other.__bench.copy()
+        self.__hand_view = self.__hand.view()
+        self.__bench_view = self.__bench.view()
+        self.__blocking_cards = other.__blocking_cards
+        self.__broken_tools = dict(other.__broken_tools)
+        self.__scores = list(other.__scores)
 
     def __eq__(self, other: object) -> bool:
         """Checks equality between two Player instances."""
@@ -68,49 +185,92 @@ class Player:
         )
 
     def __hash__(self) -> int:
-        """Returns the hash of the Player instance."""
-        return hash(
-            (
-                self.__name,
-                self.__role,
-                tuple(self.__hand),
-                tuple(self.__bench),
-                tuple(self.__scores),
-            )
-        )
+        """Returns the hash of the Player instance, from the hashes of its hand and bench."""
+        return hash((self.__name, self.__role, self.__hand.zobrist, self.__bench.zobrist))
 
-    def draw(self, deck: list[Card] | Card) -> None:
-        """Draws a card or a list of cards from the deck to the player's hand."""
+    def draw(self, deck: Deck | Card) -> None:
+        """Draws a card, or the top card of a deck, to the player's hand."""
         if isinstance(deck, Card):
-            self.__hand.append(deck)
-        elif (
-            isinstance(deck, list)
-            and len(deck) > 0
-            and all(isinstance(card, Card) for card in deck)
-        ):
-            card_drawn = deck.pop(0)
-            self.__hand.append(card_drawn)
+            card = deck
+        elif isinstance(deck, Deck) and len(deck) > 0:
+            card = deck.draw()
         else:
-            msg = "Deck must be a Card or a non-empty list of Cards."
+            msg = "Deck must be a Card or a non-empty Deck."
             raise ValueError(msg)
+        self.__hand.append(card)
+        if self._listeners:
+            self._emit(CardDrawn(self.__name, template_id_of(card)))
+
+    def add_to_bench(self, card: Card) -> None:
+        """Adds a card, played on the player by another player, to the player's bench."""
+        self.__bench_card(card)
+        if self._listeners:
+            self._emit(BenchCardAdded(self.__name, template_id_of(card)))
+
+    def remove_from_bench(self, card: Card) -> tuple[bool, str]:
+        """Removes a card from the player's bench, as done when a tool is repaired.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        try:
+            bench_index = self.__bench.index(card)
+        except ValueError:
+            return False, "The card is not on the player's bench."
+        card = self.__bench.pop(bench_index)
+        if isinstance(card, ActionCard) and card.is_offensive:
+            self.__blocking_cards -= 1
+            for tool in _tools_of(card):
+                count = self.__broken_tools[tool] - 1
+                if count:
+                    self.__broken_tools[tool] = count
+                else:
+                    del self.__broken_tools[tool]
+        if self._listeners:
+            self._emit(BenchCardRemoved(self.__name, bench_index))
+        return True, "The card has been removed from the bench."
+
+    def __bench_card(self, card: Card) -> None:
+        """Adds a card to the bench, counting the tools it breaks."""
+        self.__bench.append(card)
+        if isinstance(card, ActionCard) and card.is_offensive:
+            self.__blocking_cards += 1
+            for tool in _tools_of(card):
+                self.__broken_tools[tool] = self.__broken_tools.get(tool, 0) + 1
 
     def discard(self, card: Card) -> tuple[bool, str]:
         """
         Discards a card from the player's hand.
         Returns True if the card was successfully discarded, False otherwise.
         """
-        if card in self.__hand:
-            self.__hand.remove(card)
-            return True, "The card has been discarded."
-        return False, "The card is not in the player's hand."
+        try:
+            hand_index = self.__hand.index(card)
+        except ValueError:
+            return False, "The card is not in the player's hand."
+        self.__hand.pop(hand_index)
+        if self._listeners:
+            self._emit(CardDiscarded(self.__name, hand_index))
+        return True, "The card has been discarded."
 
     def empty_hand(self) -> None:
         """Empties the player's hand."""
         self.__hand.clear()
+        if self._listeners:
+            self._emit(HandEmptied(self.__name))
 
     def is_blocked(self) -> bool:
         """
         Checks if the player is blocked by any offensive action cards on their bench.
         Returns True if the player is blocked, False otherwise.
         """
-        return any(isinstance(card, ActionCard) and card.is_offensive for card in self.__bench)
+        return self.__blocking_cards > 0
+
+    def is_broken(self, tool: str) -> bool:
+        """Returns True if an offensive card on the player's bench breaks a tool."""
+        return tool in self.__broken_tools
+
+    def can_repair(self, card: Card) -> bool:
+        """Returns True if a defensive card repairs one of the tools broken on the bench."""
+        if not (isinstance(card, ActionCard) and card.is_defensive):
+            return False
+        return any(tool in self.__broken_tools for tool in _tools_of(card))
@@ -0,0 +1,191 @@
+"""
+This module contains the policies choosing the moves of players without a user interface.
+A policy receives the current round and returns the move of its current player, any random
+choice is drawn from the round generator so that a round stays reproducible from its seed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from src.core.cards.action_card import ActionCard
+from src.core.cards.path_card import PathCard
+from src.core.effects import EFFECTS, EffectTarget, PlayedCard, effect_of
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.core.cards.card import Card
+    from src.core.round import Round
+
+# Teams trying to reach the gold, and teams trying to prevent it
+DWARF_TEAMS = frozenset({"Green", "Blue", "GreenBlue"})
+SABOTEUR_TEAMS = frozenset({"SabOOter"})
+
+
+class Move(NamedTuple):
+    """A move of the current player: placing a path card, playing an action card on the
+    player at a target seat or on a position, or discarding a card."""
+
+    card: Card
+    row: int | None = None
+    column: int | None = None
+    flipped: bool = False
+    target: int | None = None
+    is_action: bool = False
+
+    @property
+    def is_discard(self) -> bool:
+        """Returns True if the card is discarded instead of being placed or played."""
+        return not self.is_action and self.row is None
+
+
+Policy = Callable[["Round"], Move]
+
+
+def action_moves(game_round: Round, cards: Iterable[Card] | None = None) -> list[Move]:
+    """Lists the legal moves playing action cards of the current player, on each player or
+    position accepted by the effect of the card. Identical cards are listed once.
+
+    Args:
+        game_round (Round): The round of the current player.
+        cards (Iterable[Card] | None): The cards to play, the hand of the player if None.
+                                       Cards other than action cards are ignored.
+
+    Returns:
+        list[Move]: The moves, in the order of the cards, then of the seats or positions.
+    """
+    player = game_round.current_player
+    players = game_round.players
+    seen_names: set[str] = set()
+    moves: list[Move] = []
+    for card in player.hand if cards is None else cards:
+        if not isinstance(card, ActionCard) or card.name in seen_names:
+            continue
+        seen_names.add(card.name)
+        effect = effect_of(card)
+        if effect.TARGET is EffectTarget.PLAYER:
+            candidates = [Move(card, target=seat, is_action=True) for seat in range(len(players))]
+        elif effect.TARGET is EffectTarget.CELL:
+            candidates = [
+                Move(card, row, column, is_action=True)
+                for row, column, _ in game_round.board.iter_cards()
+            ]
+        else:
+            candidates = [Move(card, is_action=True)]
+        moves.extend(
+            move
+            for move in candidates
+            if effect.check(
+                PlayedCard(
+                    game_round,
+                    player,
+                    card,
+                    None if move.target is None else players[move.target],
+                    move.row,
+                    move.column,
+                )
+            )[0]
+        )
+    return moves
+
+
+def play_move(game_round: Round, move: Move, *, trusted: bool = False) -> tuple[bool, str]:
+    """Plays a move of the current player of a round.
+
+    Args:
+        game_round (Round): The round of the current player.
+        move (Move): The move, from the hand of the current player.
+        trusted (bool): Skips the validity checks of path cards, for moves known to be valid.
+
+    Returns:
+        tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+    """
+    if move.is_action:
+        target = None if move.target is None else game_round.players[move.target]
+        return game_round.play_action_card(move.card, target, move.row, move.column)
+    if move.is_discard:
+        return game_round.discard_card(move.card)
+    return game_round.play_path_card(
+        move.card, move.row, move.column, flipped=move.flipped, trusted=trusted
+    )
+
+
+def random_policy(game_round: Round) -> Move:
+    """Places a random path card at a random legal position or plays a random action card on
+    a random legal target, or discards a random card if no card can be played."""
+    player = game_round.current_player
+    moves = [] if player.is_blocked() else game_round.board.legal_moves(player.hand)
+    moves = [Move(*move) for move in moves] + action_moves(game_round)
+    if moves:
+        return game_round.rng.choice(moves)
+    return Move(game_round.rng.choice(player.hand))
+
+
+def greedy_policy(game_round: Round) -> Move:
+    """Plays according to the team of the current player.
+
+    Blocked players first repair their own tools, and saboteurs break the tools of the
+    players not blocked yet. Dwarfs extend the path as close as possible to a goal, saboteurs
+    place dead ends as close as possible to a goal and keep open paths for themselves.
+    Dwarfs without a useful placement look at a goal card they have not seen. Other roles,
+    or players without a useful move, discard the least useful card of their hand.
+    """
+    player = game_round.current_player
+    team = getattr(player.role, "TEAM", None)
+    if team not in DWARF_TEAMS and team not in SABOTEUR_TEAMS:
+        return random_policy(game_round)
+
+    seat = game_round.players.index(player)
+    card_moves = action_moves(game_round)
+    for move in card_moves:
+        if effect_of(move.card) is EFFECTS["repair"] and move.target == seat:
+            return move
+    if team in SABOTEUR_TEAMS:
+        for move in card_moves:
+            if (
+                effect_of(move.card) is EFFECTS["break"]
+                and move.target != seat
+                and not game_round.players[move.target].is_blocked()
+            ):
+                return move
+
+    board = game_round.board
+    goals = [
+        (row, column)
+        for row, column in board.goal_positions
+        if not getattr(board.get_card(row, column), "is_visible", True)
+    ]
+    wants_open_paths = team in DWARF_TEAMS
+    moves = [] if player.is_blocked() else board.legal_moves(player.hand)
+    useful_moves = [
+        move for move in moves if bool(move[0].connections.open_sides) == wants_open_paths
+    ]
+    if useful_moves:
+
+        def distance_to_goals(move: tuple[PathCard, int, int, bool]) -> int:
+            """Returns the distance between the position of a move and the closest goal."""
+            _, row, column, _ = move
+            return min(
+                abs(row - goal_row) + abs(column - goal_column) for goal_row, goal_column in goals
+            )
+
+        return Move(*min(useful_moves, key=distance_to_goals))
+
+    if wants_open_paths:
+        known_goals = game_round.known_goals(player)
+        for move in card_moves:
+            if (
+                effect_of(move.card) is EFFECTS["map"]
+                and (move.row, move.column) in goals
+                and (move.row, move.column) not in known_goals
+            ):
+                return move
+
+    def usefulness(card: Card) -> int:
+        """Ranks the cards of the hand, the least useful one being discarded."""
+        if not isinstance(card, PathCard):
+            return 0
+        return 1 if bool(card.connections.open_sides) == wants_open_paths else -1
+
+    return Move(min(player.hand, key=usefulness))
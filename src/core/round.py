@@ -2,10 +2,56 @@
 This module contains the Round class, which manages the state and progression of a game round.
 """
 
+from __future__ import annotations
+
+from random import Random
+from secrets import randbits
+from typing import TYPE_CHECKING, Any
+
 from src.core.board import Board
-from src.core.cards.build_deck import build_deck
-from src.core.cards.roles import get_random_roles
-from src.core.player import Player
+from src.core.cards.action_card import ActionCard
+from src.core.cards.card_template import get_card_templates
+from src.core.cards.deck import Deck
+from src.core.cards.path_card import GoalCard, PathCard
+from src.core.cards.roles import get_all_roles, get_random_roles
+from src.core.deltas import template_id_of
+from src.core.effects import PlayedCard, effect_of
+from src.core.telemetry import (
+    DISCARD_ACTION,
+    PATH_ACTION,
+    PLAY_ACTION,
+    CardPlayed,
+    GoalReached,
+    RoundBegan,
+    RoundEnded,
+)
+from src.core.zobrist import mix, name_key
+
+if TYPE_CHECKING:
+    from src.core.cards.card import Card
+    from src.core.player import Player
+    from src.core.telemetry import TelemetrySink
+
+# Seeds are unsigned 64-bit integers, so that every seed fits in a snapshot
+MAX_SEED = 2**64 - 1
+
+# Real name of the goal card hiding the gold
+GOLD_GOAL_NAME = "END"
+
+# Teams winning the round depending on whether the gold has been found
+GOLD_FOUND_WINNERS = frozenset({"Green", "Blue", "GreenBlue", "Profiteur"})
+GOLD_NOT_FOUND_WINNERS = frozenset({"SabOOter", "Profiteur"})
+
+
+def check_seed(seed: int | None) -> None:
+    """Checks that a seed, if given, is an integer between 0 and MAX_SEED.
+
+    Raises:
+        ValueError: If the seed is not an integer between 0 and MAX_SEED.
+    """
+    if seed is not None and (not isinstance(seed, int) or not 0 <= seed <= MAX_SEED):
+        msg = f"The seed must be an integer between 0 and {MAX_SEED}."
+        raise ValueError(msg)
 
 
 class Round:
@@ -13,23 +59,460 @@ class Round:
     Represents a game round, managing the round number and turn order.
     """
 
-    def __init__(self, players: list[Player]) -> None:
+    def __init__(
+        self,
+        players: list[Player],
+        seed: int | None = None,
+        telemetry: TelemetrySink | None = None,
+    ) -> None:
         """
         Initializes a Round with a list of players and sets the round number to 1.
+
+        Every random choice of the round (deck, roles and goals) is drawn from a generator
+        seeded with the given seed, so that a round can be replayed from its seed.
+        A random seed is chosen if none is given.
+
+        If a telemetry sink is given, it is called with the events of the round, see the
+        telemetry module. The copies of the round never call it.
+
+        Raises:
+            ValueError: If the seed is not an integer between 0 and MAX_SEED.
         """
+        check_seed(seed)
+        self.__seed = randbits(63) if seed is None else seed
+        self.__rng = Random(self.__seed)
+        self.__telemetry = telemetry
         self.__players = players
         self.__current_turn_index = 0
-        self.__board = Board()
-        self.__deck = build_deck()
+        self.__turns_played = 0
+        self.__gold_found = False
+        self.__is_over = False
+        self.__board = Board(self.__rng)
+        self.__deck = Deck.build(rng=self.__rng)
+        # Goals seen by each player with a Map card, as a bit mask of goal indexes per seat
+        self.__known_goals = [0] * len(players)
 
         self.__assign_player_roles()
         self.__deal_hands()
+        if self.__telemetry is not None:
+            roles = tuple(None if player.role is None else player.role.NAME for player in players)
+            self.__telemetry(RoundBegan(self.__seed, roles, self.__teams()))
+
+    def to_state(self) -> dict[str, Any]:
+        """Exports the round as plain data, the players being exported by the game.
+
+        Returns:
+            dict[str, Any]: The seed, turn and generator state of the round,
+                            its board and the template ids of its deck.
+        """
+        version, internal_state, gauss_next = self.__rng.getstate()
+        return {
+            "seed": self.__seed,
+            "rng": [version, list(internal_state), gauss_next],
+            "current_turn_index": self.__current_turn_index,
+            "turns_played": self.__turns_played,
+            "gold_found": self.__gold_found,
+            "is_over": self.__is_over,
+            "known_goals": list(self.__known_goals),
+            "board": self.__board.to_state(),
+            "deck": list(self.__deck.template_ids),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any], players: list[Player]) -> Round:
+        """Restores a round exported by to_state, played by the given players."""
+        game_round = cls.__new__(cls)
+        game_round.__restore(state, players)  # noqa: SLF001  # same class, not initialized yet
+        return game_round
+
+    def __restore(self, state: dict[str, Any], players: list[Player]) -> None:
+        """Sets every attribute of an uninitialized round from a state exported by to_state."""
+        version, internal_state, gauss_next = state["rng"]
+        self.__seed = state["seed"]
+        self.__rng = Random()
+        self.__rng.setstate((version, tuple(internal_state), gauss_next))
+        self.__telemetry = None
+        self.__players = players
+        self.__current_turn_index = state["current_turn_index"]
+        self.__turns_played = state["turns_played"]
+        self.__gold_found = state["gold_found"]
+        self.__is_over = state["is_over"]
+        self.__known_goals = list(state["known_goals"])
+        self.__board = Board.from_state(state["board"])
+        self.__deck = Deck(state["deck"])
+
+    def copy(self) -> Round:
+        """Returns an independent copy of the round and of its players, for lookahead.
+        The copy starts with the same random generator state as the round."""
+        game_round = Round.__new__(Round)
+        game_round.__copy_from(self)  # noqa: SLF001  # same class, not initialized yet
+        return game_round
+
+    def determinize(self, observer: Player, rng: Random) -> Round:
+        """Returns a copy of the round where what a player cannot see is drawn at random.
+
+        The hands of the other players are redealt from their cards and the deck, their roles
+        are drawn from the roles left once the role of the observer is removed, and the goal
+        cards the observer has not seen are shuffled. The copy is as likely as the real round
+        from the point of view of the observer.
+
+        Args:
+            observer (Player): The player of the round whose knowledge is kept.
+            rng (Random): The random generator drawing the hidden information.
+
+        Returns:
+            Round: The determinized copy, whose players are copies of the players of the round.
+        """
+        game_round = Round.__new__(Round)
+        game_round.__copy_from(self, self.__seat(observer), rng)  # noqa: SLF001  # same class
+        return game_round
+
+    def __copy_from(
+        self, other: Round, observer_seat: int | None = None, rng: Random | None = None
+    ) -> None:
+        """Sets every attribute of an uninitialized round from another round, drawing what
+        the player at the observer seat cannot see, random generator included, if a seat is
+        given."""
+        self.__seed = other.__seed
+        if observer_seat is None:
+            self.__rng = Random()
+            self.__rng.setstate(other.__rng.getstate())
+        else:  # the future random choices are hidden too
+            self.__rng = Random(rng.getrandbits(64))
+        self.__telemetry = None  # lookahead moves are not played
+        self.__players = [
+            player.copy(with_hand=observer_seat in (None, seat))
+            for seat, player in enumerate(other.__players)
+        ]
+        self.__current_turn_index = other.__current_turn_index
+        self.__turns_played = other.__turns_played
+        self.__gold_found = other.__gold_found
+        self.__is_over = other.__is_over
+        self.__known_goals = list(other.__known_goals)
+        self.__board = other.__board.copy()
+        self.__deck = other.__deck.copy()
+        if observer_seat is not None:
+            self.__redraw_hidden(other, observer_seat, rng)
+
+    def __redraw_hidden(self, other: Round, observer_seat: int, rng: Random) -> None:
+        """Draws at random the hands and roles of the players other than the observer, the
+        deck and the goal cards the observer has not seen, among the ones of another round."""
+        hidden_ids = list(other.__deck.template_ids)
+        others = []
+        for seat, player in enumerate(other.__players):
+            if seat != observer_seat:
+                hidden_ids.extend(template_id_of(card) for card in player.hand)
+                others.append((self.__players[seat], len(player.hand)))
+        rng.shuffle(hidden_ids)
+        templates = get_card_templates()
+        for player, hand_size in others:
+            dealt = len(hidden_ids) - hand_size  # an empty hand is dealt no card
+            for template_id in hidden_ids[dealt:]:
+                player.draw(templates[template_id].create())
+            del hidden_ids[dealt:]
+        self.__deck = Deck(hidden_ids)
+
+        roles = get_all_roles()
+        observer_role = self.__players[observer_seat].role
+        if observer_role in roles:
+            roles.remove(observer_role)
+        for (player, _), role in zip(others, rng.sample(roles, len(others))):
+            player.role = role
+
+        observer = other.__players[observer_seat]
+        self.__board.shuffle_hidden_goals(rng, keep=other.known_goals(observer))
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed of the random generator of the round."""
+        return self.__seed
+
+    @property
+    def rng(self) -> Random:
+        """Returns the random generator of the round, for any random choice made during it."""
+        return self.__rng
+
+    @property
+    def players(self) -> list[Player]:
+        """Returns the players of the round, in turn order."""
+        return self.__players
+
+    @property
+    def board(self) -> Board:
+        """Returns the board of the round."""
+        return self.__board
+
+    @property
+    def deck(self) -> Deck:
+        """Returns the deck of the round."""
+        return self.__deck
+
+    @property
+    def deck_size(self) -> int:
+        """Returns the number of cards left in the deck."""
+        return len(self.__deck)
+
+    @property
+    def turns_played(self) -> int:
+        """Returns the number of turns played so far."""
+        return self.__turns_played
 
     @property
     def current_player(self) -> Player:
         """Returns the player whose turn it is currently."""
         return self.__players[self.__current_turn_index % len(self.__players)]
 
+    @property
+    def is_over(self) -> bool:
+        """Returns True once the gold has been found or every hand is empty."""
+        return self.__is_over
+
+    @property
+    def gold_found(self) -> bool:
+        """Returns True if a path connects the start card to the gold."""
+        return self.__gold_found
+
+    @property
+    def winning_teams(self) -> frozenset[str]:
+        """Returns the teams winning the round, empty while the round is not over."""
+        if not self.__is_over:
+            return frozenset()
+        return GOLD_FOUND_WINNERS if self.__gold_found else GOLD_NOT_FOUND_WINNERS
+
+    @property
+    def zobrist(self) -> int:
+        """Returns a 64-bit hash of the position of the round, combined from the incremental
+        hashes of the board, the deck and the players, so that it is cheap to compute after
+        each move. The turn count and the random generator are left out: two rounds reaching
+        the same position by different moves have the same hash."""
+        players = [
+            mix(
+                seat,
+                player.hand_zobrist,
+                player.bench_zobrist,
+                name_key(getattr(player.role, "NAME", "")),
+                self.__known_goals[seat],
+            )
+            for seat, player in enumerate(self.__players)
+        ]
+        return mix(
+            self.__board.zobrist,
+            self.__deck.zobrist,
+            self.__current_turn_index % len(self.__players),
+            self.__gold_found << 1 | self.__is_over,
+            *players,
+        )
+
+    def known_goals(self, player: Player) -> list[tuple[int, int]]:
+        """Returns the positions of the goal cards a player has seen, revealed ones excluded."""
+        seat = self.__seat(player)
+        return [
+            position
+            for index, position in enumerate(self.__board.goal_positions)
+            if self.__known_goals[seat] >> index & 1
+            and not getattr(self.__board.get_card(*position), "is_visible", True)
+        ]
+
+    def show_goal(self, player: Player, row: int, column: int) -> tuple[bool, str]:
+        """Lets a player secretly look at a goal card, as done with a Map card.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        goal_positions = self.__board.goal_positions
+        if (row, column) not in goal_positions:
+            return False, "There is no goal card at this position."
+        self.__known_goals[self.__seat(player)] |= 1 << goal_positions.index((row, column))
+        return True, "The goal card has been seen."
+
+    def __seat(self, player: Player) -> int:
+        """Returns the index of a player of the round in the turn order."""
+        return next(seat for seat, other in enumerate(self.__players) if other is player)
+
+    def play_path_card(
+        self, card: Card, row: int, column: int, *, flipped: bool = False, trusted: bool = False
+    ) -> tuple[bool, str]:
+        """Places a path card of the current player on the board, then ends the turn.
+
+        Args:
+            card (Card): The card to place, from the current player's hand.
+            row (int): The row index where the card is to be placed.
+            column (int): The column index where the card is to be placed.
+            flipped (bool): Whether the card is flipped before being placed.
+            trusted (bool): Skips the validity checks, for moves known to be valid.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        player = self.current_player
+        if not trusted:
+            if self.__is_over:
+                return False, "The round is over."
+            if not isinstance(card, PathCard):
+                return False, "Only path cards can be placed on the board."
+            if card not in player.hand:
+                return False, "The card is not in the player's hand."
+            if player.is_blocked():
+                return False, "A blocked player cannot place path cards."
+
+        if flipped:
+            card.flip()
+        result, message = self.__board.place_card(row, column, card, trusted=trusted)
+        if not result:
+            if flipped:
+                card.flip()
+            return False, message
+
+        player.discard(card)
+        self.__reveal_reached_goals()
+        if self.__telemetry is not None:
+            self.__record_play(card, PATH_ACTION, None, row, column, flipped=flipped)
+        self.__end_turn()
+        return True, message
+
+    def play_action_card(
+        self,
+        card: Card,
+        target: Player | None = None,
+        row: int | None = None,
+        column: int | None = None,
+    ) -> tuple[bool, str]:
+        """Plays an action card of the current player, then ends the turn.
+
+        The card is checked and applied by its effect, see the effects module. Offensive
+        cards are placed on the bench of the target player, the other cards are discarded.
+
+        Args:
+            card (Card): The card to play, from the current player's hand.
+            target (Player | None): The targeted player, required by the cards played on
+                                    a player.
+            row (int | None): The row targeted by the cards played on the board.
+            column (int | None): The column targeted by the cards played on the board.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        if self.__is_over:
+            return False, "The round is over."
+        player = self.current_player
+        if not isinstance(card, ActionCard):
+            return False, "Only action cards can be played on players."
+        if card not in player.hand:
+            return False, "The card is not in the player's hand."
+        played = PlayedCard(self, player, card, target, row, column)
+        effect = effect_of(card)
+        result, message = effect.check(played)
+        if not result:
+            return result, message
+
+        player.discard(card)
+        effect.apply(played)
+        if self.__telemetry is not None:
+            self.__record_play(card, PLAY_ACTION, target, row, column)
+        self.__end_turn()
+        return True, "The card has been played."
+
+    def discard_card(self, card: Card) -> tuple[bool, str]:
+        """Discards a card of the current player, then ends the turn.
+
+        Args:
+            card (Card): The card to discard, from the current player's hand.
+
+        Returns:
+            tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        if self.__is_over:
+            return False, "The round is over."
+        result, message = self.current_player.discard(card)
+        if result:
+            if self.__telemetry is not None:
+                self.__record_play(card, DISCARD_ACTION, None, None, None)
+            self.__end_turn()
+        return result, message
+
+    def __reveal_reached_goals(self) -> None:
+        """Reveals the goal cards newly connected to the start card."""
+        revealed = True
+        while revealed:
+            revealed = False
+            for row, column in self.__board.reached_goals:
+                goal_card = self.__board.get_card(row, column)
+                if isinstance(goal_card, GoalCard) and not goal_card.is_visible:
+                    self.__board.reveal_goal(row, column)
+                    gold = goal_card.name == GOLD_GOAL_NAME
+                    self.__gold_found |= gold
+                    revealed = True
+                    if self.__telemetry is not None:
+                        self.__telemetry(
+                            GoalReached(
+                                self.__seed, self.__turns_played, row, column, goal_card.name, gold
+                            )
+                        )
+
+    def __end_turn(self) -> None:
+        """Refills the hand of the current player and passes to the next player with cards.
+        The round is over if the gold has been found or if no player has any card left."""
+        self.__turns_played += 1
+        if self.__gold_found:
+            self.__end()
+            return
+        if self.__deck:
+            self.current_player.draw(self.__deck)
+        for _ in self.__players:
+            self.__current_turn_index += 1
+            if self.current_player.hand:
+                return
+        self.__end()
+
+    def __end(self) -> None:
+        """Ends the round."""
+        self.__is_over = True
+        if self.__telemetry is not None:
+            self.__telemetry(
+                RoundEnded(
+                    self.__seed,
+                    self.__turns_played,
+                    self.__gold_found,
+                    tuple(sorted(self.winning_teams)),
+                    self.__teams(),
+                )
+            )
+
+    def __teams(self) -> tuple[str | None, ...]:
+        """Returns the team of the player at each seat."""
+        return tuple(None if player.role is None else player.role.TEAM for player in self.__players)
+
+    def __record_play(
+        self,
+        card: Card,
+        action: str,
+        target: Player | None,
+        row: int | None,
+        column: int | None,
+        *,
+        flipped: bool = False,
+    ) -> None:
+        """Records a card played by the current player, before the turn ends."""
+        seat = self.__current_turn_index % len(self.__players)
+        role = self.__players[seat].role
+        self.__telemetry(
+            CardPlayed(
+                self.__seed,
+                self.__turns_played,
+                seat,
+                None if role is None else role.TEAM,
+                card.name,
+                template_id_of(card),
+                action,
+                None if target is None else self.__seat(target),
+                row,
+                column,
+                flipped,
+                self.__board.rows,
+                self.__board.columns,
+            )
+        )
+
     def __deal_hands(self, hand_size: int = 6) -> None:
         """Deals a specified number of cards to each player at the start of the round.
         Args:
@@ -37,11 +520,11 @@ class Round:
         """
         for player in self.__players:
             player.empty_hand()
-            for _ in range(hand_size):
-                player.draw(self.__deck)
+            for card in self.__deck.deal(hand_size):
+                player.draw(card)
 
     def __assign_player_roles(self) -> None:
         """Assigns roles to players at the start of the round."""
-        random_roles = get_random_roles(len(self.__players))
+        random_roles = get_random_roles(len(self.__players), self.__rng)
         for i, player in enumerate(self.__players):
             player.role = random_roles[i]
@@ -0,0 +1,247 @@
+"""
+This module contains the headless simulation engine, playing rounds to completion without a
+user interface. Games are spread over a pool of processes and every game is reproducible from
+its seed, whatever the number of workers.
+
+The events of the games can be recorded by a telemetry sink per worker, such as a
+TelemetryWriter or a ColumnarWriter writing to a directory of its own: sinks are created in
+the worker processes by a factory called with the index of the worker, and flushed once each
+batch of games is played.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import Value
+from random import Random
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from src.core.player import Player
+from src.core.policies import play_move
+from src.core.round import Round
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from multiprocessing.sharedctypes import Synchronized
+
+    from src.core.policies import Policy
+    from src.core.telemetry import TelemetryFactory, TelemetrySink
+
+# Telemetry sink of the current worker process, see _init_worker
+_worker_telemetry: TelemetrySink | None = None
+
+
+class GameResult(NamedTuple):
+    """The outcome of a simulated game, a single round played to completion."""
+
+    index: int
+    seed: int
+    winning_teams: frozenset[str]
+    gold_found: bool
+    turns: int
+    cards_placed: int
+    cards_discarded: int
+    actions_played: int
+
+
+class SimulationReport(NamedTuple):
+    """Aggregated figures of a simulation."""
+
+    games: int
+    elapsed: float
+    wins_by_team: dict[str, int]
+
+    @property
+    def games_per_second(self) -> float:
+        """Returns the number of games simulated per second."""
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def play_game(
+    player_names: Sequence[str],
+    policies: Sequence[Policy],
+    seed: int,
+    index: int = 0,
+    telemetry: TelemetrySink | None = None,
+) -> GameResult:
+    """Plays a single round to completion.
+
+    Args:
+        player_names (Sequence[str]): The names of the players, in turn order.
+        policies (Sequence[Policy]): The policy of each player.
+        seed (int): The seed of the round, every random choice depends on it.
+        index (int): The index of the game in its simulation.
+        telemetry (TelemetrySink | None): Called with the events of the round, see the
+                                          telemetry module.
+
+    Returns:
+        GameResult: The outcome of the game.
+    """
+    players = [Player(name, None, [], []) for name in player_names]
+    game_round = Round(players, seed=seed, telemetry=telemetry)
+    cards_placed = 0
+    cards_discarded = 0
+    actions_played = 0
+    while not game_round.is_over:
+        seat = players.index(game_round.current_player)
+        move = policies[seat](game_round)
+        result, message = play_move(game_round, move)
+        if move.is_action:
+            actions_played += 1
+        elif move.is_discard:
+            cards_discarded += 1
+        else:
+            cards_placed += 1
+        if not result:
+            raise RuntimeError(f"Invalid move {move} from {player_names[seat]}: {message}")
+    return GameResult(
+        index=index,
+        seed=seed,
+        winning_teams=game_round.winning_teams,
+        gold_found=game_round.gold_found,
+        turns=game_round.turns_played,
+        cards_placed=cards_placed,
+        cards_discarded=cards_discarded,
+        actions_played=actions_played,
+    )
+
+
+def _init_worker(telemetry_factory: TelemetryFactory, worker_count: Synchronized) -> None:
+    """Creates the telemetry sink of a worker process, the workers being numbered from 0."""
+    global _worker_telemetry  # noqa: PLW0603  # one sink per worker process
+    with worker_count.get_lock():
+        worker_index = worker_count.value
+        worker_count.value += 1
+    _worker_telemetry = telemetry_factory(worker_index)
+
+
+def _call_if_any(telemetry: TelemetrySink | None, method: str) -> None:
+    """Calls a method of a telemetry sink, such as flush or close, if the sink has it."""
+    function = getattr(telemetry, method, None)
+    if function is not None:
+        function()
+
+
+def _play_games(
+    player_names: Sequence[str],
+    policies: Sequence[Policy],
+    first_index: int,
+    seeds: list[int],
+    telemetry: TelemetrySink | None = None,
+) -> list[GameResult]:
+    """Plays a batch of games, in a worker process whose sink records them if no sink is
+    given, then flushes the sink."""
+    if telemetry is None:
+        telemetry = _worker_telemetry
+    results = [
+        play_game(player_names, policies, seed, first_index + offset, telemetry)
+        for offset, seed in enumerate(seeds)
+    ]
+    _call_if_any(telemetry, "flush")
+    return results
+
+
+def iter_simulate(
+    n_games: int,
+    players: Sequence[str],
+    policy: Policy | Sequence[Policy],
+    seed: int | None = None,
+    workers: int = 1,
+    batch_size: int = 64,
+    telemetry_factory: TelemetryFactory | None = None,
+) -> Iterator[GameResult]:
+    """Simulates games and yields their results as they complete, in game order.
+
+    The game seeds are drawn from a generator seeded with the given seed, so results only
+    depend on the seed. Games are sent to the workers in batches, and only a few batches are
+    in flight at any time, so that millions of games can be streamed in constant memory.
+
+    Args:
+        n_games (int): The number of games to simulate.
+        players (Sequence[str]): The names of the players, in turn order.
+        policy (Policy | Sequence[Policy]): The policy of all players, or of each player.
+        seed (int | None): The seed of the simulation, a random one if None.
+        workers (int): The number of worker processes, games are played in this process if 1.
+        batch_size (int): The number of games sent to a worker at once.
+        telemetry_factory (TelemetryFactory | None): Creates the telemetry sink of each
+                                                     worker from its index, 0 if the games
+                                                     are played in this process. The
+                                                     factory must be picklable, and the sink
+                                                     is flushed after each batch.
+
+    Yields:
+        GameResult: The outcome of each game.
+    """
+    policies = list(policy) if isinstance(policy, (list, tuple)) else [policy] * len(players)
+    if len(policies) != len(players):
+        msg = "There must be one policy per player."
+        raise ValueError(msg)
+    seed_generator = Random(seed)
+
+    def batches() -> Iterator[tuple[int, list[int]]]:
+        """Yields the index of the first game and the seeds of each batch."""
+        for first_index in range(0, n_games, batch_size):
+            size = min(batch_size, n_games - first_index)
+            yield first_index, [seed_generator.getrandbits(63) for _ in range(size)]
+
+    if workers <= 1:
+        telemetry = None if telemetry_factory is None else telemetry_factory(0)
+        try:
+            for first_index, seeds in batches():
+                yield from _play_games(players, policies, first_index, seeds, telemetry)
+        finally:
+            _call_if_any(telemetry, "close")
+        return
+
+    initializer, initargs = None, ()
+    if telemetry_factory is not None:
+        initializer, initargs = _init_worker, (telemetry_factory, Value("i", 0))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        pending: deque[Future[list[GameResult]]] = deque()
+        for first_index, seeds in batches():
+            pending.append(executor.submit(_play_games, players, policies, first_index, seeds))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def simulate(
+    n_games: int,
+    players: Sequence[str],
+    policy: Policy | Sequence[Policy],
+    seed: int | None = None,
+    workers: int = 1,
+    on_result: Callable[[GameResult], None] | None = None,
+    telemetry_factory: TelemetryFactory | None = None,
+) -> SimulationReport:
+    """Simulates games and reports the number of wins per team and the simulation speed.
+
+    Args:
+        n_games (int): The number of games to simulate.
+        players (Sequence[str]): The names of the players, in turn order.
+        policy (Policy | Sequence[Policy]): The policy of all players, or of each player.
+        seed (int | None): The seed of the simulation, a random one if None.
+        workers (int): The number of worker processes, games are played in this process if 1.
+        on_result (Callable[[GameResult], None] | None): Called with each result, in game order.
+        telemetry_factory (TelemetryFactory | None): Creates the telemetry sink of each
+                                                     worker, see iter_simulate.
+
+    Returns:
+        SimulationReport: The aggregated figures of the simulation.
+    """
+    wins_by_team = Counter[str]()
+    games = 0
+    start = perf_counter()
+    for result in iter_simulate(
+        n_games, players, policy, seed, workers, telemetry_factory=telemetry_factory
+    ):
+        games += 1
+        wins_by_team.update(result.winning_teams)
+        if on_result is not None:
+            on_result(result)
+    return SimulationReport(games, perf_counter() - start, dict(wins_by_team))
@@ -0,0 +1,281 @@
+"""
+This module saves and restores whole games as snapshots, to persist games in progress or to
+move them between processes.
+
+Two formats are available, both built on the plain data exported by Game.to_state:
+- a compact binary format, cards being stored as template ids,
+- a JSON format, readable and easy to inspect.
+
+A snapshot only depends on the state of the game, so equal games give equal snapshots and
+the binary snapshots, being bytes, can be hashed or used as dictionary keys.
+"""
+
+from __future__ import annotations
+
+import json
+from struct import Struct
+from typing import Any
+
+from src.core.game import Game, GameState
+from src.core.inputs import TurnAction
+
+MAGIC = b"SABG"
+VERSION = 1
+
+_HEADER = Struct("<4sB")
+_BYTE = Struct("<B")
+_SHORT = Struct("<h")
+_USHORT = Struct("<H")
+_UINT = Struct("<I")
+_ULONG = Struct("<Q")
+_DOUBLE = Struct("<d")
+_CELL = Struct("<hhHB")
+_GAME_STATES = tuple(GameState)
+_TURN_ACTIONS = tuple(TurnAction)
+
+# Flags of a board cell
+_FLIPPED = 0b01
+_VISIBLE = 0b10
+
+# Flags of a round
+_GOLD_FOUND = 0b01
+_IS_OVER = 0b10
+
+
+class _Writer:
+    """Appends little-endian binary values to a buffer."""
+
+    def __init__(self) -> None:
+        """Initializes a Writer with an empty buffer."""
+        self.buffer = bytearray()
+
+    def pack(self, packer: Struct, *values: object) -> None:
+        """Appends values packed with the given structure."""
+        self.buffer += packer.pack(*values)
+
+    def text(self, value: str | None) -> None:
+        """Appends an optional UTF-8 string, prefixed by its length plus one, 0 for None."""
+        if value is None:
+            self.pack(_USHORT, 0)
+            return
+        encoded = value.encode("utf-8")
+        self.pack(_USHORT, len(encoded) + 1)
+        self.buffer += encoded
+
+    def ids(self, values: list[int]) -> None:
+        """Appends a list of template ids, prefixed by its length."""
+        self.pack(_USHORT, len(values))
+        self.buffer += Struct(f"<{len(values)}H").pack(*values)
+
+    def rng(self, state: list[Any]) -> None:
+        """Appends the state of a random generator, as exported by the to_state methods."""
+        version, internal_state, gauss_next = state
+        self.pack(_BYTE, version)
+        self.pack(_USHORT, len(internal_state))
+        self.buffer += Struct(f"<{len(internal_state)}I").pack(*internal_state)
+        self.pack(_BYTE, gauss_next is not None)
+        if gauss_next is not None:
+            self.pack(_DOUBLE, gauss_next)
+
+
+class _Reader:
+    """Reads little-endian binary values from a buffer."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initializes a Reader at the start of the buffer."""
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, packer: Struct) -> tuple[Any, ...]:
+        """Reads values packed with the given structure."""
+        values = packer.unpack_from(self.data, self.offset)
+        self.offset += packer.size
+        return values
+
+    def value(self, packer: Struct) -> int:
+        """Reads a single integer packed with the given structure."""
+        return self.unpack(packer)[0]
+
+    def text(self) -> str | None:
+        """Reads an optional UTF-8 string written by Writer.text."""
+        length = self.value(_USHORT)
+        if length == 0:
+            return None
+        start = self.offset
+        self.offset += length - 1
+        return bytes(self.data[start : self.offset]).decode("utf-8")
+
+    def ids(self) -> list[int]:
+        """Reads a list of template ids written by Writer.ids."""
+        length = self.value(_USHORT)
+        return list(self.unpack(Struct(f"<{length}H")))
+
+    def rng(self) -> list[Any]:
+        """Reads the state of a random generator written by Writer.rng."""
+        version = self.value(_BYTE)
+        length = self.value(_USHORT)
+        internal_state = list(self.unpack(Struct(f"<{length}I")))
+        gauss_next = self.unpack(_DOUBLE)[0] if self.value(_BYTE) else None
+        return [version, internal_state, gauss_next]
+
+
+def _write_player(writer: _Writer, player: dict[str, Any]) -> None:
+    """Appends the state of a player."""
+    writer.text(player["name"])
+    writer.text(player["role"])
+    writer.ids(player["hand"])
+    writer.ids(player["bench"])
+    writer.pack(_USHORT, len(player["scores"]))
+    for score in player["scores"]:
+        writer.pack(_SHORT, score)
+
+
+def _read_player(reader: _Reader) -> dict[str, Any]:
+    """Reads the state of a player."""
+    return {
+        "name": reader.text(),
+        "role": reader.text(),
+        "hand": reader.ids(),
+        "bench": reader.ids(),
+        "scores": [reader.value(_SHORT) for _ in range(reader.value(_USHORT))],
+    }
+
+
+def _write_round(writer: _Writer, game_round: dict[str, Any]) -> None:
+    """Appends the state of a round, with its board and deck."""
+    flags = (_GOLD_FOUND if game_round["gold_found"] else 0) | (
+        _IS_OVER if game_round["is_over"] else 0
+    )
+    writer.pack(_ULONG, game_round["seed"])
+    writer.rng(game_round["rng"])
+    writer.pack(_UINT, game_round["current_turn_index"])
+    writer.pack(_UINT, game_round["turns_played"])
+    writer.pack(_BYTE, flags)
+    writer.pack(_USHORT, len(game_round["known_goals"]))
+    for known_goals in game_round["known_goals"]:
+        writer.pack(_BYTE, known_goals)
+
+    board = game_round["board"]
+    writer.pack(_SHORT, board["top"])
+    writer.pack(_SHORT, board["left"])
+    writer.pack(_USHORT, board["rows"])
+    writer.pack(_USHORT, board["columns"])
+    writer.pack(_USHORT, len(board["cells"]))
+    for row, column, template_id, flipped, visible in board["cells"]:
+        cell_flags = (_FLIPPED if flipped else 0) | (_VISIBLE if visible else 0)
+        writer.pack(_CELL, row, column, template_id, cell_flags)
+    writer.ids(game_round["deck"])
+
+
+def _read_round(reader: _Reader) -> dict[str, Any]:
+    """Reads the state of a round, with its board and deck."""
+    seed = reader.value(_ULONG)
+    rng = reader.rng()
+    current_turn_index = reader.value(_UINT)
+    turns_played = reader.value(_UINT)
+    flags = reader.value(_BYTE)
+    known_goals = [reader.value(_BYTE) for _ in range(reader.value(_USHORT))]
+
+    top = reader.value(_SHORT)
+    left = reader.value(_SHORT)
+    rows = reader.value(_USHORT)
+    columns = reader.value(_USHORT)
+    cells = []
+    for _ in range(reader.value(_USHORT)):
+        row, column, template_id, cell_flags = reader.unpack(_CELL)
+        cells.append(
+            [
+                row,
+                column,
+                template_id,
+                int(bool(cell_flags & _FLIPPED)),
+                int(bool(cell_flags & _VISIBLE)),
+            ]
+        )
+    return {
+        "seed": seed,
+        "rng": rng,
+        "current_turn_index": current_turn_index,
+        "turns_played": turns_played,
+        "gold_found": bool(flags & _GOLD_FOUND),
+        "is_over": bool(flags & _IS_OVER),
+        "known_goals": known_goals,
+        "board": {"top": top, "left": left, "rows": rows, "columns": columns, "cells": cells},
+        "deck": reader.ids(),
+    }
+
+
+def dump_game(game: Game) -> bytes:
+    """Saves a game as a compact binary snapshot.
+
+    Returns:
+        bytes: The snapshot, equal for games in the same state.
+    """
+    state = game.to_state()
+    writer = _Writer()
+    writer.pack(_HEADER, MAGIC, VERSION)
+    writer.pack(_ULONG, state["seed"])
+    writer.pack(_USHORT, state["rounds_started"])
+    writer.pack(_BYTE, _GAME_STATES.index(GameState[state["state"]]))
+    # Optional values are stored plus one, 0 standing for None
+    turn_action = state["turn_action"]
+    selected_card = state["selected_card"]
+    writer.pack(
+        _BYTE, 0 if turn_action is None else _TURN_ACTIONS.index(TurnAction[turn_action]) + 1
+    )
+    writer.pack(_BYTE, 0 if selected_card is None else selected_card + 1)
+    writer.pack(_BYTE, len(state["players"]))
+    for player in state["players"]:
+        _write_player(writer, player)
+    writer.pack(_BYTE, state["round"] is not None)
+    if state["round"] is not None:
+        _write_round(writer, state["round"])
+    return bytes(writer.buffer)
+
+
+def load_game(snapshot: bytes) -> Game:
+    """Restores a game from a binary snapshot made by dump_game.
+
+    Raises:
+        ValueError: If the data is not a snapshot of a supported version.
+    """
+    reader = _Reader(snapshot)
+    if len(snapshot) < _HEADER.size or reader.unpack(_HEADER) != (MAGIC, VERSION):
+        msg = "The data is not a game snapshot of a supported version."
+        raise ValueError(msg)
+    seed = reader.value(_ULONG)
+    rounds_started = reader.value(_USHORT)
+    game_state = _GAME_STATES[reader.value(_BYTE)].name
+    turn_action = reader.value(_BYTE)
+    selected_card = reader.value(_BYTE)
+    players = [_read_player(reader) for _ in range(reader.value(_BYTE))]
+    game_round = _read_round(reader) if reader.value(_BYTE) else None
+    return Game.from_state(
+        {
+            "seed": seed,
+            "rounds_started": rounds_started,
+            "state": game_state,
+            "turn_action": _TURN_ACTIONS[turn_action - 1].name if turn_action else None,
+            "selected_card": selected_card - 1 if selected_card else None,
+            "players": players,
+            "round": game_round,
+        }
+    )
+
+
+def dump_game_json(game: Game) -> str:
+    """Saves a game as a JSON snapshot."""
+    return json.dumps({"version": VERSION, "game": game.to_state()}, separators=(",", ":"))
+
+
+def load_game_json(snapshot: str) -> Game:
+    """Restores a game from a JSON snapshot made by dump_game_json.
+
+    Raises:
+        ValueError: If the data is not a snapshot of a supported version.
+    """
+    data = json.loads(snapshot)
+    if not isinstance(data, dict) or data.get("version") != VERSION:
+        msg = "The data is not a game snapshot of a supported version."
+        raise ValueError(msg)
+    return Game.from_state(data["game"])
@@ -0,0 +1,337 @@
+"""
+This module contains the telemetry of the rounds, the events recorded for balance analytics.
+
+Telemetry is opt-in: a round, or a game for all its rounds, is given a sink called with each
+event, such as a TelemetryWriter. Copies of a round made for lookahead never record events.
+The events of a round share the seed of the round, which identifies it in the records.
+
+A TelemetryWriter encodes the events as newline-delimited JSON records, written in batches to
+numbered files rotated once they reach a size. CardWinRates then streams the records of the
+files, a line at a time, into a table of the win rate of the players of each card: only the
+plays of the rounds not ended yet are kept in memory.
+
+Print the win rates of the cards recorded in a directory with:
+
+    python -m src.core.telemetry telemetry/
+"""
+
+from __future__ import annotations
+
+import json
+from argparse import ArgumentParser
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Union
+
+from src.core.cards.card_template import get_template
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+# Number of records buffered before they are written, and size of a file before rotation
+DEFAULT_BATCH_SIZE = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_PREFIX = "telemetry"
+
+
+class RoundBegan(NamedTuple):
+    """A round has been dealt, with the role and team of the player at each seat."""
+
+    round_seed: int
+    roles: tuple[str | None, ...]
+    teams: tuple[str | None, ...]
+
+
+class CardPlayed(NamedTuple):
+    """A card has been placed, played on a target or discarded by the player at a seat.
+    The template id is None for a card which is not part of the catalog, and the board size
+    is the one after the card was played."""
+
+    round_seed: int
+    turn: int
+    seat: int
+    team: str | None
+    card: str
+    template_id: int | None
+    action: str
+    target: int | None
+    row: int | None
+    column: int | None
+    flipped: bool
+    board_rows: int
+    board_columns: int
+
+
+class GoalReached(NamedTuple):
+    """A goal card has been reached by a path and revealed."""
+
+    round_seed: int
+    turn: int
+    row: int
+    column: int
+    goal: str
+    gold: bool
+
+
+class RoundEnded(NamedTuple):
+    """A round is over, with the team of the player at each seat at the end of the round."""
+
+    round_seed: int
+    turns: int
+    gold_found: bool
+    winning_teams: tuple[str, ...]
+    teams: tuple[str | None, ...]
+
+
+TelemetryEvent = Union[RoundBegan, CardPlayed, GoalReached, RoundEnded]
+TelemetrySink = Callable[[TelemetryEvent], None]
+# Returns the sink of a worker of a simulation from its index, see the simulation module
+TelemetryFactory = Callable[[int], TelemetrySink]
+_EVENT_TYPES = {
+    event_type.__name__: event_type
+    for event_type in (RoundBegan, CardPlayed, GoalReached, RoundEnded)
+}
+
+# Actions recorded by CardPlayed
+PATH_ACTION = "path"
+PLAY_ACTION = "action"
+DISCARD_ACTION = "discard"
+
+
+def event_to_dict(event: TelemetryEvent) -> dict[str, Any]:
+    """Returns an event as JSON serializable data, with its type name."""
+    return {"type": type(event).__name__, **event._asdict()}
+
+
+def event_from_dict(record: dict[str, Any]) -> TelemetryEvent:
+    """Returns the event of a record written by event_to_dict.
+
+    The records of CardPlayed written before the template id and the flipped flag were
+    recorded are read with the template id of the card name and a card not flipped.
+
+    Raises:
+        ValueError: If the type of the record is not an event type.
+    """
+    event_type = _EVENT_TYPES.get(record.get("type"))
+    if event_type is None:
+        msg = f"Unknown telemetry event type {record.get('type')!r}."
+        raise ValueError(msg)
+    if event_type is CardPlayed and "template_id" not in record:
+        try:
+            template_id = get_template(record["card"]).template_id
+        except KeyError:  # not part of the catalog
+            template_id = None
+        record = {"template_id": template_id, "flipped": False, **record}
+    return event_type(
+        **{
+            field: tuple(record[field]) if isinstance(record[field], list) else record[field]
+            for field in event_type._fields
+        }
+    )
+
+
+class TelemetryWriter:
+    """Writes events as newline-delimited JSON records to rotated files of a directory.
+
+    Records are buffered and written in batches, so that recording an event costs its encoding
+    only. The files are named prefix-00000.ndjson, prefix-00001.ndjson and so on; a writer
+    never overwrites a file, numbering its files after the ones already in the directory.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str = DEFAULT_PREFIX,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initializes a TelemetryWriter, creating the directory if needed.
+
+        Args:
+            directory (str | Path): The directory of the files.
+            prefix (str): The start of the names of the files.
+            batch_size (int): The number of records buffered before they are written.
+            max_bytes (int): The size from which a file is closed and the next one opened.
+        """
+        self.__directory = Path(directory)
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        self.__prefix = prefix
+        self.__batch_size = batch_size
+        self.__max_bytes = max_bytes
+        self.__batch: list[str] = []
+        self.__records = 0
+        indices = [
+            int(index)
+            for index in (path.stem.rsplit("-", 1)[1] for path in self.__existing_files())
+            if index.isdigit()
+        ]
+        self.__index = max(indices, default=-1) + 1
+        self.__file = None
+        self.__size = 0
+
+    def __call__(self, event: TelemetryEvent) -> None:
+        """Records an event, see TelemetrySink."""
+        self.write(event_to_dict(event))
+
+    def __enter__(self) -> Self:
+        """Returns the writer, closed when the context exits."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Writes the buffered records and closes the current file."""
+        self.close()
+
+    @property
+    def records(self) -> int:
+        """Returns the number of records written or buffered so far."""
+        return self.__records
+
+    @property
+    def paths(self) -> list[Path]:
+        """Returns the files of the directory with the prefix of the writer, in order."""
+        return self.__existing_files()
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Buffers a JSON serializable record, the batch being written once full."""
+        self.__batch.append(json.dumps(record, separators=(",", ":")))
+        self.__records += 1
+        if len(self.__batch) >= self.__batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered records to the current file, then rotates it if it is full."""
+        if not self.__batch:
+            return
+        if self.__file is None:
+            path = self.__directory / f"{self.__prefix}-{self.__index:05d}.ndjson"
+            self.__file = path.open("ab")
+            self.__size = 0
+        data = ("\n".join(self.__batch) + "\n").encode("utf-8")
+        self.__batch.clear()
+        self.__file.write(data)
+        self.__file.flush()
+        self.__size += len(data)
+        if self.__size >= self.__max_bytes:
+            self.__file.close()
+            self.__file = None
+            self.__index += 1
+
+    def close(self) -> None:
+        """Writes the buffered records and closes the current file, the writer can still be
+        used and opens a new file when needed."""
+        self.flush()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+            self.__index += 1
+
+    def __existing_files(self) -> list[Path]:
+        """Returns the files of the directory with the prefix of the writer, in order."""
+        return sorted(self.__directory.glob(f"{self.__prefix}-[0-9]*.ndjson"))
+
+
+def iter_records(paths: Iterable[str | Path]) -> Iterator[dict[str, Any]]:
+    """Reads the records of telemetry files a line at a time, in order.
+    A last line left incomplete by a crash is ignored."""
+    for path in paths:
+        with Path(path).open(encoding="utf-8") as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+                yield json.loads(line)
+
+
+class CardStats(NamedTuple):
+    """The number of times a card was played, and the number of rounds won by its players."""
+
+    plays: int
+    wins: int
+
+    @property
+    def win_rate(self) -> float:
+        """Returns the share of the plays of the card by a player who won the round."""
+        return self.wins / self.plays if self.plays else 0.0
+
+
+class CardWinRates:
+    """Streams telemetry records into the win rate of the players of each card.
+
+    A play counts as won if the team of the player at the end of the round won it. The plays
+    of a round are kept until its RoundEnded record is read, the rounds of unfinished files
+    being left out of the table.
+
+    The rates only cover the cards the recorded players chose to play: they measure how
+    often the players of a card won, which depends on the policies and roles of the players
+    as much as on the card. Discards are left out by default.
+    """
+
+    def __init__(self, actions: Iterable[str] = (PATH_ACTION, PLAY_ACTION)) -> None:
+        """Initializes empty CardWinRates.
+
+        Args:
+            actions (Iterable[str]): The actions of the plays counted, discards being left
+                                     out by default.
+        """
+        self.__actions = frozenset(actions)
+        self.__plays = Counter[str]()
+        self.__wins = Counter[str]()
+        self.__rounds = 0
+        # Seats playing each card, by round not ended yet
+        self.__pending: dict[int, list[tuple[str, int]]] = {}
+
+    @property
+    def rounds(self) -> int:
+        """Returns the number of ended rounds counted."""
+        return self.__rounds
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Counts a record, in the order the records were written."""
+        record_type = record.get("type")
+        if record_type == "CardPlayed":
+            if record["action"] in self.__actions:
+                plays = self.__pending.setdefault(record["round_seed"], [])
+                plays.append((record["card"], record["seat"]))
+        elif record_type == "RoundEnded":
+            plays = self.__pending.pop(record["round_seed"], [])
+            winning_teams = set(record["winning_teams"])
+            teams = record["teams"]
+            for card, seat in plays:
+                self.__plays[card] += 1
+                if teams[seat] in winning_teams:
+                    self.__wins[card] += 1
+            self.__rounds += 1
+
+    def add_files(self, paths: Iterable[str | Path]) -> None:
+        """Counts the records of telemetry files, streamed a line at a time."""
+        for record in iter_records(paths):
+            self.add(record)
+
+    def table(self) -> dict[str, CardStats]:
+        """Returns the plays and wins of each card, by card name."""
+        return {card: CardStats(plays, self.__wins[card]) for card, plays in self.__plays.items()}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Prints the win rate of the players of each card recorded in a directory."""
+    parser = ArgumentParser(description="Prints the win rate of each card from telemetry.")
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX)
+    args = parser.parse_args(argv)
+    win_rates = CardWinRates()
+    win_rates.add_files(sorted(args.directory.glob(f"{args.prefix}-[0-9]*.ndjson")))
+    print(f"{win_rates.rounds} rounds")
+    table = sorted(win_rates.table().items(), key=lambda item: -item[1].win_rate)
+    for card, stats in table:
+        print(f"{card:<20} {stats.plays:>8} plays {stats.win_rate:>7.1%} won")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+This module contains the views of a game, what each player is allowed to see of it.
+
+A view is a read-only projection built lazily: each part of it is only computed when it is
+read, and the parts shared by every player (board, benches, hand sizes) are computed once
+for all the views. The parts are cached until a delta of the game shows that they changed,
+so serving every player of a table after a move only rebuilds what the move changed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from src.core.cards.card_template import get_template
+from src.core.cards.path_card import GoalCard
+from src.core.deltas import (
+    BenchCardAdded,
+    BenchCardRemoved,
+    BoardExpanded,
+    CardDiscarded,
+    CardDrawn,
+    CardPlaced,
+    CardRemoved,
+    GoalRevealed,
+    HandEmptied,
+    RoundStarted,
+    template_id_of,
+)
+
+if TYPE_CHECKING:
+    from src.core.cards.roles import Role
+    from src.core.deltas import Delta
+    from src.core.game import Game
+    from src.core.player import Player
+
+# Name of the catalog card standing for the back of a goal card
+HIDDEN_GOAL_NAME = "GOAL"
+
+_BOARD_DELTAS = (CardPlaced, CardRemoved, BoardExpanded, GoalRevealed)
+_HAND_DELTAS = (CardDrawn, CardDiscarded, HandEmptied)
+
+
+class CellView(NamedTuple):
+    """A card of the board as seen by the players, goal cards being shown face down."""
+
+    row: int
+    column: int
+    template_id: int | None
+    flipped: bool
+
+
+class PlayerView:
+    """Read-only projection of a game as seen by one of its players.
+
+    The view stays up to date with the game, its parts being read from the cache of the game.
+    """
+
+    def __init__(self, cache: ViewCache, player: Player, seat: int) -> None:
+        """Initializes a PlayerView of a player of the game."""
+        self.__cache = cache
+        self.__player = player
+        self.__seat = seat
+
+    @property
+    def player_name(self) -> str:
+        """Returns the name of the player seeing the game."""
+        return self.__player.name
+
+    @property
+    def seat(self) -> int:
+        """Returns the seat of the player seeing the game."""
+        return self.__seat
+
+    @property
+    def role(self) -> Role | None:
+        """Returns the role of the player, hidden from the other players."""
+        return self.__player.role
+
+    @property
+    def state(self) -> str:
+        """Returns the name of the state of the game."""
+        return self.__cache.game.state.name
+
+    @property
+    def current_seat(self) -> int | None:
+        """Returns the seat of the player whose turn it is, None outside a round."""
+        return self.__cache.current_seat()
+
+    @property
+    def hand(self) -> tuple[int | None, ...]:
+        """Returns the template ids of the cards in the hand of the player."""
+        return self.__cache.hand(self.__player)
+
+    @property
+    def hand_sizes(self) -> tuple[int, ...]:
+        """Returns the number of cards in the hand of each player, by seat."""
+        return self.__cache.hand_sizes()
+
+    @property
+    def benches(self) -> tuple[tuple[int | None, ...], ...]:
+        """Returns the template ids of the cards on the bench of each player, by seat."""
+        return self.__cache.benches()
+
+    @property
+    def board(self) -> tuple[CellView, ...]:
+        """Returns the cards of the board, the goal cards not revealed being face down."""
+        return self.__cache.board()
+
+    @property
+    def board_size(self) -> tuple[int, int]:
+        """Returns the number of rows and columns of the board."""
+        game_round = self.__cache.game.current_round
+        return (0, 0) if game_round is None else (game_round.board.rows, game_round.board.columns)
+
+    @property
+    def known_goals(self) -> dict[tuple[int, int], int | None]:
+        """Returns the template ids of the hidden goal cards the player has seen, by position."""
+        game_round = self.__cache.game.current_round
+        if game_round is None:
+            return {}
+        board = game_round.board
+        known_goals = {}
+        for row, column in game_round.known_goals(self.__player):
+            goal_card = board.get_card(row, column)
+            if isinstance(goal_card, GoalCard):
+                known_goals[row, column] = get_template(goal_card.read_real_name()).template_id
+        return known_goals
+
+    @property
+    def deck_size(self) -> int:
+        """Returns the number of cards left in the deck."""
+        game_round = self.__cache.game.current_round
+        return 0 if game_round is None else game_round.deck_size
+
+    @property
+    def scores(self) -> tuple[tuple[int, ...], ...]:
+        """Returns the scores of each player, by seat."""
+        return tuple(tuple(player.scores) for player in self.__cache.game.players)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the view as JSON serializable data."""
+        return {
+            "player": self.player_name,
+            "seat": self.__seat,
+            "role": getattr(self.role, "NAME", None),
+            "state": self.state,
+            "current_seat": self.current_seat,
+            "hand": list(self.hand),
+            "hand_sizes": list(self.hand_sizes),
+            "benches": [list(bench) for bench in self.benches],
+            "board": [list(cell) for cell in self.board],
+            "board_size": list(self.board_size),
+            "known_goals": [[*position, id_] for position, id_ in self.known_goals.items()],
+            "deck_size": self.deck_size,
+            "scores": [list(scores) for scores in self.scores],
+        }
+
+
+class ViewCache:
+    """Caches the parts of the views of a game, invalidated by the deltas of the game."""
+
+    def __init__(self, game: Game) -> None:
+        """Initializes an empty ViewCache for a game."""
+        self.__game = game
+        self.__views: dict[str, PlayerView] = {}
+        self.__board: tuple[CellView, ...] | None = None
+        self.__benches: tuple[tuple[int | None, ...], ...] | None = None
+        self.__hand_sizes: tuple[int, ...] | None = None
+        self.__hands: dict[str, tuple[int | None, ...]] = {}
+
+    @property
+    def game(self) -> Game:
+        """Returns the game of the views."""
+        return self.__game
+
+    def view_for(self, player: Player) -> PlayerView:
+        """Returns the view of a player of the game, created on the first call.
+
+        Raises:
+            ValueError: If the player is not a player of the game.
+        """
+        view = self.__views.get(player.name)
+        if view is None:
+            players = self.__game.players
+            seat = next((seat for seat, other in enumerate(players) if other is player), None)
+            if seat is None:
+                msg = "The player is not a player of the game."
+                raise ValueError(msg)
+            view = PlayerView(self, player, seat)
+            self.__views[player.name] = view
+        return view
+
+    def on_delta(self, delta: Delta) -> None:
+        """Invalidates the parts of the views changed by a delta, every part for a new round."""
+        if isinstance(delta, RoundStarted):
+            self.__board = None
+            self.__benches = None
+            self.__hand_sizes = None
+            self.__hands.clear()
+        elif isinstance(delta, _BOARD_DELTAS):
+            self.__board = None
+        elif isinstance(delta, _HAND_DELTAS):
+            self.__hands.pop(delta.player, None)
+            self.__hand_sizes = None
+        elif isinstance(delta, (BenchCardAdded, BenchCardRemoved)):
+            self.__benches = None
+
+    def current_seat(self) -> int | None:
+        """Returns the seat of the player whose turn it is, None outside a round."""
+        game_round = self.__game.current_round
+        if game_round is None or game_round.is_over:
+            return None
+        current_player = game_round.current_player
+        players = self.__game.players
+        return next(seat for seat, player in enumerate(players) if player is current_player)
+
+    def hand(self, player: Player) -> tuple[int | None, ...]:
+        """Returns the template ids of the hand of a player."""
+        hand = self.__hands.get(player.name)
+        if hand is None:
+            hand = tuple(template_id_of(card) for card in player.hand)
+            self.__hands[player.name] = hand
+        return hand
+
+    def hand_sizes(self) -> tuple[int, ...]:
+        """Returns the number of cards in the hand of each player."""
+        if self.__hand_sizes is None:
+            self.__hand_sizes = tuple(len(player.hand) for player in self.__game.players)
+        return self.__hand_sizes
+
+    def benches(self) -> tuple[tuple[int | None, ...], ...]:
+        """Returns the template ids of the bench of each player."""
+        if self.__benches is None:
+            self.__benches = tuple(
+                tuple(template_id_of(card) for card in player.bench)
+                for player in self.__game.players
+            )
+        return self.__benches
+
+    def board(self) -> tuple[CellView, ...]:
+        """Returns the public cards of the board, sorted by position."""
+        if self.__board is None:
+            game_round = self.__game.current_round
+            if game_round is None:
+                return ()
+            hidden_goal = get_template(HIDDEN_GOAL_NAME).template_id
+            cells = []
+            for row, column, card in game_round.board.iter_cards():
+                if isinstance(card, GoalCard) and not card.is_visible:
+                    cells.append(CellView(row, column, hidden_goal, flipped=False))
+                else:
+                    cells.append(CellView(row, column, template_id_of(card), card.is_flipped))
+            self.__board = tuple(sorted(cells))
+        return self.__board
@@ -0,0 +1,60 @@
+"""
+This module contains the keys of the Zobrist hashes of the boards, decks, players and rounds.
+
+A Zobrist hash combines one random key per element of a position, so that it is updated in
+constant time when an element is added or removed instead of hashing the whole position
+again. Sets of elements, such as the cards of a board, combine their keys with a XOR, and
+multisets, such as the cards of a hand, with a sum modulo 2**64 so that identical cards do
+not cancel each other out.
+
+Keys are derived from the elements with a fixed mixing function rather than drawn at random,
+so that hashes are the same in every process and can be stored along simulation logs.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from hashlib import blake2b
+
+MASK = (1 << 64) - 1
+
+# Tags separating the keys of the different kinds of elements
+_CELL_TAG = 1
+_WINDOW_TAG = 2
+_DECK_TAG = 3
+
+
+def mix(*values: int) -> int:
+    """Returns a 64-bit hash of integers, well spread even for close integers (splitmix64)."""
+    result = 0
+    for value in values:
+        result = (result ^ value) + 0x9E3779B97F4A7C15 & MASK
+        result = (result ^ result >> 30) * 0xBF58476D1CE4E5B9 & MASK
+        result = (result ^ result >> 27) * 0x94D049BB133111EB & MASK
+        result ^= result >> 31
+    return result
+
+
+@cache
+def name_key(name: str) -> int:
+    """Returns the key of a card or role name, the same in every process."""
+    return int.from_bytes(blake2b(name.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@cache
+def cell_key(row: int, column: int, name: str, *, flipped: bool, visible: bool) -> int:
+    """Returns the key of a card of the board, at an absolute cell and in an orientation."""
+    position = (row & 0xFFFF) << 16 | column & 0xFFFF
+    return mix(_CELL_TAG, position << 2 | flipped << 1 | visible, name_key(name))
+
+
+@cache
+def window_key(top: int, left: int, rows: int, columns: int) -> int:
+    """Returns the key of the bounds of a board."""
+    return mix(_WINDOW_TAG, (top & 0xFFFF) << 48 | (left & 0xFFFF) << 32 | rows << 16 | columns)
+
+
+@cache
+def deck_key(template_id: int, position: int) -> int:
+    """Returns the key of a card of a deck at a position from the bottom of the pile."""
+    return mix(_DECK_TAG, template_id << 16 | position)
@@ -0,0 +1,357 @@
+"""
+Asyncio server hosting many games, or tables, in one process.
+
+Clients speak a line protocol over TCP: each request is a JSON object on one line, answered by
+a JSON object on one line. The requests are:
+
+    {"op": "create", "seed": 1}                      -> {"ok": true, "table": "1", ...}
+    {"op": "submit", "table": "1", "input": "names", "args": [["Alice", "Bob", "Charlie"]]}
+    {"op": "watch", "table": "1"}
+    {"op": "view", "table": "1", "seat": 0}
+    {"op": "bot", "table": "1"}
+    {"op": "stats"}
+    {"op": "close", "table": "1"}
+
+The inputs are the ones recorded in the action logs, see the inputs module. Each table owns a
+queue consumed by its own task, so the inputs of a table are applied in order while the
+tables never wait for each other.
+
+The bot request plays the turn of the current player with the bot policy of the server. The
+search runs on a copy of the round in a thread of the executor, so that the other tables keep
+being served while the bot thinks.
+
+Watching a table subscribes the connection to its deltas: after each step, the changes of
+the game are pushed as one {"table": "1", "deltas": [...]} line, the drawn cards being hidden.
+
+Run the server with:
+
+    python -m src.server.game_server --port 8765
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from argparse import ArgumentParser
+from collections import deque
+from itertools import count
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from src.core.action_log import LogEntry
+from src.core.deltas import delta_to_dict
+from src.core.game import Game, GameState
+from src.core.inputs import (
+    CancelAction,
+    ChooseAction,
+    ChooseCards,
+    ChoosePlayer,
+    TurnAction,
+    input_from_entry,
+)
+from src.core.ismcts import IsmctsPolicy
+
+if TYPE_CHECKING:
+    from src.core.inputs import GameInput
+    from src.core.policies import Policy
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Number of recent steps whose latency is kept to compute percentiles
+LATENCY_WINDOW = 100_000
+
+
+class ServerStats:
+    """Throughput and latency of the steps handled by a server."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Initializes ServerStats, the throughput being measured from now on.
+
+        Args:
+            window (int): The number of recent steps whose latency is kept.
+        """
+        self.__started = perf_counter()
+        self.__steps = 0
+        self.__latencies: deque[float] = deque(maxlen=window)
+
+    @property
+    def steps(self) -> int:
+        """Returns the number of steps handled."""
+        return self.__steps
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of steps handled per second."""
+        return self.__steps / max(perf_counter() - self.__started, 1e-9)
+
+    def record(self, latency: float) -> None:
+        """Records a step, from the reception of its input to its answer, in seconds."""
+        self.__steps += 1
+        self.__latencies.append(latency)
+
+    def percentile(self, percent: float) -> float:
+        """Returns a percentile of the latency of the recent steps, in seconds."""
+        if not self.__latencies:
+            return 0.0
+        latencies = sorted(self.__latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * percent / 100))
+        return latencies[index]
+
+    def to_dict(self) -> dict[str, float]:
+        """Returns the statistics as plain data, latencies being in milliseconds."""
+        return {
+            "steps": self.__steps,
+            "throughput": self.throughput,
+            "p50_ms": self.percentile(50) * 1e3,
+            "p99_ms": self.percentile(99) * 1e3,
+        }
+
+
+class Table:
+    """A game hosted by the server, with the queue of its pending inputs."""
+
+    def __init__(self, table_id: str, game: Game, stats: ServerStats) -> None:
+        """Initializes a Table and starts the task applying its inputs."""
+        self.__table_id = table_id
+        self.__game = game
+        self.__stats = stats
+        self.__queue: asyncio.Queue[tuple[GameInput, float, asyncio.Future]] = asyncio.Queue()
+        self.__watchers: list[asyncio.StreamWriter] = []
+        self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    @property
+    def table_id(self) -> str:
+        """Returns the id of the table."""
+        return self.__table_id
+
+    @property
+    def game(self) -> Game:
+        """Returns the game of the table."""
+        return self.__game
+
+    def watch(self, writer: asyncio.StreamWriter) -> None:
+        """Pushes the deltas of each step of the game to a connection."""
+        self.__watchers.append(writer)
+
+    async def submit(self, game_input: GameInput) -> tuple[bool, str]:
+        """Queues an input and waits until it has been applied to the game."""
+        future = asyncio.get_running_loop().create_future()
+        self.__queue.put_nowait((game_input, perf_counter(), future))
+        return await future
+
+    async def play_bot(self, policy: Policy) -> tuple[bool, str]:
+        """Plays the turn of the current player with a policy, which searches the move on a
+        copy of the round in the default executor without blocking the event loop."""
+        game_round = self.__game.current_round
+        if self.__game.state != GameState.CHOSE_ACTION:
+            return False, "The current player is not choosing an action."
+        turns_played = game_round.turns_played
+        lookahead = game_round.copy()
+        move = await asyncio.get_running_loop().run_in_executor(None, policy, lookahead)
+        if self.__game.current_round is not game_round or game_round.turns_played != turns_played:
+            return False, "The game has changed during the search."
+
+        hand = lookahead.current_player.hand
+        hand_index = next((index for index, card in enumerate(hand) if card is move.card), None)
+        if hand_index is None:
+            return False, "The policy chose a card which is not in the hand."
+        if move.is_action:
+            action = TurnAction.PLAY_ACTION
+        elif move.is_discard:
+            action = TurnAction.DISCARD
+        else:
+            action = TurnAction.PLAY_PATH
+        result, message = await self.submit(ChooseAction(action))
+        if not result:
+            return result, message
+        result, message = await self.submit(
+            ChooseCards(hand_index, move.row, move.column, flipped=move.flipped)
+        )
+        if result and move.target is not None:
+            result, message = await self.submit(ChoosePlayer(move.target))
+        if not result:
+            await self.submit(CancelAction())
+        return result, message
+
+    def close(self) -> None:
+        """Stops the task of the table, pending inputs are cancelled."""
+        self.__task.cancel()
+        while not self.__queue.empty():
+            _, _, future = self.__queue.get_nowait()
+            future.cancel()
+
+    async def __run(self) -> None:
+        """Applies the queued inputs one at a time, in the order they were received."""
+        while True:
+            game_input, received, future = await self.__queue.get()
+            try:
+                result = self.__game.submit(game_input)
+            except (TypeError, ValueError) as error:  # arguments of the wrong type
+                result = False, f"Invalid input: {error}"
+            except Exception as error:  # noqa: BLE001  # the table serves its next inputs
+                result = False, f"The input failed: {error!r}"
+            self.__stats.record(perf_counter() - received)
+            if not future.cancelled():
+                future.set_result(result)
+            self.__push_deltas()
+
+    def __push_deltas(self) -> None:
+        """Sends the deltas of the last step to the watchers, encoded once for all of them."""
+        deltas = self.__game.drain_deltas()
+        self.__watchers = [writer for writer in self.__watchers if not writer.is_closing()]
+        if not deltas or not self.__watchers:
+            return
+        data = {
+            "table": self.__table_id,
+            "deltas": [delta_to_dict(delta, public=True) for delta in deltas],
+        }
+        line = json.dumps(data).encode("utf-8") + b"\n"
+        for writer in self.__watchers:
+            writer.write(line)
+
+
+class GameServer:
+    """Hosts many tables, reached through the line protocol or directly."""
+
+    def __init__(self, bot: Policy | None = None) -> None:
+        """Initializes a GameServer without any table.
+
+        Args:
+            bot (Policy | None): The policy playing the bot requests, an IsmctsPolicy with its
+                                 default time budget if None.
+        """
+        self.__tables: dict[str, Table] = {}
+        self.__table_ids = count(1)
+        self.__stats = ServerStats()
+        self.__bot = IsmctsPolicy() if bot is None else bot
+
+    @property
+    def tables(self) -> dict[str, Table]:
+        """Returns the tables of the server, by id."""
+        return self.__tables
+
+    @property
+    def stats(self) -> ServerStats:
+        """Returns the statistics of the steps handled by the server."""
+        return self.__stats
+
+    def create_table(self, seed: int | None = None) -> Table:
+        """Creates a table with a new game. Must be called from the event loop."""
+        table_id = str(next(self.__table_ids))
+        table = Table(table_id, Game(seed), self.__stats)
+        self.__tables[table_id] = table
+        return table
+
+    def close_table(self, table_id: str) -> bool:
+        """Closes a table, returns False if there is no table with this id."""
+        table = self.__tables.pop(table_id, None)
+        if table is None:
+            return False
+        table.close()
+        return True
+
+    def close(self) -> None:
+        """Closes every table."""
+        for table_id in list(self.__tables):
+            self.close_table(table_id)
+
+    async def handle_request(
+        self, request: dict[str, Any], writer: asyncio.StreamWriter | None = None
+    ) -> dict[str, Any]:
+        """Answers a request of the line protocol, received from the given connection."""
+        operation = request.get("op")
+        if operation == "create":
+            try:
+                table = self.create_table(request.get("seed"))
+            except ValueError as error:
+                return {"ok": False, "message": str(error)}
+            return {"ok": True, "table": table.table_id, **_describe(table.game)}
+        if operation == "stats":
+            return {"ok": True, "tables": len(self.__tables), **self.__stats.to_dict()}
+
+        table = self.__tables.get(str(request.get("table")))
+        if table is None:
+            return {"ok": False, "message": "Unknown table."}
+        if operation == "watch" and writer is not None:
+            table.watch(writer)
+            return {"ok": True, "message": "The table is watched."}
+        if operation == "view":
+            players = table.game.players
+            seat = request.get("seat")
+            if not isinstance(seat, int) or not 0 <= seat < len(players):
+                return {"ok": False, "message": "There is no player at this seat."}
+            return {"ok": True, "view": table.game.view_for(players[seat]).to_dict()}
+        if operation == "bot":
+            result, message = await table.play_bot(self.__bot)
+            return {"ok": result, "message": message, **_describe(table.game)}
+        if operation == "close":
+            self.close_table(table.table_id)
+            return {"ok": True, "message": "The table has been closed."}
+        if operation == "submit":
+            try:
+                game_input = input_from_entry(
+                    LogEntry(request.get("input"), tuple(request.get("args", ())))
+                )
+            except (KeyError, TypeError, ValueError) as error:
+                return {"ok": False, "message": f"Invalid input: {error}"}
+            result, message = await table.submit(game_input)
+            return {"ok": result, "message": message, **_describe(table.game)}
+        return {"ok": False, "message": f"Unknown operation {operation!r}."}
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answers the requests of a client until it disconnects."""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    response = {"ok": False, "message": "Requests must be JSON objects."}
+                else:
+                    if isinstance(request, dict):
+                        response = await self.handle_request(request, writer)
+                    else:
+                        response = {"ok": False, "message": "Requests must be JSON objects."}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.Server:
+        """Starts listening for clients, returns the started asyncio server."""
+        return await asyncio.start_server(self.handle_client, host, port)
+
+
+def _describe(game: Game) -> dict[str, Any]:
+    """Returns the public state of a game sent with each answer."""
+    game_round = game.current_round
+    current_seat = None
+    if game_round is not None and not game_round.is_over:
+        current_player = game_round.current_player
+        current_seat = next(
+            seat for seat, player in enumerate(game.players) if player is current_player
+        )
+    return {"state": game.state.name, "current_seat": current_seat}
+
+
+async def _serve_forever(host: str, port: int) -> None:
+    """Runs a server until it is interrupted."""
+    game_server = GameServer()
+    server = await game_server.serve(host, port)
+    print(f"Serving on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Runs the game server."""
+    parser = ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    asyncio.run(_serve_forever(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Tests for the ActionLog module."""
+
+from pathlib import Path
+
+from src.core.action_log import ActionLog, LogEntry
+from src.core.game import Game, GameState, TurnAction
+
+
+def test_action_log_in_memory() -> None:
+    """Test that inputs are appended in order and kept in memory."""
+    log = ActionLog(7)
+    log.append("names", ["Alice", "Bob", "Charlie"])
+    log.append("action", "DISCARD")
+    assert log.seed == 7
+    assert log.path is None
+    assert len(log) == 2
+    assert log[1] == LogEntry("action", ("DISCARD",))
+    assert [entry.kind for entry in log] == ["names", "action"]
+
+
+def test_action_log_file(tmp_path: Path) -> None:
+    """Test that a log written to a file is loaded back and appended to."""
+    path = tmp_path / "game.jsonl"
+    log = ActionLog(7, path)
+    log.append("names", ["Alice", "Bob", "Charlie"])
+    log.append("cards", 2, 1, 3, True)
+
+    loaded = ActionLog.load(path)
+    assert loaded.seed == 7
+    assert list(loaded) == list(log)
+    loaded.append("player", 1)
+    assert len(ActionLog.load(path)) == 3
+
+
+def test_action_log_ignores_incomplete_line(tmp_path: Path) -> None:
+    """Test that a last line interrupted by a crash is ignored, and removed before the
+    next input is appended."""
+    path = tmp_path / "game.jsonl"
+    log = ActionLog(7, path)
+    log.append("names", ["Alice", "Bob", "Charlie"])
+    with path.open("a", encoding="utf-8") as file:
+        file.write('["action", "DIS')
+    loaded = ActionLog.load(path)
+    assert len(loaded) == 1
+    loaded.append("action", "DISCARD")
+    assert list(ActionLog.load(path)) == [
+        LogEntry("names", (["Alice", "Bob", "Charlie"],)),
+        LogEntry("action", ("DISCARD",)),
+    ]
+
+
+def test_game_recovered_from_log_file(tmp_path: Path) -> None:
+    """Test that a game written to a log file is recovered after a crash."""
+    path = tmp_path / "game.jsonl"
+    game = Game(seed=3, log_path=path)
+    game.name_players(["Alice", "Bob", "Charlie"])
+    game.choose_action(TurnAction.DISCARD)
+    game.choose_cards(0)
+    game.choose_action(TurnAction.DISCARD)
+
+    recovered = Game.replay(ActionLog.load(path), fast_forward=True)
+    assert recovered.to_state() == game.to_state()
+    assert recovered.state == GameState.CHOSE_CARDS
+    recovered.choose_cards(0)
+    assert len(ActionLog.load(path)) == 5
@@ -0,0 +1,19 @@
+"""Tests for the regression check of the core benchmarks."""
+
+from src.benchmarks.core_benchmarks import CALIBRATION, find_regressions
+
+
+def test_find_regressions() -> None:
+    """Test that only the benchmarks slower than the threshold are reported."""
+    baseline = {"place_card": 1.0, "draw": 2.0}
+    results = {"place_card": 1.2, "draw": 3.0, "new_benchmark": 5.0}
+    assert find_regressions(results, baseline, threshold=0.25) == {"draw": 0.5}
+
+
+def test_find_regressions_calibrated() -> None:
+    """Test that results are compared relatively to the speed of the machine."""
+    baseline = {CALIBRATION: 1.0, "place_card": 1.0}
+    slower_machine = {CALIBRATION: 2.0, "place_card": 2.2}
+    assert find_regressions(slower_machine, baseline, threshold=0.25) == {}
+    regressed = {CALIBRATION: 1.0, "place_card": 1.5}
+    assert find_regressions(regressed, baseline, threshold=0.25) == {"place_card": 0.5}
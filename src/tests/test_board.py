@@ -3,6 +3,7 @@
 from pytest import raises
 
 from src.core.board import Board
+from src.core.cards.card_template import get_template
 from src.core.cards.path_card import PathCard
 
 
@@ -70,3 +71,198 @@ def test_board_place_card() -> None:
 
     result, _ = board.place_card(3, 0, path_card_invalid)
     assert result is True
+
+
+def test_board_place_card_beyond_edge() -> None:
+    """Test that placing a card outside the bounds expands the board around it."""
+    board = Board()
+    path_card = PathCard.from_dict("TestPathCard", {"UP": 0, "RIGHT": 1, "DOWN": 1, "LEFT": 0})
+    result, _ = board.place_card(2, -1, path_card)
+    assert result is True
+    assert board.columns == 8
+    assert board.start_position == (2, 1)
+    assert board.get_card(2, 0) is path_card
+    assert board.get_card(2, 1).name == "START"
+
+
+def test_board_failed_placement_keeps_bounds() -> None:
+    """Test that a rejected placement outside the bounds does not expand the board."""
+    board = Board()
+    path_card = PathCard.from_dict("TestPathCard", {"UP": 1, "RIGHT": 1, "DOWN": 1, "LEFT": 1})
+    result, _ = board.place_card(-1, 3, path_card)
+    assert result is False
+    assert board.rows == 5
+    assert board.columns == 7
+    assert board.start_position == (2, 0)
+
+
+def test_board_open_ends() -> None:
+    """Test that the open ends follow the paths connected to the start card."""
+    board = Board()
+    assert board.open_ends == {(1, 0), (3, 0), (2, 1), (2, -1)}
+
+    dead_end = PathCard.from_dict("DeadEnd", {"UP": 0, "RIGHT": 0, "DOWN": 0, "LEFT": -1})
+    result, _ = board.place_card(2, 1, dead_end)
+    assert result is True
+    assert not board.is_connected(2, 1)
+    assert board.open_ends == {(1, 0), (3, 0), (2, -1)}
+
+    straight = PathCard.from_dict("Straight", {"UP": 0, "RIGHT": 1, "DOWN": 0, "LEFT": 1})
+    result, message = board.place_card(2, 2, straight)
+    assert result is False
+    assert message == "Connection mismatch with LEFT card."
+
+
+def test_board_reached_goals() -> None:
+    """Test that a goal is reported as reached once a path connects it to the start."""
+    board = Board()
+    for column in range(1, 6):
+        assert board.reached_goals == []
+        straight = PathCard.from_dict("Straight", {"UP": 0, "RIGHT": 1, "DOWN": 0, "LEFT": 1})
+        result, _ = board.place_card(2, column, straight)
+        assert result is True
+    assert board.reached_goals == [(2, 6)]
+    assert board.is_connected(2, 6)
+    assert not board.is_connected(0, 6)
+
+
+def test_board_remove_card() -> None:
+    """Test that removing a card disconnects the paths that went through it."""
+    board = Board()
+    straight = PathCard.from_dict("Straight", {"UP": 0, "RIGHT": 1, "DOWN": 0, "LEFT": 1})
+    board.place_card(2, 1, straight)
+    board.place_card(2, 2, straight)
+    assert (2, 3) in board.open_ends
+
+    result, _ = board.remove_card(2, 1)
+    assert result is True
+    assert board.get_card(2, 1) is None
+    assert not board.is_connected(2, 2)
+    assert (2, 3) not in board.open_ends
+    assert (2, 1) in board.open_ends
+
+    result, _ = board.remove_card(*board.start_position)
+    assert result is False
+    result, _ = board.remove_card(2, 6)
+    assert result is False
+    result, _ = board.remove_card(0, 0)
+    assert result is False
+
+
+def test_board_crossing_paths() -> None:
+    """Test that the two paths of a crossing card are connected independently."""
+    board = Board()
+    crossing = PathCard.from_dict("Crossing", {"UP": 1, "RIGHT": 1, "DOWN": 2, "LEFT": 2})
+    result, _ = board.place_card(2, 1, crossing)
+    assert result is True
+    assert (3, 1) in board.open_ends
+    assert (1, 1) not in board.open_ends
+    assert (2, 2) not in board.open_ends
+
+
+def test_board_legal_moves() -> None:
+    """Test that legal moves match the placements accepted by the board."""
+    board = Board()
+    straight = PathCard.from_dict("Straight", {"UP": 0, "RIGHT": 1, "DOWN": 0, "LEFT": 1})
+    corner = PathCard.from_dict("Corner", {"UP": 1, "RIGHT": 0, "DOWN": 0, "LEFT": -1})
+    hand = [straight, PathCard.from_dict("Straight", {"RIGHT": 1, "LEFT": 1}), corner]
+
+    moves = board.legal_moves(hand)
+    assert sorted((card.name, row, column, flipped) for card, row, column, flipped in moves) == [
+        ("Corner", 1, 0, True),
+        ("Corner", 2, -1, True),
+        ("Corner", 2, 1, False),
+        ("Corner", 3, 0, False),
+        ("Straight", 2, -1, False),
+        ("Straight", 2, 1, False),
+    ]
+    assert board.rows == 5
+    assert board.columns == 7
+    assert board.get_card(2, 1) is None
+
+    for card, row, column, flipped in moves:
+        trial_board = Board()
+        if flipped:
+            card.flip()
+        result, _ = trial_board.place_card(row, column, card)
+        if flipped:
+            card.flip()
+        assert result is True
+
+
+def test_board_reveal_goal() -> None:
+    """Test that a revealed goal faces the path that reached it."""
+    board = Board()
+    straight = PathCard.from_dict("Straight", {"UP": 0, "RIGHT": 1, "DOWN": 0, "LEFT": 1})
+    for column in range(1, 6):
+        board.place_card(2, column, straight)
+    result, _ = board.reveal_goal(2, 6)
+    assert result is True
+    goal_card = board.get_card(2, 6)
+    assert goal_card.is_visible
+    assert goal_card.connections.LEFT == 1
+    assert board.reached_goals == [(2, 6)]
+
+    result, _ = board.reveal_goal(2, 6)
+    assert result is False
+    result, _ = board.reveal_goal(2, 5)
+    assert result is False
+
+
+def _board_index(board: Board) -> tuple:
+    """Returns what a journaled move must restore: the cards, bounds and connectivity."""
+    connected = {
+        (row, column)
+        for row in range(-1, board.rows + 1)
+        for column in range(-1, board.columns + 1)
+        if board.is_connected(row, column)
+    }
+    return board.to_state(), board.open_ends, board.reached_goals, connected
+
+
+def test_board_push_and_pop_moves() -> None:
+    """Test that journaled placements, expansions and removals are reverted exactly."""
+    board = Board()
+    board.place_card(2, 1, get_template("RL+").create())
+    states = [_board_index(board)]
+
+    assert board.push_move(2, -1, get_template("RL+").create()) == (
+        True,
+        "Card placed successfully.",
+    )
+    assert board.columns == 8
+    assert board.start_position == (2, 1)
+    states.append(_board_index(board))
+    turn = get_template("UR+").create()
+    assert board.push_move(1, 1, turn, flipped=True)[0] is True
+    assert turn.is_flipped
+    assert board.push_move(1, 1, None)[0] is True
+    assert (1, 1) in board.open_ends
+    assert board.push_move(1, 1, None) == (False, "There is no card at this position.")
+    assert board.push_move(0, 0, turn)[0] is False
+    assert board.journal_size == 3
+
+    assert board.pop_move() == (True, "Card put back.")
+    assert board.pop_move() == (True, "Card taken back.")
+    assert not turn.is_flipped
+    assert _board_index(board) == states[1]
+    board.pop_move()
+    assert _board_index(board) == states[0]
+    assert board.pop_move() == (False, "There is no move to revert.")
+
+
+def test_board_journal_is_silent_and_cleared() -> None:
+    """Test that journaled moves are not sent to the listeners, and that other changes
+    clear the journal."""
+    board = Board()
+    deltas = []
+    board.add_listener(deltas.append)
+    straight = PathCard.from_dict("Straight", {"UP": 0, "RIGHT": 1, "DOWN": 0, "LEFT": 1})
+    board.push_move(2, 1, straight)
+    board.pop_move()
+    assert deltas == []
+
+    board.push_move(2, 1, straight)
+    board.place_card(2, 2, straight)
+    assert board.journal_size == 0
+    assert board.pop_move()[0] is False
@@ -0,0 +1,73 @@
+"""Tests for the board_batch module."""
+
+from pytest import importorskip
+
+from src.core.board import Board
+from src.core.board_batch import BoardBatch
+from src.core.cards.card_template import get_template
+from src.core.player import Player
+from src.core.policies import play_move, random_policy
+from src.core.round import Round
+
+importorskip("numpy")
+
+
+def _played_boards() -> list[Board]:
+    """Returns copies of the board of a round after each turn, a card being removed from the
+    last one."""
+    game_round = Round([Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")], 6)
+    boards = [game_round.board.copy()]
+    while not game_round.is_over:
+        play_move(game_round, random_policy(game_round))
+        boards.append(game_round.board.copy())
+    board = boards[-1].copy()
+    fixed_cells = [board.start_position, *board.goal_positions]
+    row, column = next(
+        (row, column) for row, column, _ in board.iter_cards() if (row, column) not in fixed_cells
+    )
+    assert board.remove_card(row, column)[0]
+    boards.append(board)
+    return boards
+
+
+def test_board_batch_matches_the_boards() -> None:
+    """Test that the batch finds the same goals, open ends and connected cells as the boards."""
+    boards = _played_boards()
+    batch = BoardBatch.from_boards(boards)
+    assert len(batch) == len(boards)
+    goals_reached = batch.goals_reached()
+    open_end_counts = batch.open_end_counts()
+    connected_cells = batch.connected_cells()
+    for index, board in enumerate(boards):
+        reached_goals = board.reached_goals
+        assert goals_reached[index].tolist() == [
+            position in reached_goals for position in board.goal_positions
+        ]
+        assert open_end_counts[index] == len(board.open_ends)
+        start_row, start_column = board.start_position
+        origin_row, origin_column = batch.origins[index]
+        for row in range(-1, board.rows + 1):
+            for column in range(-1, board.columns + 1):
+                cell = (row - start_row + 2 - origin_row, column - start_column - origin_column)
+                assert bool(connected_cells[index][cell]) == board.is_connected(row, column)
+
+
+def test_board_batch_round_trip() -> None:
+    """Test that boards unpacked from a batch are the packed boards."""
+    board = Board()
+    board.place_card(2, 1, get_template("RL+").create())
+    board.place_card(2, -1, get_template("RL+").create())
+    boards = [*_played_boards()[-3:], board]
+    unpacked = BoardBatch.from_boards(boards).to_boards()
+    assert [other.to_state() for other in unpacked] == [other.to_state() for other in boards]
+
+
+def test_board_batch_paths() -> None:
+    """Test the packing of the paths of the cards, goal cards not revealed being crossings."""
+    batch = BoardBatch.from_boards([Board()])
+    origin_row, origin_column = batch.origins[0]
+    assert batch.paths[0, 2 - origin_row, 0 - origin_column] == 0b1111
+    assert batch.paths[0, 0 - origin_row, 6 - origin_column] == 0b1111
+    assert batch.occupied[0].sum() == 4
+    assert batch.goals_reached().tolist() == [[False, False, False]]
+    assert batch.open_end_counts().tolist() == [4]
@@ -0,0 +1,34 @@
+"""Tests for the CardPile module."""
+
+from pytest import raises
+
+from src.core.cards.card_pile import CardPile, CardPileView
+from src.core.cards.card_template import get_template
+
+
+def test_card_pile_counts_cards_by_name() -> None:
+    """Test that a pile keeps its order while counting its cards by name."""
+    first, second = get_template("RL+").create(), get_template("RL+").create()
+    lamp = get_template("Lamp").create()
+    pile = CardPile([first, lamp, second])
+    assert pile == [first, lamp, second]
+    assert pile.count(first) == 2
+    assert get_template("Lamp").create() in pile
+    assert get_template("Map").create() not in pile
+
+    assert pile.index(second) == 2
+    assert pile.index(get_template("RL+").create()) == 0
+    assert pile.pop(2) is second
+    assert pile.count_name("RL+") == 1
+    assert pile.zobrist == CardPile([lamp, first]).zobrist
+    copied = pile.copy()
+    view = pile.view()
+    assert isinstance(view, CardPileView)
+    assert view == pile
+    assert view.count_name("Lamp") == 1
+    pile.clear()
+    assert len(view) == 0
+    assert len(copied) == 2
+    assert first not in pile
+    with raises(ValueError, match="The card is not in the pile"):
+        pile.index(first)
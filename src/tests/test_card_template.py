@@ -0,0 +1,54 @@
+"""Tests for the card_template module."""
+
+from src.core.cards.action_card import ActionCard
+from src.core.cards.card_template import (
+    get_card_templates,
+    get_deck_template_ids,
+    get_template,
+)
+from src.core.cards.catalog import get_catalog
+from src.core.cards.path_card import PathCard
+
+
+def test_card_templates_are_compiled_once() -> None:
+    """Test that the templates are shared between calls and indexed by id."""
+    templates = get_card_templates()
+    assert get_card_templates() is templates
+    assert all(template.template_id == index for index, template in enumerate(templates))
+    assert get_template("URDL+") is templates[get_template("URDL+").template_id]
+
+
+def test_card_template_create_path_card() -> None:
+    """Test that path cards created from a template share its connections."""
+    template = get_template("URD+")
+    card1 = template.create()
+    card2 = template.create()
+    assert isinstance(card1, PathCard)
+    assert card1 is not card2
+    assert card1.name == "URD+"
+    assert card1.connections is card2.connections is template.connections
+
+
+def test_card_template_create_action_card() -> None:
+    """Test that action cards created from a template have the catalog type."""
+    broken_lamp = get_template("Broken Lamp").create()
+    assert isinstance(broken_lamp, ActionCard)
+    assert broken_lamp.is_offensive
+    assert get_template("Lamp").create().is_defensive
+    map_card = get_template("Map").create()
+    assert not map_card.is_offensive
+    assert not map_card.is_defensive
+
+
+def test_deck_template_ids() -> None:
+    """Test that the full deck holds one template id per copy of each card."""
+    catalog = get_catalog()
+    deck_ids = get_deck_template_ids()
+    expected_size = sum(
+        card_info.get("number", 1)
+        for section in ("path_card", "action_card")
+        for card_info in catalog[section].values()
+    )
+    assert len(deck_ids) == expected_size
+    assert deck_ids.count(get_template("Map").template_id) == 6
+    assert get_template("START").template_id not in deck_ids
@@ -0,0 +1,30 @@
+"""Tests for the catalog module."""
+
+from json import dump
+from pathlib import Path
+
+from src.core.cards.catalog import get_catalog, use_catalog
+from src.core.cards.roles import get_all_roles
+
+
+def test_get_catalog() -> None:
+    """Test that the catalog is loaded once and shared between calls."""
+    catalog = get_catalog()
+    assert set(catalog) == {"path_card", "action_card", "roles"}
+    assert get_catalog() is catalog
+
+
+def test_use_catalog(tmp_path: Path) -> None:
+    """Test that another catalog file can be used instead of the default one."""
+    expansion = dict(get_catalog())
+    expansion["roles"] = {"Miner": {"number": 2, "description": "A miner.", "team": "Miners"}}
+    expansion_file = tmp_path / "expansion.json"
+    with expansion_file.open("w", encoding="utf-8") as file:
+        dump(expansion, file)
+
+    try:
+        use_catalog(expansion_file)
+        assert [role.NAME for role in get_all_roles()] == ["Miner", "Miner"]
+    finally:
+        use_catalog()
+    assert len(get_all_roles()) == 15
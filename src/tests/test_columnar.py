@@ -0,0 +1,125 @@
+"""Tests for the columnar export of the turns."""
+
+import json
+from pathlib import Path
+
+from pytest import importorskip, raises
+
+from src.core.cards.card_template import get_template
+from src.core.columnar import (
+    ACTIONS,
+    HEADER_NAME,
+    NO_POSITION,
+    ColumnarReader,
+    ColumnarWriter,
+)
+from src.core.policies import greedy_policy
+from src.core.simulation import play_game
+from src.core.telemetry import CardPlayed, RoundEnded, TelemetryWriter
+
+PLAYER_NAMES = ["Alice", "Bob", "Charlie", "Dave"]
+
+
+def test_columns_follow_the_turns(tmp_path: Path) -> None:
+    """Test that each card played is a row of the dataset, stored once its round is over."""
+    events = []
+    with ColumnarWriter(tmp_path, batch_size=8) as writer:
+        for seed in range(3):
+            play_game(PLAYER_NAMES, [greedy_policy] * 4, seed, telemetry=writer)
+        play_game(PLAYER_NAMES, [greedy_policy] * 4, seed=2, telemetry=events.append)
+        writer(
+            next(event for event in events if isinstance(event, CardPlayed))._replace(round_seed=9)
+        )
+    plays = [event for event in events if isinstance(event, CardPlayed)]
+    ended = events[-1]
+    assert isinstance(ended, RoundEnded)
+
+    with ColumnarReader(tmp_path) as reader:
+        assert len(reader) == writer.rows
+        seeds = reader.column("round_seed")
+        first = seeds.tolist().index(2)
+        last = first + len(plays)
+        assert reader.column("turn")[first:last].tolist() == [play.turn for play in plays]
+        assert reader.column("seat")[first:last].tolist() == [play.seat for play in plays]
+        actions = reader.column("action")[first:last].tolist()
+        assert [ACTIONS[action] for action in actions] == [play.action for play in plays]
+        rows = reader.column("row")[first:last].tolist()
+        assert rows == [NO_POSITION if play.row is None else play.row for play in plays]
+        outcomes = reader.column("outcome")[first:last].tolist()
+        winners = set(ended.winning_teams)
+        assert outcomes == [ended.teams[play.seat] in winners for play in plays]
+        assert 9 not in seeds.tolist()  # the round never ended
+
+
+def test_writer_appends_and_drops_unwritten_rows(tmp_path: Path) -> None:
+    """Test that a dataset is appended to, rows beyond the header being dropped, and that
+    a dataset with another schema is refused."""
+    telemetry = tmp_path / "telemetry"
+    with TelemetryWriter(telemetry) as events:
+        play_game(PLAYER_NAMES, [greedy_policy] * 4, seed=5, telemetry=events)
+    dataset = tmp_path / "dataset"
+    with ColumnarWriter(dataset) as writer:
+        writer.add_files(events.paths)
+    rows = writer.rows
+    with (dataset / "turn.bin").open("ab") as file:
+        file.write(b"\0" * 12)  # written by an interrupted writer, not in the header
+    with ColumnarWriter(dataset) as writer:
+        writer.add_files(events.paths)
+    with ColumnarReader(dataset) as reader:
+        assert len(reader) == writer.rows == 2 * rows
+        turns = reader.column("turn").tolist()
+        assert turns[:rows] == turns[rows:]
+
+    header = json.loads((dataset / HEADER_NAME).read_text(encoding="utf-8"))
+    header["columns"].pop()
+    (dataset / HEADER_NAME).write_text(json.dumps(header), encoding="utf-8")
+    with raises(ValueError, match="schema of the turns"):
+        ColumnarReader(dataset)
+    with raises(FileNotFoundError):
+        ColumnarReader(telemetry)
+
+
+def test_numpy_columns(tmp_path: Path) -> None:
+    """Test that the columns are mapped as NumPy arrays."""
+    np = importorskip("numpy")
+    with ColumnarWriter(tmp_path) as writer:
+        play_game(PLAYER_NAMES, [greedy_policy] * 4, seed=1, telemetry=writer)
+    with ColumnarReader(tmp_path) as reader:
+        template_ids = reader.numpy_column("template_id")
+        assert template_ids.dtype == np.int16
+        assert template_ids.tolist() == reader.column("template_id").tolist()
+        assert (template_ids >= 0).all()
+
+
+def test_older_records_and_large_seeds(tmp_path: Path) -> None:
+    """Test that records written without template id and flipped flag are converted, and
+    that seeds up to 2**64 - 1 are stored."""
+    seed = 2**64 - 1
+    telemetry = tmp_path / "telemetry"
+    with TelemetryWriter(telemetry) as events:
+        events.write(
+            {
+                "type": "CardPlayed",
+                "round_seed": seed,
+                "turn": 0,
+                "seat": 1,
+                "team": "Blue",
+                "card": "RL+",
+                "action": "path",
+                "target": None,
+                "row": 2,
+                "column": 1,
+                "board_rows": 5,
+                "board_columns": 9,
+            }
+        )
+        events(
+            RoundEnded(seed, 1, gold_found=False, winning_teams=("Blue",), teams=("Red", "Blue"))
+        )
+    with ColumnarWriter(tmp_path / "dataset") as writer:
+        writer.add_files(events.paths)
+    with ColumnarReader(tmp_path / "dataset") as reader:
+        assert reader.column("round_seed").tolist() == [seed]
+        assert reader.column("template_id").tolist() == [get_template("RL+").template_id]
+        assert reader.column("flipped").tolist() == [0]
+        assert reader.column("outcome").tolist() == [1]
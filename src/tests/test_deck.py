@@ -1,8 +1,14 @@
 """Tests for the build_deck function in build_deck.py."""
 
+from random import Random
+
+from pytest import raises
+
 from src.core.cards.action_card import ActionCard
-from src.core.cards.build_deck import build_deck
+from src.core.cards.build_deck import build_deck, build_deck_ids
 from src.core.cards.card import Card
+from src.core.cards.card_template import get_deck_template_ids, get_template
+from src.core.cards.deck import Deck
 from src.core.cards.path_card import PathCard
 
 
@@ -28,3 +34,47 @@ def test_build_deck() -> None:
     # Check that the deck is shuffled (not in original order)
     original_deck = build_deck()  # Build another deck to compare order
     assert deck != original_deck, "Deck should be shuffled and not in original order"
+
+
+def test_build_deck_ids() -> None:
+    """Test that a deck of template ids is a shuffled subset of the full deck."""
+    deck_ids = build_deck_ids(cards_to_remove=10)
+    full_deck = get_deck_template_ids()
+    assert len(deck_ids) == len(full_deck) - 10
+    assert all(
+        deck_ids.count(template_id) <= full_deck.count(template_id) for template_id in deck_ids
+    )
+
+
+def test_build_deck_ids_seeded() -> None:
+    """Test that decks shuffled by generators with the same seed are identical."""
+    assert build_deck_ids(rng=Random(7)) == build_deck_ids(rng=Random(7))
+
+
+def test_deck_draw() -> None:
+    """Test that cards are drawn from the top of the deck, created from their template."""
+    straight_id = get_template("UD+").template_id
+    map_id = get_template("Map").template_id
+    deck = Deck([straight_id, map_id])
+    assert len(deck) == deck.remaining == 2
+    assert deck.peek() is get_template("Map")
+
+    card = deck.draw()
+    assert isinstance(card, ActionCard)
+    assert card.name == "Map"
+    assert deck.template_ids == (straight_id,)
+    assert deck.draw().name == "UD+"
+    assert deck.peek() is None
+    with raises(IndexError):
+        deck.draw()
+
+
+def test_deck_deal() -> None:
+    """Test that dealing draws the cards in the same order as drawing them one by one."""
+    deck = Deck.build(rng=Random(4))
+    other_deck = Deck.build(rng=Random(4))
+    dealt = deck.deal(6)
+    assert [card.name for card in dealt] == [other_deck.draw().name for _ in range(6)]
+    assert len(deck) == len(other_deck)
+    assert len(Deck([1, 2]).deal(5)) == 2
+    assert Deck([1, 2]).deal(0) == []
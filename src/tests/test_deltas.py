@@ -0,0 +1,144 @@
+"""Tests for the deltas module."""
+
+from src.core.board import Board
+from src.core.cards.card_template import get_template
+from src.core.cards.deck import Deck
+from src.core.cards.path_card import GoalCard
+from src.core.deltas import (
+    BenchCardAdded,
+    BenchCardRemoved,
+    BoardExpanded,
+    CardDiscarded,
+    CardDrawn,
+    CardPlaced,
+    CardRemoved,
+    GoalRevealed,
+    HandEmptied,
+    RoundStarted,
+    delta_to_dict,
+)
+from src.core.game import Game
+from src.core.inputs import TurnAction
+from src.core.player import Player
+
+
+def test_board_deltas() -> None:
+    """Test the deltas emitted by placements, expansions and removals."""
+    board = Board()
+    deltas = []
+    board.add_listener(deltas.append)
+    straight = get_template("RL+")
+
+    board.place_card(2, -1, straight.create())
+    assert deltas == [
+        BoardExpanded("LEFT", 1),
+        CardPlaced(2, 0, straight.template_id, flipped=False),
+    ]
+    deltas.clear()
+    board.expand("UP")
+    board.remove_card(3, 0)
+    assert deltas == [BoardExpanded("UP"), CardRemoved(3, 0)]
+
+    board.remove_listener(deltas.append)
+    board.expand("DOWN")
+    assert len(deltas) == 2
+
+
+def test_goal_revealed_delta() -> None:
+    """Test the delta emitted when a goal card is revealed."""
+    board = Board()
+    deltas = []
+    board.add_listener(deltas.append)
+    board.reveal_goal(0, 6)
+    goal_card = board.get_card(0, 6)
+    assert isinstance(goal_card, GoalCard)
+    template_id = get_template(goal_card.name).template_id
+    assert deltas == [GoalRevealed(0, 6, template_id, goal_card.is_flipped)]
+
+
+def test_player_deltas() -> None:
+    """Test the deltas emitted by the changes of a hand and a bench."""
+    player = Player("Alice", None, [], [])
+    deltas = []
+    player.add_listener(deltas.append)
+    deck = Deck([get_template("Lamp").template_id, get_template("Map").template_id])
+    player.draw(deck)
+    player.draw(deck)
+    player.discard(player.hand[1])
+    broken_lamp = get_template("Broken Lamp").create()
+    player.add_to_bench(broken_lamp)
+    player.remove_from_bench(broken_lamp)
+    player.empty_hand()
+    assert deltas == [
+        CardDrawn("Alice", get_template("Map").template_id),
+        CardDrawn("Alice", get_template("Lamp").template_id),
+        CardDiscarded("Alice", 1),
+        BenchCardAdded("Alice", get_template("Broken Lamp").template_id),
+        BenchCardRemoved("Alice", 0),
+        HandEmptied("Alice"),
+    ]
+
+
+def test_delta_to_dict() -> None:
+    """Test that deltas are converted to data, drawn cards being hidden from spectators."""
+    assert delta_to_dict(CardRemoved(1, 2)) == {"type": "CardRemoved", "row": 1, "column": 2}
+    assert delta_to_dict(CardDrawn("Alice", 4))["template_id"] == 4
+    assert delta_to_dict(CardDrawn("Alice", 4), public=True)["template_id"] is None
+
+
+def _apply(cells: dict, delta: object) -> dict:
+    """Applies a board delta to a client copy of the board, mapping positions to cards."""
+    if isinstance(delta, RoundStarted):
+        return {}
+    if isinstance(delta, BoardExpanded) and delta.direction in {"UP", "LEFT"}:
+        row_shift = delta.amount if delta.direction == "UP" else 0
+        column_shift = delta.amount if delta.direction == "LEFT" else 0
+        return {
+            (row + row_shift, column + column_shift): card for (row, column), card in cells.items()
+        }
+    if isinstance(delta, (CardPlaced, GoalRevealed)):
+        cells[delta.row, delta.column] = (delta.template_id, delta.flipped)
+    elif isinstance(delta, CardRemoved):
+        del cells[delta.row, delta.column]
+    return cells
+
+
+def test_game_deltas_rebuild_the_board() -> None:
+    """Test that a client applying the deltas of a game keeps an exact copy of the board."""
+    game = Game(seed=8)
+    game.name_players(["Alice", "Bob", "Charlie"])
+    cells = {}
+    hands = {player.name: [] for player in game.players}
+    for turn in range(60):
+        for delta in game.drain_deltas():
+            cells = _apply(cells, delta)
+            if isinstance(delta, CardDrawn):
+                hands[delta.player].append(delta.template_id)
+            elif isinstance(delta, CardDiscarded):
+                del hands[delta.player][delta.hand_index]
+            elif isinstance(delta, HandEmptied):
+                hands[delta.player].clear()
+        if turn == 59 or game.current_round.is_over:
+            break
+        player = game.current_round.current_player
+        moves = [] if player.is_blocked() else game.current_round.board.legal_moves(player.hand)
+        if moves:
+            card, row, column, flipped = moves[-1]
+            game.choose_action(TurnAction.PLAY_PATH)
+            game.choose_cards(player.hand.index(card), row, column, flipped=flipped)
+        else:
+            game.choose_action(TurnAction.DISCARD)
+            game.choose_cards(0)
+
+    board = game.current_round.board
+    expected = {}
+    for row in range(board.rows):
+        for column in range(board.columns):
+            card = board.get_card(row, column)
+            placed = card is not None and (not isinstance(card, GoalCard) or card.is_visible)
+            if placed and card.name != "START":
+                expected[row, column] = (get_template(card.name).template_id, card.is_flipped)
+    assert cells == expected
+    assert len(cells) > 5
+    for player in game.players:
+        assert hands[player.name] == [get_template(card.name).template_id for card in player.hand]
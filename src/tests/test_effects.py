@@ -0,0 +1,129 @@
+"""Tests for the effects of the action cards."""
+
+from pytest import raises
+
+from src.core.cards.action_card import ActionCard
+from src.core.cards.card_template import get_template
+from src.core.effects import Effect, EffectTarget, effect_of, register_effect
+from src.core.game import Game, GameState
+from src.core.inputs import TurnAction
+from src.core.player import Player
+from src.core.round import Round
+
+
+def _round_with(card_name: str) -> tuple[Round, list[Player], ActionCard]:
+    """Returns a round whose current player holds a card of the catalog."""
+    players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    game_round = Round(players, seed=3)
+    card = get_template(card_name).create()
+    game_round.current_player.draw(card)
+    return game_round, players, card
+
+
+def test_effects_are_shared_by_template() -> None:
+    """Test that the cards of a template share one effect, and that custom cards fall back
+    on the bench or on their own action."""
+    assert effect_of(get_template("Map").create()) is effect_of(get_template("Map").create())
+    assert effect_of(get_template("Lamp").create()).TARGET is EffectTarget.PLAYER
+    assert effect_of(get_template("Rockfall").create()).TARGET is EffectTarget.CELL
+
+    calls = []
+    custom = ActionCard("Custom", lambda: calls.append(True))
+    players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    game_round = Round(players, seed=3)
+    game_round.current_player.draw(custom)
+    assert game_round.play_action_card(custom)[0] is True
+    assert calls == [True]
+
+    with raises(ValueError, match="already registered"):
+        register_effect("map")
+    with raises(TypeError):
+        Effect()
+
+
+def test_repair_effect() -> None:
+    """Test that a repair card removes a card breaking one of its tools."""
+    game_round, players, lamp = _round_with("Lamp + Pickaxe")
+    target = players[1]
+    assert game_round.play_action_card(lamp, target) == (
+        False,
+        "The player has no broken tool this card repairs.",
+    )
+    broken_carriage = get_template("Broken Carriage").create()
+    broken_pickaxe = get_template("Broken Pickaxe").create()
+    target.add_to_bench(broken_carriage)
+    target.add_to_bench(broken_pickaxe)
+    assert game_round.play_action_card(lamp, target)[0] is True
+    assert target.bench == [broken_carriage]
+    assert lamp not in players[0].hand
+    assert target.is_blocked()
+
+
+def test_board_effects() -> None:
+    """Test that Rockfall removes a path card and Map shows a goal card to the player."""
+    game_round, players, rockfall = _round_with("Rockfall")
+    board = game_round.board
+    start_row, start_column = board.start_position
+    assert game_round.play_action_card(rockfall)[0] is False
+    assert game_round.play_action_card(rockfall, row=start_row, column=start_column) == (
+        False,
+        "The start and goal cards cannot be removed.",
+    )
+    board.place_card(start_row, start_column + 1, get_template("RL+").create())
+    assert game_round.play_action_card(rockfall, row=start_row, column=start_column + 1)[0]
+    assert board.get_card(start_row, start_column + 1) is None
+
+    map_card = get_template("Map").create()
+    players[1].draw(map_card)
+    goal = board.goal_positions[0]
+    assert game_round.play_action_card(map_card, row=0, column=0)[0] is False
+    assert game_round.play_action_card(map_card, row=goal[0], column=goal[1])[0] is True
+    assert game_round.known_goals(players[1]) == [goal]
+
+
+def test_player_effects() -> None:
+    """Test that Spy needs another player and that Change Role draws a free role."""
+    game_round, players, spy = _round_with("Spy")
+    assert game_round.play_action_card(spy, players[0]) == (
+        False,
+        "A player cannot spy on themselves.",
+    )
+    assert game_round.play_action_card(spy, players[2])[0] is True
+
+    change_role = get_template("Change Role").create()
+    players[1].draw(change_role)
+    roles = [player.role for player in players]
+    assert game_round.play_action_card(change_role, players[0])[0] is True
+    assert players[0].role not in roles[1:]
+
+
+def test_game_plays_map_on_a_position() -> None:
+    """Test that a game plays a card on the board with the position of the chosen card."""
+    game = Game(seed=4)
+    game.name_players(["Alice", "Bob", "Charlie"])
+    player = game.current_round.current_player
+    player.draw(get_template("Map").create())
+    goal = game.current_round.board.goal_positions[2]
+    assert game.choose_action(TurnAction.PLAY_ACTION)[0]
+    assert game.choose_cards(len(player.hand) - 1, *goal)[0]
+    assert game.state == GameState.CHOSE_ACTION
+    assert game.current_round.known_goals(player) == [goal]
+
+
+def test_game_refuses_a_card_without_target() -> None:
+    """Test that a game refuses a repair card while no tool is broken, staying in the choice
+    of the card."""
+    game = Game(seed=4)
+    game.name_players(["Alice", "Bob", "Charlie"])
+    player = game.current_round.current_player
+    player.draw(get_template("Lamp + Pickaxe").create())
+    assert game.choose_action(TurnAction.PLAY_ACTION)[0]
+    assert game.choose_cards(len(player.hand) - 1) == (
+        False,
+        "No player can be targeted by this card.",
+    )
+    assert game.state == GameState.CHOSE_CARDS
+
+    game.players[1].add_to_bench(get_template("Broken Pickaxe").create())
+    assert game.choose_cards(len(player.hand) - 1)[0]
+    assert game.state == GameState.CHOSE_PLAYER
@@ -0,0 +1,213 @@
+"""Tests for the Game module."""
+
+from pytest import raises
+
+from src.core.action_log import ActionLog
+from src.core.cards.action_card import ActionCard
+from src.core.cards.card_template import get_template
+from src.core.game import ROUNDS_PER_GAME, Game, GameState
+from src.core.inputs import ChooseAction, ChooseCards, ChoosePlayer, NamePlayers, TurnAction
+from src.core.player import Player
+
+
+def test_game_initialization() -> None:
+    """Test the initialization of a Game instance."""
+    game = Game(seed=12)
+    assert game.seed == 12
+    assert game.players == []
+    assert game.current_round is None
+    assert game.state == GameState.NAMING_PLAYERS
+
+
+def test_game_round_seeds() -> None:
+    """Test that games with the same seed start rounds with the same seeds."""
+    first_game = Game(seed=12)
+    second_game = Game(seed=12)
+    for game in (first_game, second_game):
+        game.players.extend(Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie"))
+    first_seeds = [first_game.start_round().seed for _ in range(3)]
+    second_seeds = [second_game.start_round().seed for _ in range(3)]
+    assert first_seeds == second_seeds
+    assert second_game.current_round.seed == second_seeds[-1]
+
+
+def _play_turn(game: Game) -> None:
+    """Plays a turn of the current player through the inputs of the game.
+    Offensive action cards are played on the next player, then path cards are placed at
+    their first legal position, other cards are discarded. Policies are not used since
+    they draw from the round generator, which would not be replayed."""
+    game_round = game.current_round
+    player = game_round.current_player
+    for index, card in enumerate(player.hand):
+        if isinstance(card, ActionCard) and card.is_offensive:
+            seat = (game.players.index(player) + 1) % len(game.players)
+            target = game.players[seat]
+            if all(other.name != card.name for other in target.bench):
+                assert game.choose_action(TurnAction.PLAY_ACTION)[0]
+                assert game.choose_cards(index)[0]
+                assert game.state == GameState.CHOSE_PLAYER
+                assert game.choose_player(seat)[0]
+                return
+    moves = [] if player.is_blocked() else game_round.board.legal_moves(player.hand)
+    if moves:
+        card, row, column, flipped = moves[0]
+        assert game.choose_action(TurnAction.PLAY_PATH)[0]
+        assert game.choose_cards(player.hand.index(card), row, column, flipped=flipped)[0]
+    else:
+        assert game.choose_action(TurnAction.DISCARD)[0]
+        assert game.choose_cards(0)[0]
+
+
+def _play_turns(game: Game, turns: int) -> None:
+    """Plays a number of turns, or until the end of the game."""
+    for _ in range(turns):
+        if game.state == GameState.GAME_END:
+            return
+        _play_turn(game)
+
+
+def test_game_name_players() -> None:
+    """Test that naming the players starts the first round."""
+    game = Game(seed=1)
+    assert game.name_players(["Alice", "Bob"]) == (False, "A game needs 3 to 10 players.")
+    assert game.name_players(["Alice", "Bob", "Alice"])[0] is False
+    assert game.name_players(["Alice", "Bob", " "])[0] is False
+    assert len(game.action_log) == 0
+
+    assert game.name_players(["Alice", "Bob", "Charlie"])[0] is True
+    assert [player.name for player in game.players] == ["Alice", "Bob", "Charlie"]
+    assert game.state == GameState.CHOSE_ACTION
+    assert game.rounds_started == 1
+    assert game.current_round.current_player is game.players[0]
+    assert len(game.action_log) == 1
+
+
+def test_game_rejects_unexpected_inputs() -> None:
+    """Test that inputs not expected in the current state are rejected and not logged."""
+    game = Game(seed=1)
+    result, message = game.choose_action(TurnAction.DISCARD)
+    assert result is False
+    assert "NAMING_PLAYERS" in message
+    game.name_players(["Alice", "Bob", "Charlie"])
+    assert game.choose_player(1)[0] is False
+    assert game.choose_cards(0)[0] is False
+    assert game.choose_action(TurnAction.DISCARD)[0] is True
+    assert game.choose_cards(99) == (False, "There is no card at this index of the hand.")
+    assert game.state == GameState.CHOSE_CARDS
+    assert len(game.action_log) == 2
+
+
+def test_game_turn() -> None:
+    """Test that a turn passes through the states of the game to the next player."""
+    game = Game(seed=1)
+    game.name_players(["Alice", "Bob", "Charlie"])
+    alice = game.players[0]
+    card = alice.hand[0]
+    assert game.choose_action(TurnAction.DISCARD)[0] is True
+    assert game.turn_action == TurnAction.DISCARD
+    assert game.choose_cards(0)[0] is True
+    assert card not in alice.hand
+    assert game.state == GameState.CHOSE_ACTION
+    assert game.turn_action is None
+    assert game.current_round.current_player is game.players[1]
+
+
+def test_game_cancel_action() -> None:
+    """Test that a chosen action can be cancelled before or after choosing a card, and that
+    the cancellation is replayed."""
+    game = Game(seed=1)
+    game.name_players(["Alice", "Bob", "Charlie"])
+    assert game.cancel_action()[0] is False
+    assert game.choose_action(TurnAction.DISCARD)[0] is True
+    assert game.cancel_action() == (True, "The action has been cancelled.")
+    assert game.state == GameState.CHOSE_ACTION
+    assert game.turn_action is None
+    assert Game.replay(game.action_log).to_state() == game.to_state()
+
+    alice = game.players[0]
+    alice.draw(get_template("Broken Pickaxe").create())
+    assert game.choose_action(TurnAction.PLAY_ACTION)[0] is True
+    assert game.choose_cards(len(alice.hand) - 1)[0] is True
+    assert game.state == GameState.CHOSE_PLAYER
+    assert game.cancel_action()[0] is True
+    assert game.state == GameState.CHOSE_ACTION
+    assert game.current_round.current_player is alice
+    assert [entry.kind for entry in game.action_log].count("cancel") == 2
+
+
+def test_game_plays_every_round() -> None:
+    """Test that a game ends after its rounds, every player being scored each round."""
+    game = Game(seed=4)
+    game.name_players(["Alice", "Bob", "Charlie", "Dave"])
+    _play_turns(game, 1000)
+    assert game.state == GameState.GAME_END
+    assert game.rounds_started == ROUNDS_PER_GAME
+    assert all(len(player.scores) == ROUNDS_PER_GAME for player in game.players)
+    assert any(player.bench for player in game.players)
+
+
+def test_game_replay() -> None:
+    """Test that replaying the action log rebuilds the same game."""
+    game = Game(seed=4)
+    game.name_players(["Alice", "Bob", "Charlie", "Dave"])
+    _play_turns(game, 40)
+    for fast_forward in (False, True):
+        replayed = Game.replay(game.action_log, fast_forward=fast_forward)
+        assert replayed.to_state() == game.to_state()
+        assert replayed.action_log is game.action_log
+
+
+def test_game_replay_continues() -> None:
+    """Test that a replayed game can be played on, and logs its next inputs."""
+    game = Game(seed=4)
+    game.name_players(["Alice", "Bob", "Charlie", "Dave"])
+    _play_turns(game, 10)
+    replayed = Game.replay(ActionLog(game.seed, None))
+    assert replayed.state == GameState.NAMING_PLAYERS
+
+    copied_log = ActionLog(game.seed)
+    for kind, args in game.action_log:
+        copied_log.append(kind, *args)
+    replayed = Game.replay(copied_log)
+    _play_turns(game, 10)
+    _play_turns(replayed, 10)
+    assert replayed.to_state() == game.to_state()
+    assert list(copied_log) == list(game.action_log)
+
+
+def test_game_replay_invalid_log() -> None:
+    """Test that a log with an input the game does not accept is rejected."""
+    log = ActionLog(1)
+    log.append(NamePlayers.KIND, ["Alice", "Bob", "Charlie"])
+    log.append(ChoosePlayer.KIND, 0)
+    with raises(ValueError, match="Input 1"):
+        Game.replay(log)
+
+
+def test_game_submit() -> None:
+    """Test that submitted inputs are dispatched according to the state of the game."""
+    game = Game(seed=1)
+    assert game.expected_inputs == (NamePlayers,)
+    assert game.submit(ChooseCards(0))[0] is False
+    assert game.submit(NamePlayers(("Alice", "Bob", "Charlie")))[0] is True
+    assert game.expected_inputs == (ChooseAction,)
+    assert game.submit(ChooseAction(TurnAction.DISCARD))[0] is True
+    assert game.submit(ChooseCards(0))[0] is True
+    assert game.state == GameState.CHOSE_ACTION
+
+
+def test_game_step_stats() -> None:
+    """Test that the inputs submitted in each state are counted and timed."""
+    game = Game(seed=1)
+    game.submit(ChooseCards(0))
+    game.submit(NamePlayers(("Alice", "Bob", "Charlie")))
+    naming_stats = game.step_stats[GameState.NAMING_PLAYERS]
+    assert naming_stats.count == 2
+    assert naming_stats.rejected == 1
+    assert naming_stats.max_time > 0
+    assert naming_stats.total_time >= naming_stats.max_time
+    assert naming_stats.mean_time == naming_stats.total_time / 2
+    assert game.step_stats[GameState.CHOSE_ACTION].count == 0
+
+    replayed = Game.replay(game.action_log)
+    assert replayed.step_stats[GameState.NAMING_PLAYERS].count == 0
@@ -0,0 +1,37 @@
+"""Tests for the ismcts module."""
+
+from src.core.ismcts import IsmctsPolicy
+from src.core.player import Player
+from src.core.policies import play_move
+from src.core.round import Round
+
+
+def _new_round(seed: int) -> Round:
+    """Returns a round of four players."""
+    return Round([Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie", "Dave")], seed)
+
+
+def test_ismcts_policy_returns_a_valid_move_without_changing_the_round() -> None:
+    """Test that the searched move is accepted by the round, which the search left unchanged."""
+    game_round = _new_round(2)
+    state = game_round.to_state()
+    policy = IsmctsPolicy(iterations=20)
+    move = policy(game_round)
+    assert policy.last_iterations == 20
+    assert move.card in game_round.current_player.hand
+    assert game_round.to_state() == state
+    assert play_move(game_round, move)[0] is True
+
+
+def test_ismcts_policy_is_reproducible_with_iterations() -> None:
+    """Test that a search with a number of iterations depends only on the round."""
+    first, second = (IsmctsPolicy(iterations=10)(_new_round(3)) for _ in range(2))
+    assert first.card.name == second.card.name
+    assert first[1:] == second[1:]
+
+
+def test_ismcts_policy_respects_its_time_budget() -> None:
+    """Test that the search runs at least once and stops after its time budget."""
+    policy = IsmctsPolicy(time_budget=0.0)
+    policy(_new_round(4))
+    assert policy.last_iterations == 1
@@ -1,8 +1,11 @@
 """Tests for the PathCard module."""
 
-from json import load
-from pathlib import Path
+from copy import copy
+from random import Random
 
+from pytest import raises
+
+from src.core.cards.catalog import get_catalog
 from src.core.cards.path_card import (
     CardConnections,
     GoalCard,
@@ -11,8 +14,7 @@ from src.core.cards.path_card import (
     get_3_goal_cards,
 )
 
-with Path("src/core/cards/cards_data.json").open(encoding="utf-8") as file:
-    path_card_data = load(file)["path_card"]
+path_card_data = get_catalog()["path_card"]
 
 
 # %% Tests for PathCard and CardConnections
@@ -27,6 +29,28 @@ def test_path_card_connections() -> None:
     assert connections.LEFT == 0
 
 
+def test_path_card_connections_values() -> None:
+    """Test that every connection value survives the bitmask encoding."""
+    data = {"UP": 1, "RIGHT": -1, "DOWN": 2, "LEFT": 0}
+    connections = CardConnections.from_dict(data)
+    assert {"UP": connections.UP, "RIGHT": connections.RIGHT} == {"UP": 1, "RIGHT": -1}
+    assert {"DOWN": connections.DOWN, "LEFT": connections.LEFT} == {"DOWN": 2, "LEFT": 0}
+    assert connections.edges == 0b0111
+    assert connections.side_paths == (0b0001, 0, 0b0100, 0)
+    assert CardConnections.from_mask(connections.mask) is connections
+    with raises(ValueError):
+        CardConnections.from_dict({"UP": 3})
+
+
+def test_path_card_connections_flipped() -> None:
+    """Test that flipped connections are shared and rotated by 180 degrees."""
+    connections = CardConnections.from_dict({"UP": 1, "RIGHT": 2, "DOWN": -1, "LEFT": 0})
+    flipped = connections.flipped
+    assert flipped == CardConnections.from_dict({"UP": -1, "RIGHT": 0, "DOWN": 1, "LEFT": 2})
+    assert flipped.flipped is connections
+    assert connections.flipped is flipped
+
+
 def test_path_card_initialization() -> None:
     """Test the initialization of a PathCard instance."""
     connections = CardConnections.from_dict({"UP": 1, "RIGHT": 0, "DOWN": 1, "LEFT": 0})
@@ -39,11 +63,15 @@ def test_path_card_flip() -> None:
     """Test the flip method of a PathCard instance."""
     connections = CardConnections.from_dict({"UP": 1, "RIGHT": 0, "DOWN": 1, "LEFT": 0})
     path_card = PathCard("TestPathCard", connections)
+    assert not path_card.is_flipped
     path_card.flip()
+    assert path_card.is_flipped
     assert path_card.connections.UP == 1
     assert path_card.connections.RIGHT == 0
     assert path_card.connections.DOWN == 1
     assert path_card.connections.LEFT == 0
+    path_card.flip()
+    assert not path_card.is_flipped
 
 
 # %% Tests for StartCard
@@ -94,6 +122,20 @@ def test_goal_card_reveal() -> None:
     assert goal_card.is_visible
 
 
+def test_goal_card_copy() -> None:
+    """Test that a copied goal card keeps its hidden face and orientation, without a
+    __dict__ since cards are slotted."""
+    goal_card = GoalCard("END", CardConnections.from_dict({"UP": 1, "DOWN": 1}))
+    goal_card.flip()
+    copied = copy(goal_card)
+    assert not hasattr(copied, "__dict__")
+    assert copied.is_flipped
+    assert copied.read_real_name() == "END"
+    copied.reveal()
+    assert copied.is_visible
+    assert not goal_card.is_visible
+
+
 def test_get_3_goal_cards() -> None:
     """Test the get_3_goal_cards function."""
     goal_cards = get_3_goal_cards()
@@ -103,3 +145,14 @@ def test_get_3_goal_cards() -> None:
         assert card.name == "GOAL"
         assert not card.is_visible
         assert card.read_real_name() in ["ST-UL", "ST-UR", "END"]
+        card.reveal()
+        assert card.connections == CardConnections.from_dict(
+            path_card_data[card.name]["connections"]
+        )
+
+
+def test_get_3_goal_cards_seeded() -> None:
+    """Test that generators with the same seed place the goals in the same order."""
+    first_goals = [card.read_real_name() for card in get_3_goal_cards(Random(5))]
+    second_goals = [card.read_real_name() for card in get_3_goal_cards(Random(5))]
+    assert first_goals == second_goals
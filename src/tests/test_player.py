@@ -1,6 +1,10 @@
 """Tests for the Player module."""
 
+from pytest import raises
+
 from src.core.cards.action_card import ActionCard
+from src.core.cards.card_template import get_template
+from src.core.cards.deck import Deck
 from src.core.cards.path_card import PathCard
 from src.core.cards.roles import Role
 from src.core.player import Player
@@ -106,3 +110,58 @@ def test_empty_hand() -> None:
     assert len(player.hand) == 2
     player.empty_hand()
     assert len(player.hand) == 0
+
+
+def test_player_draw_from_deck() -> None:
+    """Test drawing the top card of a deck to the player's hand."""
+    deck = Deck([get_template("UD+").template_id])
+    player = Player("Kate", blue_role, [], [])
+    player.draw(deck)
+    assert [card.name for card in player.hand] == ["UD+"]
+    assert len(deck) == 0
+    with raises(ValueError):
+        player.draw(deck)
+
+
+def test_player_broken_tools() -> None:
+    """Test that the tools broken on the bench are counted, and repaired by removing the
+    offensive cards."""
+    broken_lamp = get_template("Broken Lamp").create()
+    prison = get_template("Prison").create()
+    player = Player("Liam", blue_role, [], [broken_lamp])
+    assert player.is_blocked()
+    assert player.is_broken("Lamp")
+    assert not player.is_broken("Pickaxe")
+    assert player.can_repair(get_template("Lamp + Pickaxe").create())
+    assert not player.can_repair(get_template("Carriage").create())
+    assert not player.can_repair(get_template("Broken Lamp").create())
+
+    player.add_to_bench(prison)
+    assert player.remove_from_bench(broken_lamp) == (
+        True,
+        "The card has been removed from the bench.",
+    )
+    assert not player.is_broken("Lamp")
+    assert player.is_blocked()
+    assert player.copy().can_repair(get_template("Escape").create())
+    player.remove_from_bench(prison)
+    assert not player.is_blocked()
+    assert player.remove_from_bench(prison) == (False, "The card is not on the player's bench.")
+
+
+def test_player_piles_are_read_only() -> None:
+    """Test that the hand and bench of a player are views following their changes, which
+    only the methods of the player make."""
+    broken_lamp = get_template("Broken Lamp").create()
+    player = Player("Liam", blue_role, [], [])
+    hand, bench = player.hand, player.bench
+    for pile in (hand, bench):
+        assert not hasattr(pile, "append")
+        assert not hasattr(pile, "pop")
+        assert not hasattr(pile, "clear")
+    player.add_to_bench(broken_lamp)
+    assert bench == [broken_lamp]
+    assert bench.zobrist == player.bench_zobrist
+    player.draw(broken_lamp)
+    assert hand.index(broken_lamp) == 0
+    assert player.copy().hand == hand
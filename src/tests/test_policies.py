@@ -0,0 +1,48 @@
+"""Tests for the policies module."""
+
+from src.core.cards.card_template import get_template
+from src.core.player import Player
+from src.core.policies import Move, action_moves, greedy_policy, play_move, random_policy
+from src.core.round import Round
+
+
+def test_policies_return_valid_moves() -> None:
+    """Test that the moves chosen by the policies are accepted by the round."""
+    players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    game_round = Round(players, seed=5)
+    for policy in (random_policy, greedy_policy) * 5:
+        move = policy(game_round)
+        assert move.card in game_round.current_player.hand
+        assert play_move(game_round, move)[0] is True
+
+
+def test_move_is_discard() -> None:
+    """Test that a move without position is a discard."""
+    players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    card = Round(players, seed=5).current_player.hand[0]
+    assert Move(card).is_discard
+    assert not Move(card, 2, 1).is_discard
+
+
+def test_action_moves() -> None:
+    """Test that action cards are played on the targets accepted by their effect, and that
+    the policies play them."""
+    players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    game_round = Round(players, seed=5)
+    player = game_round.current_player
+    player.empty_hand()
+    player.draw(get_template("Broken Pickaxe").create())
+    player.draw(get_template("Lamp + Pickaxe").create())
+    player.draw(get_template("Map").create())
+    moves = action_moves(game_round)
+    assert [move.target for move in moves if move.card.name == "Broken Pickaxe"] == [0, 1, 2]
+    assert all(move.card.name != "Lamp + Pickaxe" for move in moves)
+    map_moves = sorted((move.row, move.column) for move in moves if move.card.name == "Map")
+    assert map_moves == sorted(game_round.board.goal_positions)
+    assert all(move.is_action and not move.is_discard for move in moves)
+
+    players[2].add_to_bench(get_template("Broken Pickaxe").create())
+    assert any(move.target == 2 for move in action_moves(game_round, [player.hand[1]]))
+    move = random_policy(game_round)
+    assert move.is_action
+    assert play_move(game_round, move)[0] is True
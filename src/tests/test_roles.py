@@ -1,5 +1,7 @@
 """Tests for the Roles module."""
 
+from random import Random
+
 from src.core.cards.roles import Role, get_all_roles, get_random_roles
 
 
@@ -35,6 +37,7 @@ def test_get_random_roles() -> None:
 def test_roles_initialization() -> None:
     """Test the initialization of Role instances."""
     role = Role()
+    assert (role.NAME, role.DESCRIPTION, role.TEAM) == (None, None, None)
     role.NAME = "A"
     role.DESCRIPTION = "B"
     role.TEAM = "C"
@@ -59,3 +62,8 @@ def test_role_equality() -> None:
 
     assert role1 == role2
     assert role1 != role3
+
+
+def test_get_random_roles_seeded() -> None:
+    """Test that generators with the same seed give the same roles."""
+    assert get_random_roles(6, Random(3)) == get_random_roles(6, Random(3))
@@ -1,8 +1,11 @@
 """Tests for the Round module."""
 
+from random import Random
+
+from src.core.cards.card_template import get_card_templates, get_template
 from src.core.cards.path_card import PathCard
 from src.core.player import Player
-from src.core.round import Round
+from src.core.round import GOLD_NOT_FOUND_WINNERS, Round
 
 card = PathCard.from_dict(
     name="Straight", connections_dict={"UP": 1, "DOWN": 1, "LEFT": 0, "RIGHT": 0}
@@ -21,3 +24,131 @@ def test_round_initialization() -> None:
     assert len(players[0].hand) == 6
     assert len(players[1].hand) == 6
     assert len(players[2].hand) == 6
+
+
+def test_round_seed_reproducibility() -> None:
+    """Test that two rounds with the same seed deal the same roles and hands."""
+    seeded_players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    first_round = Round(seeded_players, seed=42)
+    assert first_round.seed == 42
+    first_deal = [(player.role, [card.name for card in player.hand]) for player in seeded_players]
+
+    Round(seeded_players, seed=42)
+    second_deal = [(player.role, [card.name for card in player.hand]) for player in seeded_players]
+    assert first_deal == second_deal
+
+
+def test_round_turns() -> None:
+    """Test that playing and discarding cards refill the hand and pass the turn."""
+    round_players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    game_round = Round(round_players, seed=1)
+    deck_size = game_round.deck_size
+
+    alice = game_round.current_player
+    result, _ = game_round.discard_card(alice.hand[0])
+    assert result is True
+    assert len(alice.hand) == 6
+    assert game_round.deck_size == deck_size - 1
+    assert game_round.current_player is round_players[1]
+
+    straight = PathCard.from_dict("Straight", {"UP": 0, "RIGHT": 1, "DOWN": 0, "LEFT": 1})
+    result, _ = game_round.play_path_card(straight, 2, 1)
+    assert result is False
+    game_round.current_player.draw(straight)
+    result, _ = game_round.play_path_card(straight, 2, 1)
+    assert result is True
+    assert game_round.board.get_card(2, 1) is straight
+    assert game_round.current_player is round_players[2]
+    assert game_round.turns_played == 2
+
+
+def test_round_end() -> None:
+    """Test that the round ends once every card has been played."""
+    round_players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    game_round = Round(round_players, seed=1)
+    while not game_round.is_over:
+        game_round.discard_card(game_round.current_player.hand[0])
+    assert game_round.deck_size == 0
+    assert all(len(player.hand) == 0 for player in round_players)
+    assert game_round.winning_teams == GOLD_NOT_FOUND_WINNERS
+    result, _ = game_round.discard_card(card)
+    assert result is False
+
+
+def test_round_play_action_card() -> None:
+    """Test that offensive cards are placed on the bench of their target."""
+    round_players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")]
+    game_round = Round(round_players, seed=1)
+    broken_lamp = get_template("Broken Lamp").create()
+    path_card = next(card for card in game_round.current_player.hand if isinstance(card, PathCard))
+    game_round.current_player.draw(broken_lamp)
+
+    result, _ = game_round.play_action_card(path_card, round_players[1])
+    assert result is False
+    result, _ = game_round.play_action_card(broken_lamp)
+    assert result is False
+    result, _ = game_round.play_action_card(broken_lamp, round_players[1])
+    assert result is True
+    assert round_players[1].bench == [broken_lamp]
+    assert round_players[1].is_blocked()
+    assert game_round.current_player is round_players[1]
+
+    second_lamp = get_template("Broken Lamp").create()
+    round_players[1].draw(second_lamp)
+    result, message = game_round.play_action_card(second_lamp, round_players[1])
+    assert result is False
+    assert message == "The player already has this card on their bench."
+
+
+def test_round_copy_is_independent() -> None:
+    """Test that playing on a copy of a round leaves the round unchanged."""
+    game_round = Round([Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")], 4)
+    state = game_round.to_state()
+    hand_names = [card.name for card in game_round.current_player.hand]
+    copy = game_round.copy()
+    assert copy.to_state() == state
+
+    card, row, column, flipped = copy.board.legal_moves(copy.current_player.hand)[0]
+    assert copy.play_path_card(card, row, column, flipped=flipped)[0]
+    assert game_round.to_state() == state
+    assert [card.name for card in game_round.current_player.hand] == hand_names
+    assert not any(getattr(card, "is_flipped", False) for card in game_round.current_player.hand)
+
+
+def test_round_determinize_keeps_what_the_observer_knows() -> None:
+    """Test that a determinized round only redraws what the observer cannot see."""
+    players = [Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie", "Dave")]
+    game_round = Round(players, seed=8)
+    observer = players[0]
+    seen_goal = game_round.board.goal_positions[1]
+    game_round.show_goal(observer, *seen_goal)
+
+    rng = Random(1)
+    copies = [game_round.determinize(observer, rng) for _ in range(20)]
+    for copy in copies:
+        observer_copy = copy.players[0]
+        assert observer_copy.role == observer.role
+        assert [card.name for card in observer_copy.hand] == [card.name for card in observer.hand]
+        assert [len(player.hand) for player in copy.players] == [6, 6, 6, 6]
+        assert copy.deck_size == game_round.deck_size
+        seen_card = copy.board.get_card(*seen_goal)
+        assert seen_card.read_real_name() == game_round.board.get_card(*seen_goal).read_real_name()
+        assert copy.known_goals(observer_copy) == [seen_goal]
+
+    hidden_cards = sorted(
+        [card.name for player in players[1:] for card in player.hand]
+        + [get_card_templates()[template_id].name for template_id in game_round.deck.template_ids]
+    )
+    for copy in copies:
+        copied_cards = sorted(
+            [card.name for player in copy.players[1:] for card in player.hand]
+            + [get_card_templates()[template_id].name for template_id in copy.deck.template_ids]
+        )
+        assert copied_cards == hidden_cards
+    assert len({tuple(card.name for card in copy.players[1].hand) for copy in copies}) > 1
+    assert len({copy.players[1].role.NAME for copy in copies}) > 1
+
+    players[2].empty_hand()
+    for copy in (game_round.determinize(observer, rng) for _ in range(20)):
+        assert [len(player.hand) for player in copy.players] == [6, 6, 0, 6]
+        assert copy.deck_size == game_round.deck_size
@@ -0,0 +1,227 @@
+"""Tests for the game server module."""
+
+import asyncio
+import json
+
+from src.core.cards.card_template import get_template
+from src.core.game import Game, GameState
+from src.core.inputs import ChooseAction, ChooseCards, GameInput, NamePlayers, TurnAction
+from src.core.ismcts import IsmctsPolicy
+from src.core.policies import Move, action_moves
+from src.core.round import Round
+from src.server.game_server import GameServer, ServerStats, Table
+
+
+def test_server_stats() -> None:
+    """Test the throughput and latency percentiles of the server statistics."""
+    stats = ServerStats(window=100)
+    assert stats.percentile(99) == 0.0
+    for latency in range(1, 101):
+        stats.record(latency / 1000)
+    assert stats.steps == 100
+    assert stats.percentile(50) == 0.051
+    assert stats.percentile(99) == 0.1
+    assert stats.throughput > 0
+    assert stats.to_dict()["p99_ms"] == 100.0
+
+
+def test_server_tables() -> None:
+    """Test that concurrent inputs are applied in order within each table."""
+
+    async def scenario() -> None:
+        server = GameServer()
+        tables = [server.create_table(seed) for seed in range(20)]
+        names = NamePlayers(("Alice", "Bob", "Charlie"))
+        inputs = [names, ChooseAction(TurnAction.DISCARD), ChooseCards(0)]
+        results = await asyncio.gather(
+            *(table.submit(game_input) for game_input in inputs for table in tables)
+        )
+        assert all(result for result, _ in results)
+        for table in tables:
+            assert table.game.state == GameState.CHOSE_ACTION
+            assert table.game.current_round.turns_played == 1
+        assert server.stats.steps == 60
+        assert server.close_table(tables[0].table_id) is True
+        assert server.close_table(tables[0].table_id) is False
+        server.close()
+        assert server.tables == {}
+
+    asyncio.run(scenario())
+
+
+class _FailingGame(Game):
+    """A game whose first submitted input raises an unexpected error."""
+
+    def __init__(self) -> None:
+        super().__init__(seed=1)
+        self.failed = False
+
+    def submit(self, game_input: GameInput) -> tuple[bool, str]:
+        if not self.failed:
+            self.failed = True
+            msg = "unexpected"
+            raise RuntimeError(msg)
+        return super().submit(game_input)
+
+
+def test_server_table_survives_errors() -> None:
+    """Test that an input raising an unexpected error is answered, and that the table keeps
+    serving its next inputs."""
+
+    async def scenario() -> None:
+        table = Table("1", _FailingGame(), ServerStats())
+        names = NamePlayers(("Alice", "Bob", "Charlie"))
+        result, message = await table.submit(names)
+        assert result is False
+        assert "RuntimeError" in message
+        assert (await table.submit(names))[0] is True
+        table.close()
+
+    asyncio.run(scenario())
+
+
+def test_server_bot() -> None:
+    """Test that the bot plays the turn of the current player while other tables are served."""
+
+    async def scenario() -> None:
+        server = GameServer(IsmctsPolicy(iterations=5))
+        bot_table, other_table = server.create_table(1), server.create_table(2)
+        names = NamePlayers(("Alice", "Bob", "Charlie"))
+        await asyncio.gather(bot_table.submit(names), other_table.submit(names))
+        response, _ = await asyncio.gather(
+            server.handle_request({"op": "bot", "table": bot_table.table_id}),
+            other_table.submit(ChooseAction(TurnAction.DISCARD)),
+        )
+        assert response["ok"] is True
+        assert response["current_seat"] == 1
+        assert bot_table.game.current_round.turns_played == 1
+        response = await server.handle_request({"op": "bot", "table": other_table.table_id})
+        assert response["ok"] is False
+        server.close()
+
+    asyncio.run(scenario())
+
+
+def test_server_bot_plays_action_cards() -> None:
+    """Test that the bot plays action cards on their target, and refuses a move whose card
+    is not in the hand."""
+
+    def break_next_player(game_round: Round) -> Move:
+        return next(move for move in action_moves(game_round) if move.target == 1)
+
+    async def scenario() -> None:
+        table = GameServer(break_next_player).create_table(1)
+        await table.submit(NamePlayers(("Alice", "Bob", "Charlie")))
+        alice, bob, _ = table.game.players
+        alice.draw(get_template("Broken Pickaxe").create())
+        assert await table.play_bot(break_next_player) == (True, "The card has been played.")
+        assert [card.name for card in bob.bench] == ["Broken Pickaxe"]
+
+        stranger = get_template("Map").create()
+        result, message = await table.play_bot(lambda _: Move(stranger))
+        assert result is False
+        assert "not in the hand" in message
+        assert table.game.state == GameState.CHOSE_ACTION
+        table.close()
+
+    asyncio.run(scenario())
+
+
+def test_server_line_protocol() -> None:
+    """Test a client playing through the line protocol."""
+
+    async def scenario() -> None:
+        server = GameServer()
+        listener = await server.serve(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def request(data: object) -> dict:
+            writer.write(json.dumps(data).encode("utf-8") + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        assert (await request({"op": "create", "seed": -1}))["ok"] is False
+        created = await request({"op": "create", "seed": 3})
+        assert created["ok"] is True
+        assert created["state"] == "NAMING_PLAYERS"
+        table = created["table"]
+        named = await request(
+            {"op": "submit", "table": table, "input": "names", "args": [["A", "B", "C"]]}
+        )
+        assert named["ok"] is True
+        assert named["state"] == "CHOSE_ACTION"
+        assert named["current_seat"] == 0
+
+        rejected = await request({"op": "submit", "table": table, "input": "cards", "args": [0]})
+        assert rejected["ok"] is False
+        assert (await request({"op": "submit", "table": table, "input": "dance"}))["ok"] is False
+        wrong_type = await request({"op": "submit", "table": table, "input": "action", "args": [1]})
+        assert wrong_type["ok"] is False
+        chosen = await request(
+            {"op": "submit", "table": table, "input": "action", "args": ["PLAY_PATH"]}
+        )
+        assert chosen["ok"] is True
+        wrong_type = await request(
+            {"op": "submit", "table": table, "input": "cards", "args": ["x"]}
+        )
+        assert wrong_type["ok"] is False
+        assert (await request({"op": "submit", "table": "404", "input": "cards"}))["ok"] is False
+        assert (await request([1, 2]))["ok"] is False
+
+        view = await request({"op": "view", "table": table, "seat": 1})
+        assert view["ok"] is True
+        assert view["view"]["player"] == "B"
+        assert len(view["view"]["hand"]) == 6
+        assert (await request({"op": "view", "table": table, "seat": 3}))["ok"] is False
+
+        stats = await request({"op": "stats"})
+        assert stats["tables"] == 1
+        assert stats["steps"] == 4
+        assert (await request({"op": "close", "table": table}))["ok"] is True
+
+        writer.close()
+        await writer.wait_closed()
+        listener.close()
+        await listener.wait_closed()
+        server.close()
+
+    asyncio.run(scenario())
+
+
+def test_server_watch() -> None:
+    """Test that the deltas of each step are pushed to the watchers of a table."""
+
+    async def scenario() -> None:
+        server = GameServer()
+        listener = await server.serve(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        player_reader, player_writer = await asyncio.open_connection("127.0.0.1", port)
+        watcher_reader, watcher_writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def request(reader: object, writer: object, data: object) -> dict:
+            writer.write(json.dumps(data).encode("utf-8") + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        table = (await request(player_reader, player_writer, {"op": "create"}))["table"]
+        watched = await request(watcher_reader, watcher_writer, {"op": "watch", "table": table})
+        assert watched["ok"] is True
+        names = {"op": "submit", "table": table, "input": "names", "args": [["A", "B", "C"]]}
+        await request(player_reader, player_writer, names)
+
+        pushed = json.loads(await watcher_reader.readline())
+        assert pushed["table"] == table
+        assert pushed["deltas"][0]["type"] == "RoundStarted"
+        drawn = [delta for delta in pushed["deltas"] if delta["type"] == "CardDrawn"]
+        assert len(drawn) == 18
+        assert all(delta["template_id"] is None for delta in drawn)
+
+        for writer in (player_writer, watcher_writer):
+            writer.close()
+            await writer.wait_closed()
+        listener.close()
+        await listener.wait_closed()
+        server.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,72 @@
+"""Tests for the simulation module."""
+
+from pathlib import Path
+
+from src.core.columnar import ColumnarReader, ColumnarWriter
+from src.core.policies import greedy_policy, random_policy
+from src.core.simulation import iter_simulate, play_game, simulate
+
+PLAYER_NAMES = ["Alice", "Bob", "Charlie", "Dave"]
+
+
+class _DatasetPerWorker:
+    """A picklable telemetry factory, writing a columnar dataset per worker."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def __call__(self, worker_index: int) -> ColumnarWriter:
+        return ColumnarWriter(self.directory / f"worker-{worker_index}")
+
+
+def test_play_game() -> None:
+    """Test that a game is played to completion and reproducible from its seed."""
+    result = play_game(PLAYER_NAMES, [greedy_policy] * 4, seed=11)
+    assert result.turns == result.cards_placed + result.cards_discarded + result.actions_played
+    assert result.winning_teams
+    assert "Profiteur" in result.winning_teams
+    assert play_game(PLAYER_NAMES, [greedy_policy] * 4, seed=11) == result
+
+
+def test_iter_simulate_does_not_depend_on_workers() -> None:
+    """Test that the results only depend on the seed of the simulation."""
+    in_process = list(iter_simulate(6, PLAYER_NAMES, random_policy, seed=3, batch_size=4))
+    in_workers = list(
+        iter_simulate(6, PLAYER_NAMES, random_policy, seed=3, workers=2, batch_size=4)
+    )
+    assert [result.index for result in in_process] == list(range(6))
+    assert in_process == in_workers
+
+
+def test_simulate() -> None:
+    """Test that the report aggregates the streamed results."""
+    results = []
+    report = simulate(
+        5, PLAYER_NAMES, [greedy_policy, random_policy] * 2, seed=8, on_result=results.append
+    )
+    assert report.games == len(results) == 5
+    assert report.wins_by_team["Profiteur"] == 5
+    assert report.games_per_second > 0
+
+
+def test_simulate_writes_a_dataset_per_worker(tmp_path: Path) -> None:
+    """Test that the turns of the games played by each worker are written to its dataset."""
+    for workers in (1, 2):
+        directory = tmp_path / str(workers)
+        results = []
+        simulate(
+            6,
+            PLAYER_NAMES,
+            random_policy,
+            seed=4,
+            workers=workers,
+            on_result=results.append,
+            telemetry_factory=_DatasetPerWorker(directory),
+        )
+        datasets = sorted(directory.iterdir())
+        assert 1 <= len(datasets) <= workers
+        rows = 0
+        for dataset in datasets:
+            with ColumnarReader(dataset) as reader:
+                rows += len(reader)
+        assert rows == sum(result.turns for result in results)
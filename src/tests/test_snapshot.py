@@ -0,0 +1,106 @@
+"""Tests for the snapshot module."""
+
+from pytest import raises
+
+from src.core.game import Game
+from src.core.player import Player
+from src.core.policies import greedy_policy, play_move
+from src.core.round import MAX_SEED, Round
+from src.core.snapshot import dump_game, dump_game_json, load_game, load_game_json
+
+
+def _game_in_progress(turns: int = 10) -> Game:
+    """Returns a game whose round has been played for a few turns."""
+    game = Game(seed=5)
+    game.players.extend(Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie"))
+    game_round = game.start_round()
+    for _ in range(turns):
+        play_move(game_round, greedy_policy(game_round))
+    game.players[0].scores.append(3)
+    return game
+
+
+def _play_to_end(game: Game) -> list[str]:
+    """Plays the current round to its end and returns the names of the cards played."""
+    game_round = game.current_round
+    played = []
+    while not game_round.is_over:
+        move = greedy_policy(game_round)
+        played.append(move.card.name)
+        play_move(game_round, move)
+    return played
+
+
+def test_binary_snapshot_round_trip() -> None:
+    """Test that a restored game has the same state and gives the same snapshot."""
+    game = _game_in_progress()
+    snapshot = dump_game(game)
+    restored = load_game(snapshot)
+    assert restored.to_state() == game.to_state()
+    assert dump_game(restored) == snapshot
+    assert restored.current_round.players is restored.players
+    assert restored.players[0].scores == [3]
+    assert restored.players[1].role == game.players[1].role
+
+
+def test_json_snapshot_round_trip() -> None:
+    """Test that the JSON snapshot restores the same state as the binary one."""
+    game = _game_in_progress()
+    restored = load_game_json(dump_game_json(game))
+    assert restored.to_state() == game.to_state()
+    assert dump_game(restored) == dump_game(game)
+
+
+def test_snapshot_restores_board_connectivity() -> None:
+    """Test that the connectivity of the board is rebuilt on restore."""
+    game = _game_in_progress()
+    board = game.current_round.board
+    restored_board = load_game(dump_game(game)).current_round.board
+    assert restored_board.open_ends == board.open_ends
+    assert restored_board.reached_goals == board.reached_goals
+    assert (restored_board.rows, restored_board.columns) == (board.rows, board.columns)
+
+
+def test_restored_game_plays_identically() -> None:
+    """Test that a restored game continues exactly like the original one."""
+    game = _game_in_progress()
+    restored = load_game(dump_game(game))
+    assert _play_to_end(restored) == _play_to_end(game)
+    assert restored.current_round.winning_teams == game.current_round.winning_teams
+    assert restored.start_round().seed == game.start_round().seed
+
+
+def test_snapshots_are_hashable() -> None:
+    """Test that games in the same state give equal, hashable snapshots."""
+    snapshots = {dump_game(_game_in_progress()), dump_game(_game_in_progress())}
+    assert len(snapshots) == 1
+    assert dump_game(_game_in_progress(turns=11)) not in snapshots
+
+
+def test_snapshot_without_round() -> None:
+    """Test the snapshot of a game which has not started any round."""
+    game = Game(seed=3)
+    restored = load_game(dump_game(game))
+    assert restored.current_round is None
+    assert restored.state == game.state
+    assert restored.seed == 3
+
+
+def test_snapshot_seed_bounds() -> None:
+    """Test that the seeds of every game fit in a snapshot, seeds out of range being
+    rejected when the game or round is created."""
+    game = Game(seed=MAX_SEED)
+    assert load_game(dump_game(game)).seed == MAX_SEED
+    for seed in (-1, MAX_SEED + 1):
+        with raises(ValueError, match="seed"):
+            Game(seed=seed)
+        with raises(ValueError, match="seed"):
+            Round([Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")], seed)
+
+
+def test_invalid_snapshot() -> None:
+    """Test that data which is not a snapshot is rejected."""
+    with raises(ValueError, match="snapshot"):
+        load_game(b"not a snapshot")
+    with raises(ValueError, match="snapshot"):
+        load_game_json('{"version": 0}')
@@ -0,0 +1,85 @@
+"""Tests for the telemetry of the rounds."""
+
+from pathlib import Path
+
+from src.core.policies import greedy_policy
+from src.core.simulation import play_game
+from src.core.telemetry import (
+    CardPlayed,
+    CardWinRates,
+    RoundBegan,
+    RoundEnded,
+    TelemetryWriter,
+    iter_records,
+)
+
+PLAYER_NAMES = ["Alice", "Bob", "Charlie", "Dave"]
+
+
+def test_round_events() -> None:
+    """Test that a round records its deal, each card played and its outcome, and that the
+    copies of the round record nothing."""
+    events = []
+    result = play_game(PLAYER_NAMES, [greedy_policy] * 4, seed=11, telemetry=events.append)
+    assert isinstance(events[0], RoundBegan)
+    assert len(events[0].teams) == 4
+    assert isinstance(events[-1], RoundEnded)
+    assert events[-1].winning_teams == tuple(sorted(result.winning_teams))
+    plays = [event for event in events if isinstance(event, CardPlayed)]
+    assert len(plays) == result.turns
+    assert [play.turn for play in plays] == list(range(result.turns))
+    assert sum(play.action == "path" for play in plays) == result.cards_placed
+    assert all(play.board_rows >= 5 for play in plays)
+    assert play_game(PLAYER_NAMES, [greedy_policy] * 4, seed=11) == result
+
+
+def test_writer_rotates_batches(tmp_path: Path) -> None:
+    """Test that the records are written in batches to files rotated by size, read back in
+    order without an incomplete last line, and that stray files are not numbered."""
+    with TelemetryWriter(tmp_path, batch_size=3, max_bytes=30) as writer:
+        for index in range(10):
+            writer.write({"index": index})
+        assert len(writer.paths) == 3
+    assert writer.records == 10
+    assert len(writer.paths) == 4
+    assert [record["index"] for record in iter_records(writer.paths)] == list(range(10))
+
+    with writer.paths[-1].open("a", encoding="utf-8") as file:
+        file.write('{"index":')
+    assert len(list(iter_records(writer.paths))) == 10
+    assert TelemetryWriter(tmp_path).paths == writer.paths  # no file is created before a write
+    assert all(path.stat().st_size >= 30 for path in writer.paths[:3])
+
+    (tmp_path / "telemetry-1-old.ndjson").write_text("", encoding="utf-8")
+    with TelemetryWriter(tmp_path) as writer:
+        writer.write({"index": 10})
+    assert (tmp_path / "telemetry-00004.ndjson").exists()
+
+
+def test_card_win_rates(tmp_path: Path) -> None:
+    """Test that the win rates are streamed from the files of several games."""
+    with TelemetryWriter(tmp_path, batch_size=16) as writer:
+        results = [
+            play_game(PLAYER_NAMES, [greedy_policy] * 4, seed, telemetry=writer)
+            for seed in range(3)
+        ]
+    win_rates = CardWinRates()
+    win_rates.add_files(writer.paths)
+    table = win_rates.table()
+    assert win_rates.rounds == 3
+    assert sum(stats.plays for stats in table.values()) == sum(
+        result.cards_placed + result.actions_played for result in results
+    )
+    assert all(0 <= stats.win_rate <= 1 for stats in table.values())
+
+    win_rates = CardWinRates()
+    win_rates.add(
+        {"type": "CardPlayed", "round_seed": 1, "action": "path", "card": "RL+", "seat": 0}
+    )
+    win_rates.add(
+        {"type": "CardPlayed", "round_seed": 1, "action": "path", "card": "RL+", "seat": 1}
+    )
+    win_rates.add(
+        {"type": "RoundEnded", "round_seed": 1, "winning_teams": ["Blue"], "teams": ["Blue", "Red"]}
+    )
+    assert win_rates.table()["RL+"].win_rate == 0.5
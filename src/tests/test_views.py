@@ -0,0 +1,109 @@
+"""Tests for the views module."""
+
+import json
+
+from pytest import raises
+
+from src.core.cards.card_template import get_template
+from src.core.game import Game
+from src.core.inputs import TurnAction
+from src.core.player import Player
+from src.core.views import CellView
+
+
+def _named_game() -> Game:
+    """Returns a game whose first round has started."""
+    game = Game(seed=2)
+    game.name_players(["Alice", "Bob", "Charlie"])
+    return game
+
+
+def test_view_hides_other_players_cards() -> None:
+    """Test that a view shows the hand of its player and only the hand sizes of the others."""
+    game = _named_game()
+    alice, bob, _ = game.players
+    view = game.view_for(bob)
+    assert view.player_name == "Bob"
+    assert view.seat == 1
+    assert view.role is bob.role
+    assert view.hand == tuple(get_template(card.name).template_id for card in bob.hand)
+    assert view.hand_sizes == (6, 6, 6)
+    assert view.current_seat == 0
+    assert view.state == "CHOSE_ACTION"
+    assert view.board_size == (5, 7)
+    assert game.view_for(alice).hand != view.hand
+    assert game.view_for(bob) is view
+
+
+def test_view_masks_hidden_goals() -> None:
+    """Test that goal cards are face down until revealed, or seen by the player."""
+    game = _named_game()
+    alice, bob, _ = game.players
+    hidden_goal = get_template("GOAL").template_id
+    goals = [cell for cell in game.view_for(alice).board if cell.column == 6]
+    assert goals == [CellView(row, 6, hidden_goal, flipped=False) for row in (0, 2, 4)]
+
+    game.current_round.show_goal(alice, 2, 6)
+    goal_name = game.current_round.board.get_card(2, 6).read_real_name()
+    assert game.view_for(alice).known_goals == {(2, 6): get_template(goal_name).template_id}
+    assert game.view_for(bob).known_goals == {}
+
+    game.current_round.board.reveal_goal(2, 6)
+    revealed = next(cell for cell in game.view_for(bob).board if cell[:2] == (2, 6))
+    assert revealed.template_id == get_template(goal_name).template_id
+    assert game.view_for(alice).known_goals == {}
+
+
+def test_view_cache_invalidation() -> None:
+    """Test that the parts of the views are rebuilt only when they change."""
+    game = _named_game()
+    alice, bob, _ = game.players
+    board = game.view_for(alice).board
+    assert game.view_for(bob).board is board
+    bob_hand = game.view_for(bob).hand
+
+    game.choose_action(TurnAction.DISCARD)
+    game.choose_cards(0)
+    assert game.view_for(bob).board is board
+    assert game.view_for(bob).hand is bob_hand
+    assert game.view_for(alice).hand == tuple(
+        get_template(card.name).template_id for card in alice.hand
+    )
+
+    player = game.current_round.current_player
+    card, row, column, flipped = game.current_round.board.legal_moves(player.hand)[0]
+    game.choose_action(TurnAction.PLAY_PATH)
+    game.choose_cards(player.hand.index(card), row, column, flipped=flipped)
+    assert game.view_for(alice).board is not board
+    assert len(game.view_for(alice).board) == len(board) + 1
+
+
+def test_view_follows_a_new_round() -> None:
+    """Test that the views show the board and hands of a new round once it starts."""
+    game = _named_game()
+    alice = game.players[0]
+    view = game.view_for(alice)
+    board = view.board
+    hand = view.hand
+    game.start_round()
+    assert game.view_for(alice).board is not board
+    assert game.view_for(alice).hand is not hand
+    assert game.view_for(alice).hand == tuple(
+        get_template(card.name).template_id for card in alice.hand
+    )
+
+
+def test_view_for_unknown_player() -> None:
+    """Test that only the players of the game have a view."""
+    game = _named_game()
+    with raises(ValueError, match="not a player"):
+        game.view_for(Player("Eve", None, [], []))
+
+
+def test_view_to_dict() -> None:
+    """Test that a view is converted to JSON serializable data."""
+    game = _named_game()
+    data = game.view_for(game.players[0]).to_dict()
+    assert json.loads(json.dumps(data)) == data
+    assert data["player"] == "Alice"
+    assert data["deck_size"] == game.current_round.deck_size
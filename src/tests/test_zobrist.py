@@ -0,0 +1,85 @@
+"""Tests for the Zobrist hashes of the boards, decks, players and rounds."""
+
+from src.core.board import Board
+from src.core.cards.card_template import get_template
+from src.core.cards.deck import Deck
+from src.core.player import Player
+from src.core.round import Round
+
+
+def test_board_zobrist_follows_the_position() -> None:
+    """Test that the hash of a board depends on its cards only, not on the order of the
+    moves, and is restored when the moves are undone."""
+    first = Board()
+    second = first.copy()  # same goal cards
+    assert second.zobrist == first.zobrist
+
+    first.place_card(2, 1, get_template("RL+").create())
+    first.place_card(2, 2, get_template("RL+").create())
+    second.place_card(2, 1, get_template("RL+").create())
+    second.place_card(2, 2, get_template("UR+").create())
+    assert first.zobrist != second.zobrist
+    second.remove_card(2, 2)
+    second.place_card(2, 2, get_template("RL+").create())
+    assert first.zobrist == second.zobrist
+    assert Board.from_state(first.to_state()).zobrist == first.zobrist
+    assert first.copy().zobrist == first.zobrist
+
+    position = first.zobrist
+    first.push_move(2, 3, get_template("UR+").create(), flipped=True)
+    first.push_move(2, 1, None)
+    assert first.zobrist != position
+    first.pop_move()
+    first.pop_move()
+    assert first.zobrist == position
+
+    first.place_card(2, -1, get_template("RL+").create())
+    expanded = first.zobrist
+    assert expanded != position
+    assert first.remove_card(2, 0)[0] is True  # the start card moved to (2, 1)
+    assert first.zobrist not in (position, expanded)  # the bounds stay expanded
+
+
+def test_board_zobrist_changes_when_a_goal_is_revealed() -> None:
+    """Test that revealing a goal card changes the hash of the board."""
+    board = Board()
+    for column in range(1, 6):
+        board.place_card(2, column, get_template("RL+").create())
+    hidden = board.zobrist
+    board.reveal_goal(2, 6)
+    assert board.zobrist != hidden
+    assert Board.from_state(board.to_state()).zobrist == board.zobrist
+
+
+def test_deck_and_player_zobrist() -> None:
+    """Test that the hash of a deck depends on its remaining cards, and the hash of a hand
+    does not depend on the order of its cards."""
+    deck = Deck([3, 5, 8, 8])
+    deck.draw()
+    assert deck.zobrist == Deck([3, 5, 8]).zobrist
+    assert deck.copy().zobrist == deck.zobrist
+    assert Deck([5, 3, 8]).zobrist != deck.zobrist
+
+    straight, turn = get_template("RL+").create(), get_template("UR+").create()
+    first = Player("Alice", None, [straight, turn], [])
+    second = Player("Alice", None, [], [])
+    second.draw(turn)
+    second.draw(straight)
+    assert first.hand_zobrist == second.hand_zobrist
+    assert hash(first) == hash(second)
+    second.draw(get_template("RL+").create())
+    second.discard(straight)
+    assert first.hand_zobrist == second.hand_zobrist
+    second.empty_hand()
+    assert second.hand_zobrist == 0
+
+
+def test_round_zobrist() -> None:
+    """Test that the hash of a round is kept by copies and changed by moves."""
+    game_round = Round([Player(name, None, [], []) for name in ("Alice", "Bob", "Charlie")], 4)
+    position = game_round.zobrist
+    assert game_round.copy().zobrist == position
+
+    card, row, column, flipped = game_round.board.legal_moves(game_round.current_player.hand)[0]
+    game_round.play_path_card(card, row, column, flipped=flipped)
+    assert game_round.zobrist != position